@@ -10,10 +10,19 @@ import os
 from pathlib import Path
 import pickle
 import io
+import zipfile
 from resume_parser import ResumeParser
 from job_parser import JobDescriptionParser
 from matcher import CandidateRanker
-from utils import extract_from_file, is_resume, is_job_description, validate_text
+from parse_cache import ParseCache, TextCache
+from candidate_store import CandidateStore
+from parallel_ingest import (
+    ParallelIngestor, IsolatedExtractor, extract_document, iter_zip_documents, count_zip_documents
+)
+from pipeline import ScreeningPipeline
+from model_service import get_model_service
+import asyncio
+from utils import is_resume, is_job_description, validate_text, iter_csv_batches, get_file_size_mb
 import plotly.graph_objects as go
 import plotly.express as px
 
@@ -71,8 +80,49 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ============ SESSION STATE INITIALIZATION ============
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_DIR = PROJECT_ROOT / ".cache"
+STORE_DIR = PROJECT_ROOT / "candidate_store"
+# Limits for one file in an isolated extraction worker
+EXTRACT_TIMEOUT_SECONDS = 30
+EXTRACT_MEMORY_MB = 1024
+
+
+@st.cache_resource
+def get_parse_cache():
+    """Parse cache shared by every session of this server process."""
+    return ParseCache(max_entries=20000, cache_dir=CACHE_DIR)
+
+
+@st.cache_resource
+def get_text_cache():
+    """Extracted-text cache, so reruns and re-uploads skip PDF/DOCX decoding."""
+    return TextCache(max_bytes=128 * 1024 * 1024, cache_dir=CACHE_DIR)
+
+
+@st.cache_resource
+def open_candidate_store(path, modified):
+    """Memory-map a candidate store; reopened whenever its metadata changes."""
+    return CandidateStore(path)
+
+
+@st.cache_resource
+def get_ingestor():
+    """Warm worker pool for batch uploads, kept alive across reruns and resized in place."""
+    return ParallelIngestor(workers=1, parser=st.session_state.parser)
+
+
+@st.cache_resource
+def get_isolated_extractor():
+    """
+    Sandboxed extraction workers; a hung or oversized file is killed, not waited on.
+    Shared by single uploads and batches, which resize it to their worker count.
+    """
+    return IsolatedExtractor(workers=1, timeout=EXTRACT_TIMEOUT_SECONDS, memory_limit_mb=EXTRACT_MEMORY_MB)
+
+
 if 'parser' not in st.session_state:
-    st.session_state.parser = ResumeParser()
+    st.session_state.parser = ResumeParser(cache=get_parse_cache())
     st.session_state.job_parser = JobDescriptionParser()
     st.session_state.ranker = CandidateRanker()
     st.session_state.results = []
@@ -156,24 +206,10 @@ def render_tag(label):
 
 def extract_file_content(uploaded_file):
     """Extract text content from uploaded file."""
-    try:
-        file_extension = Path(uploaded_file.name).suffix.lower()
-        
-        if file_extension == '.pdf':
-            text = extract_from_file(uploaded_file, 'pdf')
-        elif file_extension == '.docx':
-            text = extract_from_file(uploaded_file, 'docx')
-        elif file_extension == '.txt':
-            text = extract_from_file(uploaded_file, 'txt')
-        else:
-            return None, f"Unsupported file type: {file_extension}"
-        
-        if not text or len(text) < 100:
-            return None, "File contains too little text"
-        
-        return text, None
-    except Exception as e:
-        return None, f"Error reading file: {str(e)}"
+    return extract_document(
+        uploaded_file.name, uploaded_file.getvalue(),
+        cache=get_text_cache(), extractor=get_isolated_extractor()
+    )
 
 
 # ============ HEADER ============
@@ -309,12 +345,13 @@ with tab1:
                     # Parse resume
                     resume_data = st.session_state.parser.parse_resume(resume_text)
                     
-                    # Parse job description
-                    job_data = st.session_state.job_parser.parse(job_text)
+                    # Parse job description once and reuse it for ranking
+                    job_profile = st.session_state.job_parser.compile(job_text)
+                    job_data = job_profile.to_dict()
                     
                     # Rank candidate
                     ranked_results = st.session_state.ranker.rank_candidates(
-                        [resume_data], job_text
+                        [resume_data], job_profile
                     )
                     
                     if ranked_results:
@@ -481,34 +518,65 @@ with tab2:
     
     with col1:
         st.subheader("📂 Upload Multiple Resumes")
-        st.markdown("Upload resume files (PDF, DOCX, TXT) or a CSV with resume text")
+        st.markdown("Upload resume files (PDF, DOCX, TXT) or zip archives of them, a CSV with resume text, or use a pre-built candidate store")
         
         upload_type = st.radio(
             "Upload method:",
-            ["Individual Files", "CSV File"],
+            ["Individual Files", "CSV File", "Candidate Store"],
             key="batch_upload_type"
         )
         
         uploaded_files = []
-        batch_df = None
+        csv_file = None
+        candidate_store = None
         
         if upload_type == "Individual Files":
             uploaded_files = st.file_uploader(
-                "Drag and drop or select multiple resume files",
-                type=['pdf', 'docx', 'txt'],
+                "Drag and drop or select multiple resume files or zip archives",
+                type=['pdf', 'docx', 'txt', 'zip'],
                 accept_multiple_files=True,
                 key="batch_files"
             )
             if uploaded_files:
-                st.success(f"✓ Loaded {len(uploaded_files)} resume files")
-        else:
+                # Archives are only listed here; members are decompressed during processing
+                expected_documents = sum(
+                    count_zip_documents(f) if f.name.lower().endswith(".zip") else 1
+                    for f in uploaded_files
+                )
+                st.success(f"✓ Loaded {expected_documents} resume files")
+            ingest_workers = st.number_input(
+                "Parallel workers",
+                min_value=1, max_value=64, value=os.cpu_count() or 1,
+                help="Processes used to extract and parse files; 1 runs in the app process",
+                key="ingest_workers"
+            )
+            isolate_extraction = st.checkbox(
+                "Isolate extraction",
+                value=True,
+                help=f"Extract each file in a sandboxed worker limited to {EXTRACT_TIMEOUT_SECONDS}s "
+                     f"and {EXTRACT_MEMORY_MB} MB; files over either limit are skipped",
+                key="isolate_extraction"
+            )
+        elif upload_type == "CSV File":
             csv_file = st.file_uploader("Upload CSV (with 'Resume' column)", type=['csv'], key="batch_csv")
             if csv_file:
+                # The CSV is streamed in chunks during processing, never loaded whole
+                st.success(f"✓ Uploaded {csv_file.name} ({get_file_size_mb(csv_file):.1f} MB)")
+        
+        if upload_type == "Candidate Store":
+            store_path = st.text_input("Store directory", value=str(STORE_DIR), key="batch_store_path")
+            st.caption("Build one with: python app/ingest.py data/resumes.csv candidate_store")
+            meta_file = Path(store_path) / "meta.json"
+            if meta_file.exists():
                 try:
-                    batch_df = pd.read_csv(csv_file)
-                    st.success(f"✓ Loaded {len(batch_df)} resumes from CSV")
+                    candidate_store = open_candidate_store(store_path, meta_file.stat().st_mtime)
+                    st.success(f"✓ Loaded {len(candidate_store)} pre-parsed candidates")
+                    if candidate_store.stale:
+                        st.warning("⚠️ Store was built with an older skill taxonomy; re-run the ingest command")
                 except Exception as e:
-                    st.error(f"Error reading CSV: {str(e)}")
+                    st.error(f"Error opening candidate store: {str(e)}")
+            else:
+                st.info("No candidate store found at this path")
     
     with col2:
         st.subheader("💼 Job Description")
@@ -523,7 +591,7 @@ with tab2:
     
     st.divider()
     
-    col_process, col_filter = st.columns([2, 1])
+    col_process, col_filter, col_top = st.columns([2, 1, 1])
     
     with col_process:
         process_btn = st.button("🚀 Analyze & Rank Candidates", use_container_width=True, type="primary")
@@ -531,71 +599,165 @@ with tab2:
     with col_filter:
         min_score = st.slider("Minimum Match Score", 0, 100, 40, key="min_score_slider")
     
+    with col_top:
+        top_k = st.number_input("Candidates to Show", min_value=1, max_value=1000, value=50, step=5, key="top_k_input")
+    
     if process_btn:
         if not batch_jd or len(batch_jd.strip()) < 100:
             st.error("❌ Please provide a valid job description (at least 100 characters)")
         elif upload_type == "Individual Files" and not uploaded_files:
             st.error("❌ Please upload at least one resume file")
-        elif upload_type == "CSV File" and batch_df is None:
+        elif upload_type == "CSV File" and csv_file is None:
             st.error("❌ Please upload a CSV file with resumes")
+        elif upload_type == "Candidate Store" and candidate_store is None:
+            st.error("❌ Please point to a valid candidate store")
         else:
             with st.spinner("⏳ Processing resumes and ranking candidates..."):
                 try:
-                    results = []
+                    parsed_resumes = []
+                    model_service = get_model_service()
                     
                     if upload_type == "Individual Files":
-                        for idx, uploaded_file in enumerate(uploaded_files):
-                            candidate_name = Path(uploaded_file.name).stem
-                            text, error = extract_file_content(uploaded_file)
-                            
-                            if error:
-                                st.warning(f"⚠️ Skipped {uploaded_file.name}: {error}")
+                        # Files stream through the extract -> parse pipeline on the warm
+                        # worker pool; a slow or bad file only holds up its own worker
+                        workers = int(ingest_workers)
+                        ingestor = get_ingestor()
+                        ingestor.resize(workers)
+                        if isolate_extraction:
+                            get_isolated_extractor().resize(workers)
+                        pipeline = ScreeningPipeline(
+                            parser=st.session_state.parser,
+                            extract_workers=workers, parse_workers=workers,
+                            ingestor=ingestor if workers > 1 else None,
+                            text_cache=get_text_cache(),
+                            extractor=get_isolated_extractor() if isolate_extraction else None,
+                            keep_text=True
+                        )
+                        skipped = []
+                        
+                        def iter_documents():
+                            for f in uploaded_files:
+                                if not f.name.lower().endswith(".zip"):
+                                    yield f.name, f.getvalue()
+                                    continue
+                                try:
+                                    yield from iter_zip_documents(f, skipped)
+                                except zipfile.BadZipFile:
+                                    skipped.append((f.name, "Not a valid zip archive"))
+                        
+                        documents = iter_documents()
+                        progress = st.progress(0.0, text="Extracting and parsing resumes...")
+                        
+                        async def collect_results():
+                            finished = []
+                            async for result in pipeline.stream(documents):
+                                finished.append(result)
+                                stages = pipeline.stats()
+                                progress.progress(
+                                    min(len(finished) / max(expected_documents, 1), 1.0),
+                                    text=f"Extracting and parsing resumes... "
+                                         f"(queued: extract {stages['extract']['queue_depth']}, "
+                                         f"parse {stages['parse']['queue_depth']})"
+                                )
+                            return finished
+                        
+                        # Results arrive in completion order; report them in upload order
+                        results = asyncio.run(collect_results())
+                        for name, reason in skipped:
+                            st.warning(f"⚠️ Skipped {name}: {reason}")
+                        texts = []
+                        for result in sorted(results, key=lambda r: r.index):
+                            if result.error:
+                                st.warning(f"⚠️ Skipped {result.name}: {result.error}")
                             else:
-                                resume_data = st.session_state.parser.parse_resume(text)
-                                ranked = st.session_state.ranker.rank_candidates([resume_data], batch_jd)
-                                
-                                if ranked:
-                                    result = ranked[0]
-                                    result['candidate_name'] = candidate_name
-                                    result['file_name'] = uploaded_file.name
-                                    results.append(result)
-                    else:
-                        for idx, row in batch_df.iterrows():
-                            resume_text = row.get('Resume', '')
-                            candidate_name = row.get('Candidate', f'Candidate {idx+1}')
-                            
-                            if resume_text and len(str(resume_text)) > 100:
-                                resume_data = st.session_state.parser.parse_resume(resume_text)
-                                ranked = st.session_state.ranker.rank_candidates([resume_data], batch_jd)
-                                
-                                if ranked:
-                                    result = ranked[0]
-                                    result['candidate_name'] = candidate_name
-                                    result['file_name'] = candidate_name
-                                    results.append(result)
+                                parsed_resumes.append(result.resume)
+                                texts.append(result.text)
+                        
+                        # One vectorizer pass and one decision_function call for the whole upload
+                        for resume_data, category in zip(parsed_resumes, model_service.predict_categories(texts)):
+                            resume_data['category'] = category
+                        del texts
+                        progress.empty()
+                    # Compile the job description once and score every candidate in one call
+                    job_profile = st.session_state.job_parser.compile(batch_jd)
                     
-                    if results:
-                        # Sort by overall score (descending)
-                        results_sorted = sorted(results, key=lambda x: x['overall_score'], reverse=True)
+                    if upload_type == "CSV File":
+                        # Chunks are parsed and scored as they are read; only score
+                        # columns and the running top-k outlive each chunk
+                        collector = st.session_state.ranker.top_k_collector(job_profile, int(top_k), min_score)
+                        chunk_scores = []
+                        row_offset = 0
+                        
+                        for batch in iter_csv_batches(csv_file, columns=("Resume", "Candidate")):
+                            chunk = []
+                            for idx, (resume_text, candidate_name) in enumerate(zip(batch["Resume"], batch["Candidate"]), row_offset):
+                                if resume_text and len(resume_text) > 100:
+                                    chunk.append((resume_text, candidate_name or f"Candidate {idx+1}"))
+                            row_offset += len(batch["Resume"])
+                            
+                            chunk_texts = [text for text, _ in chunk]
+                            chunk_resumes = st.session_state.parser.parse_batch(chunk_texts)
+                            chunk_categories = model_service.predict_categories(chunk_texts)
+                            for resume_data, (_, candidate_name), category in zip(chunk_resumes, chunk, chunk_categories):
+                                if resume_data:
+                                    resume_data['candidate_name'] = candidate_name
+                                    resume_data['file_name'] = candidate_name
+                                    resume_data['category'] = category
+                            
+                            scores = st.session_state.ranker.score_batch(chunk_resumes, job_profile)
+                            collector.push_scores(scores)
+                            chunk_scores.append(np.round(scores.overall, 2))
+                        
+                        overall = np.concatenate(chunk_scores) if chunk_scores else np.zeros(0)
+                        pool_size = scored = len(overall)
+                        results_filtered = collector.results()
+                    else:
+                        if candidate_store is not None:
+                            # A store is scored straight from its mapped columns; the skill
+                            # index skips candidates that cannot reach the threshold
+                            pool_size = len(candidate_store)
+                            scores = st.session_state.ranker.score_batch(
+                                candidate_store.matrix(), job_profile,
+                                min_score=min_score, index=candidate_store.index()
+                            )
+                        else:
+                            pool_size = len(parsed_resumes)
+                            scores = st.session_state.ranker.score_batch(parsed_resumes, job_profile)
                         
-                        # Filter by minimum score
-                        results_filtered = [r for r in results_sorted if r['overall_score'] >= min_score]
+                        # Only the top candidates above the threshold are materialized for display
+                        overall = np.round(scores.overall, 2)
+                        scored = len(scores)
+                        results_filtered = scores.materialize(scores.top_k(int(top_k), min_score))
+                    
+                    if pool_size:
+                        qualified = int(np.count_nonzero(overall >= min_score))
                         
-                        st.success(f"✓ Processed {len(results)} resumes | Showing {len(results_filtered)} above {min_score}% threshold")
+                        st.success(f"✓ Processed {pool_size} resumes ({scored} scored) | {qualified} above {min_score}% threshold | Showing top {len(results_filtered)}")
                         
                         st.divider()
                         
                         # SUMMARY METRICS
+                        # With skill-index pruning only candidates that could reach the
+                        # threshold are scored, so bands starting below it are partial
+                        pruned = scored < pool_size
+                        
+                        def band_label(label, low):
+                            return f"{label} among retrieved" if pruned and low < min_score else label
+                        
                         metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
                         with metric_col1:
-                            st.metric("Total Candidates", len(results))
+                            st.metric("Total Candidates", pool_size)
                         with metric_col2:
-                            st.metric("Qualified (80%+)", len([r for r in results if r['overall_score'] >= 80]))
+                            st.metric(band_label("Qualified (80%+)", 80), int(np.count_nonzero(overall >= 80)))
                         with metric_col3:
-                            st.metric("Good Fit (60-80%)", len([r for r in results if 60 <= r['overall_score'] < 80]))
+                            st.metric(band_label("Good Fit (60-80%)", 60), int(np.count_nonzero((overall >= 60) & (overall < 80))))
                         with metric_col4:
-                            best_score = max(results, key=lambda x: x['overall_score'])['overall_score']
-                            st.metric("Top Score", f"{best_score}%")
+                            best_score = float(overall.max()) if len(overall) else 0.0
+                            st.metric(band_label("Top Score", best_score), f"{best_score}%")
+                        if pruned:
+                            st.caption(f"Skill index retrieved {scored} of {pool_size} candidates "
+                                       f"({scored / pool_size:.1%}); candidates that cannot reach "
+                                       f"{min_score}% were not scored.")
                         
                         st.divider()
                         
@@ -610,6 +772,11 @@ with tab2:
                             'Experience': [f"{r['experience_score']:.1f}%" for r in results_filtered],
                             'Education': [f"{r['education_score']:.1f}%" for r in results_filtered],
                         })
+                        if any(r.get('category') for r in results_filtered):
+                            results_df.insert(2, 'Predicted Category', [r.get('category') or '' for r in results_filtered])
+                        elif not model_service.available:
+                            st.caption(f"Predicted categories unavailable ({model_service.error}). "
+                                       "Train the classifier with: python model/train_model.py")
                         
                         st.dataframe(results_df, use_container_width=True, hide_index=True)
                         
@@ -652,6 +819,10 @@ with tab2:
                                         st.text(f"☎️ {result['phone']}")
                                 
                                 with profile_col2:
+                                    if result.get('category'):
+                                        st.markdown("**Predicted Category:**")
+                                        st.text(result['category'])
+                                    
                                     st.markdown("**Experience:**")
                                     st.text(f"{result['experience_years']} years")
                                     
@@ -671,6 +842,7 @@ with tab2:
                         for r in results_filtered:
                             detailed_results.append({
                                 'Candidate': r['candidate_name'],
+                                'Predicted_Category': r.get('category', ''),
                                 'Overall_Score': round(r['overall_score'], 2),
                                 'Skills_Score': round(r['skills_score'], 2),
                                 'Experience_Score': round(r['experience_score'], 2),
@@ -772,6 +944,26 @@ with tab3:
         st.text(f"Job Parser: Initialized")
         st.text(f"Candidate Ranker: Initialized")
         
+        st.markdown("**Parse Cache:**")
+        cache_stats = st.session_state.parser.cache.stats()
+        st.text(f"Entries: {cache_stats['entries']} | Hit rate: {cache_stats['hit_rate']:.0%}")
+        st.text(f"Hits: {cache_stats['hits']} (disk: {cache_stats['disk_hits']}) | "
+                f"Misses: {cache_stats['misses']} | Evictions: {cache_stats['evictions']}")
+        
+        st.markdown("**Extracted Text Cache:**")
+        text_stats = get_text_cache().stats()
+        st.text(f"Entries: {text_stats['entries']} ({text_stats['bytes'] / 1024 / 1024:.1f} MB) | "
+                f"Hit rate: {text_stats['hit_rate']:.0%}")
+        st.text(f"Hits: {text_stats['hits']} (disk: {text_stats['disk_hits']}) | "
+                f"Misses: {text_stats['misses']} | Spilled: {text_stats['evictions']}")
+        
+        st.markdown("**Category Model:**")
+        model_service = get_model_service()
+        if model_service.available:
+            st.text(f"Loaded: {len(model_service.label_encoder.classes_)} categories")
+        else:
+            st.text(model_service.error)
+        
         st.markdown("**Skills Database:**")
         st.metric("Total Skills", len(st.session_state.parser.SKILL_LIST))
         
@@ -0,0 +1,248 @@
+"""
+Persistent columnar store of parsed resumes.
+A corpus is parsed once into NumPy columns on disk; later screens
+memory-map the columns and score them against any job description
+without re-parsing a single resume.
+
+Store directory layout:
+    meta.json               row count, versions and skill vocabulary
+    skill_bits.npy          (N, n_bytes) packed uint8 skill matrix
+    experience.npy          (N,) float64 years of experience
+    education.npy           (N,) int8 highest education rank
+    <field>_blob.npy        UTF-8 bytes of each string column
+    <field>_offsets.npy     (N + 1,) int64 row offsets into the blob
+    text_blob.npy           zlib-compressed resume text, one frame per row
+    index_*.npy             inverted skill index (see skill_index.SkillIndex)
+"""
+
+import json
+import zlib
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+from taxonomy import DEFAULT_TAXONOMY
+from vector_scoring import SkillVocabulary, CandidateMatrix, education_ordinal
+from skill_index import SkillIndex
+
+STORE_VERSION = 1
+
+# String columns kept per candidate; list fields are joined with newlines
+STRING_FIELDS = ("candidate_name", "file_name", "email", "phone", "education", "certifications")
+_LIST_FIELDS = ("education", "certifications")
+
+
+class _Blob:
+    """Append-only byte column with row offsets."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+
+    def append(self, value):
+        self.data += value
+        self.offsets.append(len(self.data))
+
+    def save(self, path, name):
+        np.save(path / f"{name}_blob.npy", np.frombuffer(bytes(self.data), dtype=np.uint8))
+        np.save(path / f"{name}_offsets.npy", np.frombuffer(self.offsets, dtype=np.int64))
+
+
+class CandidateStoreWriter:
+    """
+    Builds a candidate store row by row.
+    Rows are held as compact columns, never as resume dictionaries, so
+    very large corpora can be ingested in one pass.
+
+    Args:
+        path: Store directory (created if missing)
+        taxonomy: SkillTaxonomy whose IDs become skill bit positions
+        keep_text: Also store the compressed resume text
+    """
+
+    def __init__(self, path, taxonomy=DEFAULT_TAXONOMY, keep_text=True):
+        self.path = Path(path)
+        self.taxonomy = taxonomy
+        self.vocabulary = SkillVocabulary.from_taxonomy(taxonomy)
+        self.keep_text = keep_text
+        self._skill_bits = bytearray()
+        self._experience = array("d")
+        self._education = array("b")
+        self._strings = {field: _Blob() for field in STRING_FIELDS}
+        self._text = _Blob()
+
+    def __len__(self):
+        return len(self._experience)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+    def add(self, resume, text=None):
+        """
+        Append one parsed resume.
+
+        Args:
+            resume: Resume dictionary (output from ResumeParser)
+            text: Optional full resume text to keep alongside the row
+        """
+        skill_ids = resume.get("skill_ids")
+        if skill_ids is None:
+            skill_ids = self.taxonomy.encode(resume.get("skills", []))
+        row = np.zeros(self.vocabulary.n_bytes * 8, dtype=bool)
+        row[list(skill_ids)] = True
+        self._skill_bits += np.packbits(row).tobytes()
+
+        self._experience.append(float(resume.get("total_experience_years", 0) or 0))
+        self._education.append(education_ordinal(resume.get("education")))
+
+        for field in STRING_FIELDS:
+            value = resume.get(field) or ""
+            if field in _LIST_FIELDS:
+                value = "\n".join(value)
+            self._strings[field].append(str(value).encode("utf-8"))
+
+        if self.keep_text:
+            text = text if text is not None else resume.get("raw_text", "")
+            self._text.append(zlib.compress(text.encode("utf-8"), 6))
+
+    def close(self):
+        """Write every column and the metadata file."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        n = len(self)
+
+        skill_bits = np.frombuffer(bytes(self._skill_bits), dtype=np.uint8)
+        matrix = CandidateMatrix(
+            self.vocabulary,
+            skill_bits.reshape(n, self.vocabulary.n_bytes),
+            np.frombuffer(self._experience, dtype=np.float64),
+            np.frombuffer(self._education, dtype=np.int8)
+        )
+        np.save(self.path / "skill_bits.npy", matrix.skill_bits)
+        np.save(self.path / "experience.npy", matrix.experience)
+        np.save(self.path / "education.npy", matrix.education)
+        SkillIndex.from_matrix(matrix).save(self.path)
+        for field, blob in self._strings.items():
+            blob.save(self.path, field)
+        if self.keep_text:
+            self._text.save(self.path, "text")
+
+        meta = {
+            "store_version": STORE_VERSION,
+            "taxonomy_version": self.taxonomy.version,
+            "rows": n,
+            "skills": list(self.vocabulary.skills),
+            "has_text": self.keep_text
+        }
+        with open(self.path / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+
+class StoredResumes:
+    """
+    Sequence view over a store that builds resume dictionaries on access.
+    Only rows that are actually materialized are ever decoded.
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def __len__(self):
+        return len(self.store)
+
+    def __getitem__(self, row):
+        return self.store.resume(row)
+
+
+class CandidateStore:
+    """
+    Read-only, memory-mapped view of a candidate store.
+
+    Args:
+        path: Store directory written by CandidateStoreWriter
+        mmap: Memory-map the columns instead of reading them into RAM
+    """
+
+    def __init__(self, path, mmap=True):
+        self.path = Path(path)
+        with open(self.path / "meta.json", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("store_version") != STORE_VERSION:
+            raise ValueError(f"Unsupported candidate store version: {self.meta.get('store_version')}")
+
+        self.mmap_mode = "r" if mmap else None
+        self.vocabulary = SkillVocabulary(self.meta["skills"])
+        self.skill_bits = self._load("skill_bits")
+        self.experience = self._load("experience")
+        self.education = self._load("education")
+        self._strings = {field: (self._load(f"{field}_blob"), self._load(f"{field}_offsets")) for field in STRING_FIELDS}
+        self._text = (self._load("text_blob"), self._load("text_offsets")) if self.meta.get("has_text") else None
+        self._index = None
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    def index(self):
+        """Inverted skill index of the store, built on first use if it was not saved."""
+        if self._index is None:
+            if (self.path / "index_offsets.npy").exists():
+                self._index = SkillIndex.load(self.path, len(self), mmap=self.mmap_mode is not None)
+            else:
+                self._index = SkillIndex.from_matrix(self.matrix())
+        return self._index
+
+    def _load(self, name):
+        """Load one column, memory-mapped if requested."""
+        return np.load(self.path / f"{name}.npy", mmap_mode=self.mmap_mode)
+
+    @property
+    def stale(self):
+        """True if the store was built with a different skill taxonomy."""
+        return self.meta.get("taxonomy_version") != DEFAULT_TAXONOMY.version
+
+    def matrix(self):
+        """CandidateMatrix over the mapped columns, ready for CandidateRanker.score_batch."""
+        return CandidateMatrix(
+            self.vocabulary, self.skill_bits, self.experience, self.education,
+            StoredResumes(self)
+        )
+
+    def string(self, field, row):
+        """Decoded value of a string column for one row."""
+        blob, offsets = self._strings[field]
+        return bytes(blob[offsets[row]:offsets[row + 1]]).decode("utf-8")
+
+    def text(self, row):
+        """Stored resume text for one row ("" if the store has no text)."""
+        if self._text is None:
+            return ""
+        blob, offsets = self._text
+        return zlib.decompress(bytes(blob[offsets[row]:offsets[row + 1]])).decode("utf-8")
+
+    def resume(self, row):
+        """
+        Rebuild the resume dictionary for one row.
+
+        Returns:
+            Dictionary with the fields CandidateRanker needs to build a result
+        """
+        years = float(self.experience[row])
+        resume = {
+            "skills": self.vocabulary.decode(self.skill_bits[row]),
+            "total_experience_years": int(years) if years.is_integer() else years
+        }
+        for field in STRING_FIELDS:
+            value = self.string(field, row)
+            if field in _LIST_FIELDS:
+                resume[field] = value.split("\n") if value else []
+            else:
+                resume[field] = value or None
+        if not resume["candidate_name"]:
+            resume["candidate_name"] = f"Candidate {row + 1}"
+        if not resume["file_name"]:
+            resume["file_name"] = resume["candidate_name"]
+        return resume
@@ -0,0 +1,72 @@
+"""
+Fused single-scan resume extraction.
+Lowercases the document once and finds skills, degrees and certifications
+in one automaton pass. Experience is read from the same lowercase copy
+without a cleanResume pass; contact details come from the shared patterns.
+"""
+
+from array import array
+from skill_matcher import SkillMatcher
+from taxonomy import DEFAULT_TAXONOMY, DEGREE_KEYWORDS, CERTIFICATION_KEYWORDS
+from patterns import find_experience, find_contacts
+from records import ParsedResume
+
+_SKILL, _DEGREE, _CERT = 0, 1, 2
+
+
+class FusedResumeExtractor:
+    """
+    Extracts every ResumeParser field from one lowercase copy of the text.
+    """
+
+    def __init__(self, taxonomy=DEFAULT_TAXONOMY):
+        self.taxonomy = taxonomy
+
+        # One automaton for all keyword fields: skills honour word
+        # boundaries, degree/certification keywords keep substring semantics
+        matcher = SkillMatcher()
+        for form, skill_id in taxonomy.ids.items():
+            matcher.add(form, payload=(_SKILL, skill_id))
+        for degree in DEGREE_KEYWORDS:
+            matcher.add(degree, payload=(_DEGREE, degree), whole_word=False)
+        for cert in CERTIFICATION_KEYWORDS:
+            matcher.add(cert, payload=(_CERT, cert), whole_word=False)
+        self.matcher = matcher.build()
+
+        self._degree_order = {d: i for i, d in enumerate(DEGREE_KEYWORDS)}
+        self._cert_order = {c: i for i, c in enumerate(CERTIFICATION_KEYWORDS)}
+
+    def extract(self, text):
+        """
+        Extract structured fields from resume text.
+
+        Args:
+            text: Raw resume text
+
+        Returns:
+            ParsedResume with the same keys as ResumeParser.parse_resume
+        """
+        text_lower = text.lower()
+
+        skill_ids, degrees, certs = set(), set(), set()
+        for _, _, (kind, value) in self.matcher.iter_matches(text_lower):
+            if kind == _SKILL:
+                skill_ids.add(value)
+            elif kind == _DEGREE:
+                degrees.add(value)
+            else:
+                certs.add(value)
+
+        skill_ids = array("H", sorted(skill_ids))
+        email, phone = find_contacts(text)
+
+        return ParsedResume(
+            skill_ids=skill_ids,
+            total_experience_years=find_experience(text_lower),
+            email=email,
+            phone=phone,
+            education=sorted(degrees, key=self._degree_order.__getitem__),
+            certifications=sorted(certs, key=self._cert_order.__getitem__),
+            text=text,
+            taxonomy=self.taxonomy
+        )
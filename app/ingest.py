@@ -0,0 +1,91 @@
+"""
+Ingest a resume corpus into a persistent candidate store.
+
+Usage:
+    python app/ingest.py data/resumes.csv candidate_store
+    python app/ingest.py path/to/resume_folder candidate_store --no-text
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from resume_parser import ResumeParser
+from candidate_store import CandidateStoreWriter
+from utils import extract_from_file, iter_csv_batches, MAX_RESUME_CHARS
+
+RESUME_EXTENSIONS = (".pdf", ".docx", ".txt")
+
+
+def iter_csv(path, text_column="Resume", name_column="Candidate", chunksize=5000):
+    """
+    Yield (candidate_name, resume_text) pairs from a CSV file, chunk by chunk.
+
+    Args:
+        path: CSV file path
+        text_column: Column holding the resume text
+        name_column: Optional column holding the candidate name
+        chunksize: Rows read per chunk
+    """
+    row_number = 0
+    for batch in iter_csv_batches(path, columns=(text_column, name_column), batch_size=chunksize):
+        for text, name in zip(batch[text_column], batch[name_column]):
+            row_number += 1
+            yield str(name or f"Candidate {row_number}"), text if isinstance(text, str) else ""
+
+
+def iter_folder(path):
+    """Yield (candidate_name, resume_text) pairs for every resume file in a folder."""
+    for file_path in sorted(Path(path).rglob("*")):
+        if file_path.suffix.lower() in RESUME_EXTENSIONS:
+            yield file_path.stem, extract_from_file(str(file_path), max_chars=MAX_RESUME_CHARS)
+
+
+def ingest(source, store_path, keep_text=True, min_length=100, parser=None):
+    """
+    Parse every resume in source once and write a candidate store.
+
+    Args:
+        source: CSV file or folder of PDF/DOCX/TXT resumes
+        store_path: Output store directory
+        keep_text: Keep compressed resume text in the store
+        min_length: Skip resumes shorter than this many characters
+        parser: Optional ResumeParser to reuse
+
+    Returns:
+        Number of candidates written
+    """
+    parser = parser or ResumeParser()
+    source = Path(source)
+    rows = iter_folder(source) if source.is_dir() else iter_csv(source)
+
+    with CandidateStoreWriter(store_path, parser.taxonomy, keep_text=keep_text) as writer:
+        for name, text in rows:
+            if not text or len(text) <= min_length:
+                continue
+            resume = parser.parse_resume(text)
+            if not resume:
+                continue
+            resume["candidate_name"] = name
+            resume["file_name"] = name
+            writer.add(resume, text)
+        return len(writer)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Build a candidate store from a resume corpus")
+    arg_parser.add_argument("source", help="CSV file with a 'Resume' column, or a folder of resume files")
+    arg_parser.add_argument("store", help="Output store directory")
+    arg_parser.add_argument("--no-text", action="store_true", help="Do not keep resume text in the store")
+    args = arg_parser.parse_args()
+
+    start = time.perf_counter()
+    count = ingest(args.source, args.store, keep_text=not args.no_text)
+    print(f"✓ Ingested {count} candidates into {args.store} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,78 @@
-import re
+from array import array
 from utils import cleanResume
+from taxonomy import DEFAULT_TAXONOMY
+from patterns import find_experience
+
+# Education hierarchy used to compare degree levels (higher is more advanced)
+EDUCATION_LEVELS = {
+    "phd": 5,
+    "master's degree": 4,
+    "mba": 4,
+    "bachelor's degree": 3,
+    "associate degree": 2,
+    "diploma": 1,
+    "bootcamp/certification": 1
+}
+
+
+class JobProfile:
+    """
+    Compiled job description.
+    Holds the parsed requirements in the form the ranker consumes, so one
+    job description can be scored against many candidates without re-parsing.
+    Skills are resolved through the taxonomy, so aliases such as "k8s" score
+    as their canonical skill however the profile was built.
+    """
+
+    __slots__ = (
+        "skills", "skill_set", "skill_ids", "required_experience", "education_level",
+        "education_rank", "title", "raw_text", "text_length"
+    )
+
+    def __init__(self, skills=None, required_experience=0, education_level="",
+                 title="", raw_text="", text_length=0):
+        # Skills outside the taxonomy are kept as given
+        self.skills = list(dict.fromkeys(DEFAULT_TAXONOMY.canonical(s) or s for s in skills or []))
+        self.skill_set = frozenset(self.skills)
+        self.skill_ids = frozenset(DEFAULT_TAXONOMY.encode(self.skills))
+        self.required_experience = required_experience or 0
+        self.education_level = education_level or ""
+        self.education_rank = EDUCATION_LEVELS.get(self.education_level.lower(), 0)
+        self.title = title
+        self.raw_text = raw_text
+        self.text_length = text_length
+
+    @classmethod
+    def from_dict(cls, jd_data):
+        """Build a profile from the dictionary returned by JobDescriptionParser.parse."""
+        jd_data = jd_data or {}
+        return cls(
+            skills=jd_data.get("skills", []),
+            required_experience=jd_data.get("required_experience", 0),
+            education_level=jd_data.get("education_level", ""),
+            title=jd_data.get("title", ""),
+            raw_text=jd_data.get("raw_text", ""),
+            text_length=jd_data.get("text_length", 0)
+        )
+
+    def to_dict(self):
+        """Return the profile in the same shape as JobDescriptionParser.parse."""
+        return {
+            "skills": list(self.skills),
+            "skill_ids": array("H", sorted(self.skill_ids)),
+            "required_experience": self.required_experience,
+            "education_level": self.education_level,
+            "title": self.title,
+            "raw_text": self.raw_text,
+            "text_length": self.text_length
+        }
+
 
 class JobDescriptionParser:
     def __init__(self):
-        self.SKILL_LIST = [
-            "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "php", "go", "rust",
-            "machine learning", "ml", "deep learning", "ai", "artificial intelligence",
-            "sql", "mysql", "postgresql", "mongodb", "nosql", "cassandra", "hbase",
-            "aws", "azure", "gcp", "google cloud", "docker", "kubernetes", "k8s",
-            "react", "vue", "angular", "nodejs", "node.js", "express",
-            "tensorflow", "pytorch", "keras", "scikit-learn", "pandas", "numpy",
-            "html", "css", "bootstrap", "tailwind",
-            "git", "github", "gitlab", "bitbucket",
-            "jenkins", "ci/cd", "devops",
-            "api", "rest", "graphql",
-            "linux", "windows", "unix",
-            "excel", "tableau", "powerbi", "visualization",
-            "agile", "scrum", "jira",
-            "communication", "leadership", "teamwork",
-            "nlp", "computer vision", "opencv"
-        ]
+        # Canonical skills come from the shared taxonomy
+        self.taxonomy = DEFAULT_TAXONOMY
+        self.SKILL_LIST = self.taxonomy.names
 
     def parse(self, text):
         """
@@ -29,6 +82,7 @@ class JobDescriptionParser:
             if not text:
                 return {
                     "skills": [],
+                    "skill_ids": array("H"),
                     "required_experience": 0,
                     "education_level": "",
                     "title": "",
@@ -39,13 +93,15 @@ class JobDescriptionParser:
             text_clean = cleanResume(text_lower)
 
             # Extract information
-            skills = self._extract_required_skills(text_lower)
+            skill_ids = self.taxonomy.extract_ids(text_lower)
+            skills = self.taxonomy.decode(skill_ids)
             experience = self._extract_required_experience(text_clean)
             education = self._extract_education_requirement(text_lower)
             title = self._extract_job_title(text)
 
             return {
                 "skills": skills,
+                "skill_ids": skill_ids,
                 "required_experience": experience,
                 "education_level": education,
                 "title": title,
@@ -56,38 +112,33 @@ class JobDescriptionParser:
             print(f"Error parsing job description: {str(e)}")
             return {
                 "skills": [],
+                "skill_ids": array("H"),
                 "required_experience": 0,
                 "education_level": "",
                 "title": "",
                 "raw_text": text[:1000] if text else ""
             }
 
+    def compile(self, text):
+        """
+        Parse a job description once into a reusable JobProfile.
+
+        Args:
+            text: Job description text string
+
+        Returns:
+            JobProfile ready to be passed to CandidateRanker
+        """
+        return JobProfile.from_dict(self.parse(text))
+
     def _extract_required_skills(self, text):
         """Extract required skills from job description."""
-        skills = []
-        for skill in self.SKILL_LIST:
-            if skill in text:
-                skills.append(skill)
-        return list(set(skills))  # Remove duplicates
+        # Single pass over the text; aliases resolve to canonical names
+        return self.taxonomy.decode(self.taxonomy.extract_ids(text))
 
     def _extract_required_experience(self, text):
         """Extract required years of experience from job description."""
-        patterns = [
-            r'(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)',
-            r'(\d+)\+?\s+years',
-            r'(\d+)\+?\s+yrs'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    years = int(match.group(1))
-                    return min(years, 60)
-                except ValueError:
-                    continue
-        
-        return 0
+        return find_experience(text)
 
     def _extract_education_requirement(self, text):
         """Extract education requirement from job description."""
@@ -1,4 +1,9 @@
-from job_parser import JobDescriptionParser
+import heapq
+from job_parser import JobDescriptionParser, JobProfile, EDUCATION_LEVELS
+from vector_scoring import CandidateMatrix, SkillVocabulary, score_matrix
+from skill_index import min_skill_matches
+from records import ParsedResume, RankedCandidate
+from taxonomy import DEFAULT_TAXONOMY
 
 class CandidateRanker:
     """
@@ -8,27 +13,41 @@ class CandidateRanker:
 
     def __init__(self):
         self.job_parser = JobDescriptionParser()
+        self.vocabulary = SkillVocabulary.from_taxonomy(self.job_parser.taxonomy)
         self.skill_weight = 0.50
         self.experience_weight = 0.35
         self.education_weight = 0.15
 
+    def compile_job(self, job_description):
+        """
+        Normalize a job description into a JobProfile.
+
+        Args:
+            job_description: Job description text string, parsed dict or JobProfile
+
+        Returns:
+            JobProfile
+        """
+        if isinstance(job_description, JobProfile):
+            return job_description
+        if isinstance(job_description, str):
+            return self.job_parser.compile(job_description)
+        return JobProfile.from_dict(job_description)
+
     def rank_candidates(self, resumes, job_description):
         """
         Rank multiple candidates against a job description.
         
         Args:
             resumes: List of resume dictionaries (output from ResumeParser)
-            job_description: Job description text string or dict
+            job_description: Job description text string, dict or JobProfile
         
         Returns:
             List of ranked candidates with scores
         """
         try:
-            # Parse job description if it's a string
-            if isinstance(job_description, str):
-                jd_data = self.job_parser.parse(job_description)
-            else:
-                jd_data = job_description
+            # Compile the job description once for the whole candidate list
+            profile = self.compile_job(job_description)
 
             ranked = []
             
@@ -36,42 +55,7 @@ class CandidateRanker:
                 if not resume:
                     continue
 
-                # Calculate individual scores
-                skill_score = self._calculate_skill_score(resume.get("skills", []), jd_data.get("skills", []))
-                experience_score = self._calculate_experience_score(
-                    resume.get("total_experience_years", 0),
-                    jd_data.get("required_experience", 0)
-                )
-                education_score = self._calculate_education_score(
-                    resume.get("education", []),
-                    jd_data.get("education_level", "")
-                )
-
-                # Calculate weighted overall score
-                overall_score = (
-                    self.skill_weight * skill_score +
-                    self.experience_weight * experience_score +
-                    self.education_weight * education_score
-                )
-
-                matched_skills = list(set(resume.get("skills", [])) & set(jd_data.get("skills", [])))
-                missing_skills = list(set(jd_data.get("skills", [])) - set(resume.get("skills", [])))
-
-                ranked.append({
-                    "skills": resume.get("skills", []),
-                    "matched_skills": matched_skills,
-                    "missing_skills": missing_skills,
-                    "overall_score": round(overall_score, 2),
-                    "skills_score": round(skill_score, 2),
-                    "experience_score": round(experience_score, 2),
-                    "education_score": round(education_score, 2),
-                    "experience_years": resume.get("total_experience_years", 0),
-                    "education": resume.get("education", []),
-                    "certifications": resume.get("certifications", []),
-                    "email": resume.get("email"),
-                    "phone": resume.get("phone"),
-                    "match_percentage": round(overall_score, 2)
-                })
+                ranked.append(self._score_resume(resume, profile))
 
             # Sort by overall score
             ranked.sort(key=lambda x: x["overall_score"], reverse=True)
@@ -81,11 +65,145 @@ class CandidateRanker:
             print(f"Error ranking candidates: {str(e)}")
             return []
 
+    def score_batch(self, candidates, job_description, min_score=None, index=None):
+        """
+        Score a whole candidate pool with vectorized array operations.
+
+        Args:
+            candidates: CandidateMatrix or list of resume dictionaries
+            job_description: Job description text string, dict or JobProfile
+            min_score: Optional score floor; with an index, candidates that
+                cannot reach it are never scored
+            index: Optional SkillIndex over the candidate matrix
+
+        Returns:
+            BatchScores with per-candidate score arrays; result dictionaries
+            are only built for the rows passed to BatchScores.materialize
+        """
+        profile = self.compile_job(job_description)
+        if not isinstance(candidates, CandidateMatrix):
+            candidates = CandidateMatrix.from_resumes(candidates, self.vocabulary)
+        return score_matrix(
+            candidates, profile,
+            self.skill_weight, self.experience_weight, self.education_weight,
+            self._build_entry,
+            rows=self._retrieve(candidates, profile, min_score, index)
+        )
+
+    def _retrieve(self, matrix, profile, min_score, index):
+        """
+        Rows of an indexed matrix that could still reach min_score.
+
+        Returns:
+            Sorted row array, or None to score the whole matrix
+        """
+        if index is None or min_score is None:
+            return None
+        required = min_skill_matches(
+            len(profile.skill_set), min_score,
+            self.skill_weight, self.experience_weight + self.education_weight
+        )
+        if required <= 0:
+            return None
+        positions = [matrix.vocabulary.index.get(s) for s in profile.skill_set]
+        return index.candidates(positions, required)
+
+    def rank_candidates_batch(self, resumes, job_description):
+        """
+        Vectorized equivalent of rank_candidates for large candidate pools.
+
+        Args:
+            resumes: CandidateMatrix or list of resume dictionaries
+            job_description: Job description text string, dict or JobProfile
+
+        Returns:
+            List of ranked candidates with scores
+        """
+        try:
+            scores = self.score_batch(resumes, job_description)
+            return scores.materialize(scores.order())
+        except Exception as e:
+            print(f"Error ranking candidates: {str(e)}")
+            return []
+
+    def rank_top_k(self, candidates, job_description, k=10, min_score=0):
+        """
+        Return only the k best candidates scoring at least min_score.
+
+        Lists and CandidateMatrix inputs are scored in one vectorized pass and
+        selected with argpartition; any other iterable (e.g. a generator of
+        parsed resumes) is consumed as a stream into a bounded heap.
+
+        Args:
+            candidates: CandidateMatrix, list or iterable of resume dictionaries
+            job_description: Job description text string, dict or JobProfile
+            k: Number of candidates to keep
+            min_score: Minimum overall score to be included
+
+        Returns:
+            List of at most k ranked candidates, best first
+        """
+        try:
+            if isinstance(candidates, (list, tuple, CandidateMatrix)):
+                scores = self.score_batch(candidates, job_description)
+                return scores.materialize(scores.top_k(k, min_score))
+
+            collector = self.top_k_collector(job_description, k, min_score)
+            collector.extend(candidates)
+            return collector.results()
+        except Exception as e:
+            print(f"Error ranking candidates: {str(e)}")
+            return []
+
+    def top_k_collector(self, job_description, k=10, min_score=0):
+        """Create a TopKCollector for streaming resumes in as they arrive."""
+        return TopKCollector(self, self.compile_job(job_description), k, min_score)
+
     def rank_single_resume(self, resume, job_description):
         """Rank a single resume against a job description."""
         ranked = self.rank_candidates([resume], job_description)
         return ranked[0] if ranked else {}
 
+    def _score_resume(self, resume, profile):
+        """Score one parsed resume against a compiled JobProfile."""
+        return self._build_entry(resume, profile, *self._score_components(resume, profile))
+
+    def _score_components(self, resume, profile):
+        """Return (skill, experience, education, overall) scores for one resume."""
+        if profile.skill_set:
+            if isinstance(resume, ParsedResume) and resume.taxonomy is DEFAULT_TAXONOMY:
+                # Records hold taxonomy IDs only, so compare IDs and skip decoding names
+                matched_count = len(profile.skill_ids.intersection(resume.skill_ids))
+            else:
+                matched_count = len(profile.skill_set.intersection(resume.get("skills", [])))
+            skill_score = (matched_count / len(profile.skill_set)) * 100
+        else:
+            skill_score = 100.0
+        experience_score = self._calculate_experience_score(
+            resume.get("total_experience_years", 0),
+            profile.required_experience
+        )
+        education_score = self._calculate_education_level_score(
+            resume.get("education", []),
+            profile.education_rank
+        )
+
+        # Calculate weighted overall score
+        overall_score = (
+            self.skill_weight * skill_score +
+            self.experience_weight * experience_score +
+            self.education_weight * education_score
+        )
+
+        return skill_score, experience_score, education_score, overall_score
+
+    def _build_entry(self, resume, profile, skill_score, experience_score,
+                     education_score, overall_score):
+        """Build the ranked result record for one scored resume."""
+        return RankedCandidate.from_resume(
+            resume, profile, skill_score, experience_score, education_score, overall_score
+        )
+
     def _calculate_skill_score(self, resume_skills, jd_skills):
         """
         Calculate skill match score.
@@ -121,29 +239,118 @@ class CandidateRanker:
         if not resume_education:
             return 0.0
 
-        # Simple education hierarchy
-        education_levels = {
-            "phd": 5,
-            "master's degree": 4,
-            "mba": 4,
-            "bachelor's degree": 3,
-            "associate degree": 2,
-            "diploma": 1,
-            "bootcamp/certification": 1
-        }
+        required_level = EDUCATION_LEVELS.get(required_education.lower(), 0)
+        return self._calculate_education_level_score(resume_education, required_level)
 
-        required_level = education_levels.get(required_education.lower(), 0)
+    def _calculate_education_level_score(self, resume_education, required_level):
+        """
+        Calculate education score against a required level from EDUCATION_LEVELS.
+        """
+        if required_level == 0:
+            return 100.0
+
+        if not resume_education:
+            return 0.0
 
         resume_education_lower = [e.lower() for e in resume_education]
         max_resume_level = max(
-            [education_levels.get(e, 0) for e in resume_education_lower],
+            [EDUCATION_LEVELS.get(e, 0) for e in resume_education_lower],
             default=1
         )
 
-        if required_level == 0:
-            return 100.0
-
         if max_resume_level >= required_level:
             return 100.0
 
         return (max_resume_level / required_level) * 100
+
+
+class TopKCollector:
+    """
+    Bounded min-heap of the best candidates seen so far.
+    Memory stays O(k) result records however many resumes are pushed, and a
+    result dictionary is only built when a resume actually enters the heap.
+    """
+
+    def __init__(self, ranker, profile, k=10, min_score=0):
+        self.ranker = ranker
+        self.profile = profile
+        self.k = k
+        self.min_score = min_score
+        self.seen = 0
+        self._heap = []
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, resume):
+        """Score one parsed resume and keep it if it ranks in the top k."""
+        if not resume or self.k <= 0:
+            return False
+        arrival = self.seen
+        self.seen += 1
+
+        components = self.ranker._score_components(resume, self.profile)
+        score = round(components[3], 2)
+        if score < self.min_score:
+            return False
+
+        # Earlier candidates win ties, so later arrivals sort lower in the heap
+        key = (score, -arrival)
+        if not self._accepts(key):
+            return False
+        self._keep(key, self.ranker._build_entry(resume, self.profile, *components))
+        return True
+
+    def push_scores(self, scores):
+        """
+        Merge a scored batch (BatchScores) into the heap.
+        Only the batch's own top k rows are considered, and result
+        dictionaries are built just for rows that enter the heap.
+
+        Returns:
+            Number of rows that entered the heap
+        """
+        base = self.seen
+        self.seen += len(scores)
+        if self.k <= 0:
+            return 0
+
+        kept = 0
+        for row in scores.top_k(self.k, self.min_score):
+            score = round(float(scores.overall[row]), 2)
+            key = (score, -(base + int(row)))
+            if score < self.min_score:
+                continue
+            # Rows come best first, so once one is rejected the rest are too
+            if not self._accepts(key):
+                break
+            self._keep(key, scores.materialize([row])[0])
+            kept += 1
+        return kept
+
+    def _accepts(self, key):
+        """True if a candidate with this key would enter the heap."""
+        return len(self._heap) < self.k or key > self._heap[0][0]
+
+    def _keep(self, key, entry):
+        """Insert an entry, evicting the current minimum when full."""
+        if len(self._heap) >= self.k:
+            heapq.heapreplace(self._heap, (key, entry))
+        else:
+            heapq.heappush(self._heap, (key, entry))
+
+    def extend(self, resumes):
+        """Push every resume from an iterable."""
+        for resume in resumes:
+            self.push(resume)
+
+    @property
+    def threshold(self):
+        """Lowest score a new candidate must beat to enter a full heap."""
+        if len(self._heap) < self.k:
+            return self.min_score
+        return self._heap[0][0][0]
+
+    def results(self):
+        """Return the collected candidates, best first."""
+        return [entry for _, entry in sorted(self._heap, reverse=True)]
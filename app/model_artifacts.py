@@ -0,0 +1,254 @@
+"""
+Memory-mappable artifact format for the category classifier.
+
+A fitted TfidfVectorizer and linear classifier are written as plain arrays
+instead of pickles:
+
+    model_meta.json   format version, analyzer settings and class labels
+    vocabulary.npy    sorted feature terms as UTF-8 byte strings
+    idf.npy           IDF weight per feature
+    coef.npy          (n_classes, n_features) coefficients
+    intercept.npy     per-class intercepts
+
+A stateless HashingVectorizer (streaming training) needs no vocabulary or
+IDF arrays; its settings are stored in the metadata and it is rebuilt as is.
+
+Loading maps the arrays read-only, so there is no vocabulary dict to
+rebuild and every worker process on a host shares the same pages. Terms
+are looked up by binary search in the sorted table.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+
+ARTIFACT_VERSION = 1
+META_FILE = "model_meta.json"
+HASHING_PARAMS = (
+    "n_features", "lowercase", "strip_accents", "token_pattern", "ngram_range",
+    "stop_words", "norm", "alternate_sign", "binary",
+)
+
+
+def save_artifacts(classifier, vectorizer, label_encoder, model_dir):
+    """
+    Write a fitted vectorizer, linear classifier and label encoder as arrays.
+
+    Args:
+        classifier: Fitted linear model with coef_ and intercept_ (e.g. LinearSVC)
+        vectorizer: Fitted word-level TfidfVectorizer or HashingVectorizer
+        label_encoder: Fitted LabelEncoder
+        model_dir: Output directory
+
+    Returns:
+        Path of the metadata file
+    """
+    if vectorizer.analyzer != "word" or vectorizer.tokenizer or vectorizer.preprocessor:
+        raise ValueError("Only word analyzers with the default tokenizer can be exported")
+
+    model_dir = Path(model_dir)
+    model_dir.mkdir(parents=True, exist_ok=True)
+    np.save(model_dir / "coef.npy", np.ascontiguousarray(classifier.coef_, dtype=np.float64))
+    np.save(model_dir / "intercept.npy", np.asarray(classifier.intercept_, dtype=np.float64))
+    classes = [str(label) for label in label_encoder.classes_]
+
+    if isinstance(vectorizer, HashingVectorizer):
+        params = vectorizer.get_params()
+        hashing = {name: params[name] for name in HASHING_PARAMS}
+        hashing["ngram_range"] = list(hashing["ngram_range"])
+        hashing["stop_words"] = _json_stop_words(hashing["stop_words"])
+        return _write_meta(model_dir, {"vectorizer": "hashing", "hashing": hashing, "classes": classes})
+
+    # sklearn numbers features in sorted term order, so positions line up
+    terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+    encoded = [term.encode("utf-8") for term in terms]
+    if encoded != sorted(encoded):
+        raise ValueError("Vectorizer features are not in sorted order")
+    np.save(model_dir / "vocabulary.npy", np.array(encoded, dtype=bytes))
+    idf = vectorizer.idf_ if vectorizer.use_idf else np.ones(len(terms))
+    np.save(model_dir / "idf.npy", np.asarray(idf, dtype=np.float64))
+
+    params = vectorizer.get_params()
+    return _write_meta(model_dir, {
+        "vectorizer": "tfidf",
+        "analyzer": {
+            "lowercase": params["lowercase"],
+            "strip_accents": params["strip_accents"],
+            "token_pattern": params["token_pattern"],
+            "ngram_range": list(params["ngram_range"]),
+            "stop_words": _json_stop_words(params["stop_words"]),
+        },
+        "norm": params["norm"],
+        "use_idf": params["use_idf"],
+        "sublinear_tf": params["sublinear_tf"],
+        "binary": params["binary"],
+        "classes": classes,
+    })
+
+
+def _json_stop_words(stop_words):
+    """Stop words as stored in the metadata: None, a built-in list name or a sorted list."""
+    return stop_words if stop_words is None or isinstance(stop_words, str) else sorted(stop_words)
+
+
+def _write_meta(model_dir, meta):
+    """Write the metadata file last, so a half-written export is never loaded."""
+    meta_path = model_dir / META_FILE
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({"artifact_version": ARTIFACT_VERSION, **meta}, f, indent=2)
+    return meta_path
+
+
+def has_artifacts(model_dir):
+    """True if model_dir holds the array artifact format."""
+    return (Path(model_dir) / META_FILE).exists()
+
+
+class CompactVectorizer:
+    """
+    Inference-only TF-IDF vectorizer over a sorted, memory-mapped vocabulary.
+    Produces the same matrix as the fitted TfidfVectorizer it was exported from.
+    """
+
+    def __init__(self, vocabulary, idf, analyzer_params, norm="l2", use_idf=True,
+                 sublinear_tf=False, binary=False):
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.norm = norm
+        self.use_idf = use_idf
+        self.sublinear_tf = sublinear_tf
+        self.binary = binary
+        params = dict(analyzer_params)
+        params["ngram_range"] = tuple(params["ngram_range"])
+        self._analyze = TfidfVectorizer(**params).build_analyzer()
+        self._width = vocabulary.dtype.itemsize
+
+    def __len__(self):
+        return len(self.vocabulary)
+
+    def lookup(self, terms):
+        """
+        Feature index of each term.
+
+        Returns:
+            int64 array with -1 for terms outside the vocabulary
+        """
+        encoded = [t.encode("utf-8") for t in terms]
+        # Terms wider than the table cannot match and would be truncated
+        keys = np.array([e if len(e) <= self._width else b"" for e in encoded], dtype=self.vocabulary.dtype)
+        positions = np.searchsorted(self.vocabulary, keys)
+        positions[positions >= len(self.vocabulary)] = 0
+        found = (self.vocabulary[positions] == keys) & (keys != b"")
+        return np.where(found, positions, -1)
+
+    def transform(self, documents):
+        """
+        Vectorize documents.
+
+        Args:
+            documents: Iterable of text strings
+
+        Returns:
+            CSR matrix of shape (n_documents, n_features)
+        """
+        indptr = [0]
+        indices = []
+        for document in documents:
+            terms = self._analyze(document)
+            if terms:
+                features = self.lookup(terms)
+                indices.append(features[features >= 0])
+            indptr.append(indptr[-1] + (len(indices[-1]) if terms else 0))
+
+        indices = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64)
+        counts = sp.csr_matrix(
+            (np.ones(len(indices)), indices, np.array(indptr)),
+            shape=(len(indptr) - 1, len(self.vocabulary))
+        )
+        counts.sum_duplicates()
+
+        if self.binary:
+            counts.data[:] = 1
+        elif self.sublinear_tf:
+            np.log(counts.data, counts.data)
+            counts.data += 1
+        if self.use_idf:
+            counts = counts.multiply(self.idf).tocsr()
+        if self.norm:
+            counts = _normalize_rows(counts, self.norm)
+        return counts
+
+
+def _normalize_rows(matrix, norm):
+    """Scale CSR rows to unit l1 or l2 norm, leaving empty rows alone."""
+    if norm == "l2":
+        lengths = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    else:
+        lengths = np.asarray(abs(matrix).sum(axis=1)).ravel()
+    lengths[lengths == 0] = 1
+    return sp.csr_matrix(sp.diags(1 / lengths) @ matrix)
+
+
+class CompactLinearClassifier:
+    """Decision function of a linear model from mapped coefficient arrays."""
+
+    def __init__(self, coef, intercept):
+        self.coef_ = coef
+        self.intercept_ = intercept
+
+    def decision_function(self, X):
+        """Per-class margins; one margin per sample for two-class models."""
+        scores = np.asarray(X @ self.coef_.T) + self.intercept_
+        return scores.ravel() if scores.shape[1] == 1 else scores
+
+    def predict(self, X):
+        """Index of the predicted class for each sample."""
+        scores = self.decision_function(X)
+        return (scores > 0).astype(int) if scores.ndim == 1 else np.argmax(scores, axis=1)
+
+
+class CompactLabelEncoder:
+    """Inverse mapping from class index to label."""
+
+    def __init__(self, classes):
+        self.classes_ = np.asarray(classes, dtype=object)
+
+    def inverse_transform(self, indices):
+        return self.classes_[np.asarray(indices, dtype=np.int64)]
+
+
+def load_artifacts(model_dir, mmap=True):
+    """
+    Rebuild an inference-only model from the array artifacts.
+
+    Args:
+        model_dir: Directory written by save_artifacts
+        mmap: Memory-map the arrays instead of reading them into RAM
+
+    Returns:
+        Tuple of (classifier, vectorizer, label_encoder)
+    """
+    model_dir = Path(model_dir)
+    with open(model_dir / META_FILE, encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("artifact_version") != ARTIFACT_VERSION:
+        raise ValueError(f"Unsupported model artifact version: {meta.get('artifact_version')}")
+
+    mmap_mode = "r" if mmap else None
+    load = lambda name: np.load(model_dir / f"{name}.npy", mmap_mode=mmap_mode)
+
+    if meta.get("vectorizer", "tfidf") == "hashing":
+        params = dict(meta["hashing"])
+        params["ngram_range"] = tuple(params["ngram_range"])
+        vectorizer = HashingVectorizer(**params)
+    else:
+        vectorizer = CompactVectorizer(
+            load("vocabulary"), load("idf"), meta["analyzer"],
+            norm=meta["norm"], use_idf=meta["use_idf"],
+            sublinear_tf=meta["sublinear_tf"], binary=meta["binary"]
+        )
+    classifier = CompactLinearClassifier(load("coef"), load("intercept"))
+    return classifier, vectorizer, CompactLabelEncoder(meta["classes"])
@@ -0,0 +1,146 @@
+"""
+Serving for the trained resume category classifier.
+The artifacts written by model/train_model.py are loaded once per process,
+on first use and under a lock, and whole batches of resumes are classified
+with one vectorizer transform and one decision_function call. The
+memory-mapped array format is preferred over the pickles when present.
+"""
+
+import pickle
+import re
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from model_artifacts import has_artifacts, load_artifacts
+
+MODEL_DIR = Path(__file__).parent.parent / "model"
+
+ARTIFACTS = {
+    "classifier": "classifier.pkl",
+    "vectorizer": "tfidf_vectorizer.pkl",
+    "label_encoder": "label_encoder.pkl",
+}
+
+
+def clean_for_model(txt):
+    """Normalize text exactly as model/train_model.py does before training."""
+    if not txt or not isinstance(txt, str):
+        return ""
+    txt = re.sub('http\\S+\\s*', ' ', txt)
+    txt = re.sub('[^a-zA-Z ]', ' ', txt)
+    txt = re.sub('\\s+', ' ', txt)
+    return txt.lower().strip()
+
+
+class ModelService:
+    """
+    Lazily loaded category classifier.
+
+    Args:
+        model_dir: Directory holding the classifier, vectorizer and label
+            encoder, as array artifacts or pickles
+        mmap: Memory-map array artifacts so worker processes share them
+    """
+
+    def __init__(self, model_dir=MODEL_DIR, mmap=True):
+        self.model_dir = Path(model_dir)
+        self.mmap = mmap
+        self.classifier = None
+        self.vectorizer = None
+        self.label_encoder = None
+        self.error = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def available(self):
+        """True once the artifacts are loaded; triggers loading on first access."""
+        return self._load()
+
+    def _load(self):
+        """Load every artifact once; concurrent callers wait for the first."""
+        if self._loaded:
+            return self.error is None
+        with self._lock:
+            if not self._loaded:
+                try:
+                    if has_artifacts(self.model_dir):
+                        self.classifier, self.vectorizer, self.label_encoder = load_artifacts(
+                            self.model_dir, mmap=self.mmap
+                        )
+                    else:
+                        artifacts = {}
+                        for name, file_name in ARTIFACTS.items():
+                            with open(self.model_dir / file_name, "rb") as f:
+                                artifacts[name] = pickle.load(f)
+                        self.classifier = artifacts["classifier"]
+                        self.vectorizer = artifacts["vectorizer"]
+                        self.label_encoder = artifacts["label_encoder"]
+                except FileNotFoundError as e:
+                    self.error = f"Model not trained: {Path(e.filename).name} is missing"
+                except Exception as e:
+                    self.error = f"Error loading model: {str(e)}"
+                self._loaded = True
+        return self.error is None
+
+    def reload(self):
+        """Forget the loaded artifacts so the next call reads them again."""
+        with self._lock:
+            self.classifier = self.vectorizer = self.label_encoder = None
+            self.error = None
+            self._loaded = False
+
+    def predict_categories(self, texts):
+        """
+        Predict the job category of a batch of resume texts.
+
+        Args:
+            texts: Sequence of raw resume texts
+
+        Returns:
+            List with one category label per text; None for empty texts or
+            for every text when the model is unavailable
+        """
+        texts = list(texts)
+        if not texts or not self._load():
+            return [None] * len(texts)
+
+        cleaned = [clean_for_model(text) for text in texts]
+        try:
+            scores = self.classifier.decision_function(self.vectorizer.transform(cleaned))
+        except Exception as e:
+            print(f"Error predicting categories: {str(e)}")
+            return [None] * len(texts)
+
+        if scores.ndim == 1:
+            # Two-class models return one margin per sample
+            indices = (scores > 0).astype(int)
+        else:
+            indices = np.argmax(scores, axis=1)
+        labels = self.label_encoder.inverse_transform(indices)
+        return [str(label) if text else None for label, text in zip(labels, cleaned)]
+
+    def predict_category(self, text):
+        """Predict the category of a single resume text."""
+        return self.predict_categories([text])[0]
+
+
+_services = {}
+_services_lock = threading.Lock()
+
+
+def get_model_service(model_dir=MODEL_DIR):
+    """Process-wide ModelService for a model directory."""
+    key = str(Path(model_dir).resolve())
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = ModelService(model_dir)
+    return service
+
+
+def predict_categories(texts, model_dir=MODEL_DIR):
+    """Predict categories for a batch of texts with the shared ModelService."""
+    return get_model_service(model_dir).predict_categories(texts)
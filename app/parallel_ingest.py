@@ -0,0 +1,471 @@
+"""
+Parallel resume ingestion.
+Text extraction and parsing run in a warm process pool whose workers load
+the parser and skill taxonomy once, so a large upload uses every core.
+Untrusted files can instead be extracted by isolated workers that are
+killed and replaced when a file hangs or exhausts their memory cap.
+"""
+
+import io
+import multiprocessing
+import os
+import queue
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from resume_parser import ResumeParser
+from utils import extract_from_file, MAX_RESUME_CHARS
+
+SUPPORTED_EXTENSIONS = {".pdf": "pdf", ".docx": "docx", ".txt": "txt"}
+
+# Zip-bomb guards for archive uploads
+MAX_MEMBER_BYTES = 20 * 1024 * 1024
+MAX_ARCHIVE_BYTES = 1024 * 1024 * 1024
+MAX_COMPRESSION_RATIO = 100
+MAX_ARCHIVE_MEMBERS = 10000
+
+# Parser owned by each worker process, created once by _init_worker
+_worker_parser = None
+
+
+def extract_document(name, data, min_length=100, cache=None, extractor=None):
+    """
+    Extract text from an uploaded document.
+
+    Args:
+        name: File name, used to pick the extractor
+        data: File contents as bytes or a file-like object
+        min_length: Minimum number of characters a usable document has
+        cache: Optional TextCache; a hit skips the PDF/DOCX decoders
+        extractor: Callable with the signature of utils.extract_from_file,
+            e.g. an IsolatedExtractor; defaults to extracting in-process
+
+    Returns:
+        Tuple of (text, error); exactly one of them is None
+    """
+    try:
+        file_type = SUPPORTED_EXTENSIONS.get(Path(name).suffix.lower())
+        if file_type is None:
+            return None, f"Unsupported file type: {Path(name).suffix.lower()}"
+
+        extract = extractor or extract_from_file
+        if cache is not None:
+            if not isinstance(data, (bytes, bytearray)):
+                data = data.getvalue() if hasattr(data, "getvalue") else data.read()
+            text = cache.get_or_extract(
+                data,
+                lambda: extract(data, file_type, max_chars=MAX_RESUME_CHARS),
+                variant=f"{file_type}:{MAX_RESUME_CHARS}"
+            )
+        else:
+            text = extract(data, file_type, max_chars=MAX_RESUME_CHARS)
+
+        if not text or len(text) < min_length:
+            return None, "File contains too little text"
+
+        return text, None
+    except Exception as e:
+        return None, f"Error reading file: {str(e)}"
+
+
+def iter_zip_documents(zip_file, skipped=None, max_member_bytes=MAX_MEMBER_BYTES,
+                       max_total_bytes=MAX_ARCHIVE_BYTES, max_ratio=MAX_COMPRESSION_RATIO,
+                       max_members=MAX_ARCHIVE_MEMBERS):
+    """
+    Stream resume files out of a zip archive without touching the disk.
+    Members are decompressed one at a time into memory as the caller
+    iterates, so the output can feed ParallelIngestor.map or a
+    ScreeningPipeline directly.
+
+    Args:
+        zip_file: Path, bytes or file-like object of the archive
+        skipped: Optional list that receives (member_name, reason) for
+            every member that is not yielded
+        max_member_bytes: Largest uncompressed size accepted per member
+        max_total_bytes: Uncompressed bytes accepted across the archive
+        max_ratio: Highest uncompressed/compressed ratio accepted per member
+        max_members: Most resume members read from one archive
+
+    Yields:
+        Tuple of (member_name, data bytes)
+    """
+    skipped = skipped if skipped is not None else []
+    if isinstance(zip_file, (bytes, bytearray)):
+        zip_file = io.BytesIO(zip_file)
+
+    total = 0
+    accepted = 0
+    with zipfile.ZipFile(zip_file) as archive:
+        for info in archive.infolist():
+            name = info.filename
+            base = Path(name).name
+            if info.is_dir() or name.startswith("__MACOSX/") or base.startswith("."):
+                continue
+            if Path(name).suffix.lower() not in SUPPORTED_EXTENSIONS:
+                skipped.append((name, "Unsupported file type"))
+                continue
+            if accepted >= max_members:
+                skipped.append((name, f"Archive holds more than {max_members} resumes"))
+                continue
+            if info.file_size > max_member_bytes:
+                skipped.append((name, "File is too large"))
+                continue
+            if info.compress_size and info.file_size / info.compress_size > max_ratio:
+                skipped.append((name, "Suspicious compression ratio"))
+                continue
+            if total + info.file_size > max_total_bytes:
+                skipped.append((name, "Archive exceeds the total size limit"))
+                continue
+
+            # Declared sizes can lie, so never read past the limit
+            try:
+                with archive.open(info) as member:
+                    data = member.read(max_member_bytes + 1)
+            except Exception as e:
+                skipped.append((name, f"Error reading archive member: {str(e)}"))
+                continue
+            if len(data) > max_member_bytes:
+                skipped.append((name, "File is too large"))
+                continue
+
+            total += len(data)
+            accepted += 1
+            yield name, data
+
+
+def count_zip_documents(zip_file):
+    """
+    Count the resume members of a zip archive from its directory alone.
+
+    Returns:
+        Number of supported members (an upper bound on what
+        iter_zip_documents yields), or 0 for an unreadable archive
+    """
+    if isinstance(zip_file, (bytes, bytearray)):
+        zip_file = io.BytesIO(zip_file)
+    try:
+        with zipfile.ZipFile(zip_file) as archive:
+            return sum(
+                1 for info in archive.infolist()
+                if not info.is_dir()
+                and not info.filename.startswith("__MACOSX/")
+                and not Path(info.filename).name.startswith(".")
+                and Path(info.filename).suffix.lower() in SUPPORTED_EXTENSIONS
+            )
+    except zipfile.BadZipFile:
+        return 0
+
+
+def process_document(parser, name, data):
+    """
+    Extract and parse one document.
+
+    Returns:
+        Tuple of (name, resume_data, error); resume_data is None on error
+    """
+    text, error = extract_document(name, data)
+    if error:
+        return name, None, error
+    try:
+        resume_data = parser.parse_resume(text)
+    except Exception as e:
+        return name, None, f"Error parsing resume: {str(e)}"
+    if not resume_data:
+        return name, None, "Resume could not be parsed"
+    return name, resume_data, None
+
+
+def _init_worker():
+    """Load the parser (and with it the taxonomy automaton) once per worker."""
+    global _worker_parser
+    _worker_parser = ResumeParser()
+
+
+def parse_text(text):
+    """Parse resume text with this process's worker parser."""
+    global _worker_parser
+    if _worker_parser is None:
+        _init_worker()
+    return _worker_parser.parse_resume(text)
+
+
+def _process_chunk(chunk):
+    """Process a list of (name, data) pairs inside a worker."""
+    return [process_document(_worker_parser, name, data) for name, data in chunk]
+
+
+class ParallelIngestor:
+    """
+    Warm process pool for extracting and parsing uploaded resumes.
+
+    Args:
+        workers: Number of worker processes (defaults to the CPU count);
+            1 processes everything in the calling process
+        chunk_size: Documents sent to a worker per task
+        parser: Parser used when running in-process
+    """
+
+    def __init__(self, workers=None, chunk_size=8, parser=None):
+        self.workers = max(int(workers or os.cpu_count() or 1), 1)
+        self.chunk_size = max(int(chunk_size), 1)
+        self.parser = parser
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def executor(self):
+        """The worker pool, started on first use and kept warm afterwards."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        return self._executor
+
+    def reset(self, executor=None):
+        """
+        Discard a pool broken by a crashed worker; the next use starts a fresh one.
+
+        Args:
+            executor: The pool the caller saw fail; if the ingestor has
+                already replaced it, nothing happens
+        """
+        broken = self._executor
+        if broken is None or (executor is not None and executor is not broken):
+            return
+        self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def resize(self, workers):
+        """
+        Change the number of worker processes.
+
+        The current pool is retired rather than kept next to a new one:
+        tasks already submitted to it finish, and the next use starts a
+        pool of the new size.
+        """
+        workers = max(int(workers or os.cpu_count() or 1), 1)
+        if workers == self.workers:
+            return
+        self.workers = workers
+        if self._executor is not None:
+            retired, self._executor = self._executor, None
+            retired.shutdown(wait=False)
+
+    def map(self, documents):
+        """
+        Extract and parse documents, yielding results in input order.
+
+        Args:
+            documents: Iterable of (name, data) pairs, data being bytes
+
+        Yields:
+            Tuple of (name, resume_data, error) per document; a failing
+            document yields an error and the rest of the batch continues
+        """
+        documents = list(documents)
+
+        if self.workers == 1:
+            parser = self.parser or ResumeParser()
+            for name, data in documents:
+                yield process_document(parser, name, data)
+            return
+
+        chunks = [documents[i:i + self.chunk_size] for i in range(0, len(documents), self.chunk_size)]
+        futures = [self.executor.submit(_process_chunk, chunk) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            try:
+                results = future.result()
+            except BrokenProcessPool as e:
+                # A crashed worker poisons the pool; start a fresh one next time
+                self.reset()
+                results = [(name, None, f"Worker failed: {str(e)}") for name, _ in chunk]
+            except Exception as e:
+                results = [(name, None, f"Worker failed: {str(e)}") for name, _ in chunk]
+            yield from results
+
+    def close(self):
+        """Shut the worker pool down."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+def _limit_memory(limit_bytes):
+    """
+    Cap this process's address space at its current size plus limit_bytes.
+    A forked worker already maps everything its parent imported, so the
+    cap is relative to that baseline rather than absolute.
+    """
+    if resource is None or not limit_bytes:
+        return
+    try:
+        with open("/proc/self/statm") as f:
+            baseline = int(f.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError):
+        baseline = 0
+    limit = baseline + int(limit_bytes)
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError) as e:
+        print(f"Error limiting worker memory: {str(e)}")
+
+
+def _isolated_worker(conn, memory_limit):
+    """Serve extraction requests until told to stop or the pipe closes."""
+    _limit_memory(memory_limit)
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+        data, file_type, max_chars = job
+        try:
+            conn.send((extract_from_file(data, file_type, max_chars=max_chars), None))
+        except MemoryError:
+            conn.send((None, "File exceeds the extraction memory limit"))
+        except Exception as e:
+            conn.send((None, str(e)))
+
+
+class _ExtractionWorker:
+    """One isolated worker process and the parent's end of its pipe."""
+
+    def __init__(self, context, memory_limit):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_isolated_worker, args=(child_conn, memory_limit), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def stop(self, timeout=1.0):
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class IsolatedExtractor:
+    """
+    Text extraction in sandboxed worker processes.
+
+    Each file is extracted by a dedicated worker with a wall-clock timeout
+    and an address-space cap. A worker that overruns either is killed and
+    replaced, and the file fails with an error, so one malformed PDF cannot
+    stall the session. Instances are callable like utils.extract_from_file
+    and can be passed to extract_document or ScreeningPipeline; calls are
+    thread-safe and run concurrently up to the number of workers.
+
+    Args:
+        workers: Number of worker processes
+        timeout: Seconds a single file may take
+        memory_limit_mb: Extra address space a worker may map for one file
+    """
+
+    def __init__(self, workers=2, timeout=30.0, memory_limit_mb=1024):
+        self.workers = max(int(workers), 1)
+        self.timeout = float(timeout)
+        self.memory_limit = int(memory_limit_mb * 1024 * 1024) if memory_limit_mb else 0
+        self.timeouts = 0
+        self.crashes = 0
+        self._context = multiprocessing.get_context()
+        self._idle = queue.Queue()
+        self._resize_lock = threading.Lock()
+        self._closed = False
+        for _ in range(self.workers):
+            self._idle.put(_ExtractionWorker(self._context, self.memory_limit))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __call__(self, data, file_type=None, max_chars=None):
+        """
+        Extract text from file contents in an isolated worker.
+
+        Raises:
+            TimeoutError: The file took longer than the timeout
+            RuntimeError: The worker failed or died while extracting
+        """
+        if self._closed:
+            raise RuntimeError("Extractor is closed")
+        if not isinstance(data, (bytes, bytearray)):
+            data = data.getvalue() if hasattr(data, "getvalue") else data.read()
+
+        worker = self._idle.get()
+        try:
+            try:
+                worker.conn.send((bytes(data), file_type, max_chars))
+                finished = worker.conn.poll(self.timeout)
+            except (OSError, ValueError):
+                finished = True
+            if not finished:
+                self.timeouts += 1
+                worker = self._replace(worker)
+                raise TimeoutError(f"Extraction timed out after {self.timeout:g}s")
+            try:
+                text, error = worker.conn.recv()
+            except (EOFError, OSError):
+                self.crashes += 1
+                worker = self._replace(worker)
+                raise RuntimeError("Extraction worker died (memory limit exceeded?)")
+        finally:
+            self._idle.put(worker)
+
+        if error:
+            raise RuntimeError(error)
+        return text
+
+    def resize(self, workers):
+        """
+        Change the number of worker processes.
+
+        New workers start immediately; surplus ones are stopped as they
+        finish their current file, so a shrink may wait for that.
+        """
+        workers = max(int(workers), 1)
+        with self._resize_lock:
+            if self._closed:
+                raise RuntimeError("Extractor is closed")
+            for _ in range(workers - self.workers):
+                self._idle.put(_ExtractionWorker(self._context, self.memory_limit))
+            for _ in range(self.workers - workers):
+                self._idle.get().stop()
+            self.workers = workers
+
+    def stats(self):
+        """Worker count and how many files timed out or killed their worker."""
+        return {"workers": self.workers, "timeouts": self.timeouts, "crashes": self.crashes}
+
+    def close(self):
+        """Stop every worker."""
+        with self._resize_lock:
+            self._closed = True
+            for _ in range(self.workers):
+                self._idle.get().stop()
+
+    def _replace(self, worker):
+        """Kill a misbehaving worker and start a fresh one in its place."""
+        worker.process.kill()
+        worker.process.join()
+        worker.conn.close()
+        return _ExtractionWorker(self._context, self.memory_limit)
@@ -0,0 +1,332 @@
+"""
+Content-addressed caches for parsed resumes and extracted file text.
+Parse results are keyed by a hash of the normalized resume text plus the
+parser and taxonomy versions; extracted text is keyed by a hash of the
+uploaded file bytes plus the extractor version. Both are held in an
+in-memory LRU and optionally persisted to SQLite so reruns, re-uploads
+and re-screens skip the work entirely.
+"""
+
+import hashlib
+import pickle
+import sqlite3
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+from taxonomy import TAXONOMY_VERSION
+from utils import EXTRACTOR_VERSION
+from records import ParsedResume
+
+# Bump whenever ResumeParser output changes for the same input text
+PARSER_VERSION = 2
+
+# Fields recomputed from the actual input on every hit
+_TEXT_FIELDS = ("raw_text", "text_length")
+
+
+def normalize_text(text):
+    """Normalize line endings and surrounding whitespace before hashing."""
+    return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+class ParseCache:
+    """
+    Two-tier cache of ResumeParser results.
+
+    Args:
+        max_entries: Size cap of the in-memory LRU tier
+        cache_dir: Optional directory for the persistent SQLite tier
+    """
+
+    def __init__(self, max_entries=10000, cache_dir=None):
+        self.max_entries = max_entries
+        self.version = f"p{PARSER_VERSION}-t{TAXONOMY_VERSION}"
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if cache_dir is not None:
+            cache_dir = Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(cache_dir / "parse_cache.sqlite3"), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS parsed (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    def __len__(self):
+        return len(self._memory)
+
+    def key(self, text):
+        """Cache key for a resume text."""
+        digest = hashlib.blake2b(normalize_text(text).encode("utf-8", errors="surrogatepass"), digest_size=20)
+        digest.update(self.version.encode("ascii"))
+        return digest.hexdigest()
+
+    def get(self, text):
+        """
+        Look up the parsed result for a resume text.
+
+        Returns:
+            Copy of the cached result dictionary, or None on a miss
+        """
+        key = self.key(text)
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._restore(result, text)
+
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM parsed WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    result = pickle.loads(row[0])
+                    self._remember(key, result)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return self._restore(result, text)
+
+            self.misses += 1
+            return None
+
+    def put(self, text, result):
+        """Store a parsed result for a resume text."""
+        if not result:
+            return
+        key = self.key(text)
+        if isinstance(result, ParsedResume):
+            stored = result.with_text("")
+        else:
+            stored = {k: v for k, v in result.items() if k not in _TEXT_FIELDS}
+        with self._lock:
+            self._remember(key, stored)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO parsed (key, value) VALUES (?, ?)",
+                    (key, pickle.dumps(stored, protocol=pickle.HIGHEST_PROTOCOL))
+                )
+                self._db.commit()
+
+    def get_or_parse(self, text, parse):
+        """Return the cached result for text, parsing and storing it on a miss."""
+        result = self.get(text)
+        if result is None:
+            result = parse(text)
+            self.put(text, result)
+        return result
+
+    def stats(self):
+        """Hit, miss and eviction counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def clear(self):
+        """Drop every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM parsed")
+                self._db.commit()
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def close(self):
+        """Close the persistent tier."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key, result):
+        """Insert into the LRU tier, evicting the oldest entries past the cap."""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _restore(result, text):
+        """Copy a cached result and refill the fields derived from the input."""
+        if isinstance(result, ParsedResume):
+            return result.with_text(text)
+        restored = dict(result)
+        restored["raw_text"] = text[:1000]
+        restored["text_length"] = len(text)
+        return restored
+
+
+class TextCache:
+    """
+    Cache of text extracted from uploaded files, keyed by the file bytes.
+
+    The in-memory tier is bounded by the size of the cached strings rather
+    than their count, since one long PDF can outweigh hundreds of short
+    TXT resumes. Entries evicted from memory are spilled to an optional
+    SQLite file (zlib-compressed) and promoted back on their next hit.
+
+    Args:
+        max_bytes: Memory budget of the in-memory tier
+        cache_dir: Optional directory for the spill file
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, cache_dir=None):
+        self.max_bytes = max_bytes
+        self.version = f"e{EXTRACTOR_VERSION}"
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if cache_dir is not None:
+            cache_dir = Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(cache_dir / "text_cache.sqlite3"), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS extracted (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    def __len__(self):
+        return len(self._memory)
+
+    def key(self, data, variant=""):
+        """
+        Cache key for a file's bytes.
+
+        Args:
+            data: File contents as bytes
+            variant: Extraction options that change the output (file type,
+                character budget)
+        """
+        digest = hashlib.blake2b(data, digest_size=16)
+        digest.update(f"|{self.version}|{variant}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Look up extracted text.
+
+        Returns:
+            The cached text (possibly empty), or None on a miss
+        """
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return text
+
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM extracted WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    text = zlib.decompress(row[0]).decode("utf-8", errors="surrogatepass")
+                    self._db.execute("DELETE FROM extracted WHERE key = ?", (key,))
+                    self._db.commit()
+                    self._remember(key, text)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return text
+
+            self.misses += 1
+            return None
+
+    def put(self, key, text):
+        """Store extracted text under a key from key()."""
+        if text is None:
+            return
+        with self._lock:
+            self._remember(key, text)
+
+    def get_or_extract(self, data, extract, variant=""):
+        """
+        Return the cached text for data, calling extract() and storing it on a miss.
+
+        Empty results are not stored: extractors return "" when they fail,
+        and a failure should not outlive a fix or a raised resource limit.
+        """
+        key = self.key(data, variant)
+        text = self.get(key)
+        if text is None:
+            text = extract()
+            if text:
+                self.put(key, text)
+        return text
+
+    def stats(self):
+        """Hit, miss and eviction counters plus the memory tier size."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._memory),
+            "bytes": self.size,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def clear(self):
+        """Drop every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            self.size = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM extracted")
+                self._db.commit()
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def flush(self):
+        """Spill every in-memory entry to disk, e.g. before shutting down."""
+        with self._lock:
+            if self._db is not None:
+                self._spill(list(self._memory.items()))
+
+    def close(self):
+        """Flush the memory tier and close the spill file."""
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key, text):
+        """Insert into the LRU tier, spilling the oldest entries past the byte budget."""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self.size -= sys.getsizeof(previous)
+        self._memory[key] = text
+        self.size += sys.getsizeof(text)
+
+        evicted = []
+        while self.size > self.max_bytes and len(self._memory) > 1:
+            old_key, old_text = self._memory.popitem(last=False)
+            self.size -= sys.getsizeof(old_text)
+            self.evictions += 1
+            evicted.append((old_key, old_text))
+        if evicted and self._db is not None:
+            self._spill(evicted)
+
+    def _spill(self, entries):
+        """Write entries to the SQLite tier."""
+        self._db.executemany(
+            "INSERT OR REPLACE INTO extracted (key, value) VALUES (?, ?)",
+            [(key, zlib.compress(text.encode("utf-8", errors="surrogatepass"), 1)) for key, text in entries]
+        )
+        self._db.commit()
@@ -0,0 +1,143 @@
+"""
+Precompiled extraction patterns shared by the resume and job parsers.
+Every pattern is compiled once for str and once for bytes input, and the
+helpers return str results either way.
+"""
+
+import re
+
+# Any run of characters cleanResume would collapse into a single space
+_SEP = r"[^a-z0-9]"
+
+# The three experience phrasings merged into one pattern; the named groups
+# tell them apart. It starts with a digit so the regex engine can skip
+# straight to candidate positions.
+EXPERIENCE_PATTERN = (
+    rf"(?P<years>[0-9]+)(?P<sep>{_SEP}*)(?P<unit>years?|yrs?)"
+    rf"(?P<tail>{_SEP}+(?:of{_SEP}+)?(?:experience|exp))?"
+)
+
+# cleanResume drops URLs, so experience mentions inside them are ignored
+URL_PATTERN = r"(?:http|www)\S+"
+
+EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+PHONE_PATTERN = r"(?:\+1)?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}"
+INTL_PHONE_PATTERN = r"\+[0-9]{1,3}[-.\s]?[0-9]{1,14}"
+
+# Digit core every PHONE_PATTERN match contains, at most 4 characters
+# ("+1 (") after the start of the match
+_PHONE_CORE_PATTERN = r"[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}"
+_PHONE_PREFIX_MAX = 4
+
+_EMAIL_LOCAL_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-"
+
+
+def _compile(pattern, flags=0):
+    """Compile a pattern for both str and bytes input."""
+    return {
+        str: re.compile(pattern, flags),
+        bytes: re.compile(pattern.encode("ascii"), flags),
+    }
+
+
+EXPERIENCE_RE = _compile(EXPERIENCE_PATTERN, re.IGNORECASE)
+URL_RE = _compile(URL_PATTERN, re.IGNORECASE)
+EMAIL_RE = _compile(EMAIL_PATTERN)
+PHONE_RE = _compile(PHONE_PATTERN)
+INTL_PHONE_RE = _compile(INTL_PHONE_PATTERN)
+_PHONE_CORE_RE = _compile(_PHONE_CORE_PATTERN)
+
+_EMAIL_LOCAL = {
+    str: frozenset(_EMAIL_LOCAL_CHARS),
+    bytes: frozenset(_EMAIL_LOCAL_CHARS.encode("ascii")),
+}
+_LITERALS = {
+    str: {"@": "@", "+": "+", "http": "http", "www": "www"},
+    bytes: {"@": b"@", "+": b"+", "http": b"http", "www": b"www"},
+}
+
+
+def _as_str(value):
+    """Decode a bytes match group to str."""
+    return value.decode("ascii", errors="ignore") if isinstance(value, bytes) else value
+
+
+def _kind(text):
+    """Pattern table key for the input type."""
+    return bytes if isinstance(text, (bytes, bytearray)) else str
+
+
+def find_experience(text):
+    """
+    Years of experience mentioned in text, capped at 60.
+    "N years of experience" wins over a bare "N years", which wins over "N yrs".
+
+    Args:
+        text: Resume or job description text (str or bytes, raw or cleaned)
+
+    Returns:
+        Integer years, 0 if nothing is found
+    """
+    kind = _kind(text)
+    literals = _LITERALS[kind]
+    lowered = text.lower()
+    urls = []
+    if literals["http"] in lowered or literals["www"] in lowered:
+        urls = [m.span() for m in URL_RE[kind].finditer(text)]
+
+    years_match = yrs_match = None
+    for match in EXPERIENCE_RE[kind].finditer(text):
+        if urls and any(start <= match.start() < end for start, end in urls):
+            continue
+        if match.group("tail"):
+            return min(int(match.group("years")), 60)
+        if match.group("sep"):
+            unit = _as_str(match.group("unit")).lower()
+            if years_match is None and unit == "years":
+                years_match = match
+            elif yrs_match is None and unit == "yrs":
+                yrs_match = match
+    best = years_match or yrs_match
+    return min(int(best.group("years")), 60) if best else 0
+
+
+def find_email(text):
+    """
+    First email address in text, or None.
+    The search starts at the local part before the first '@' instead of
+    probing every character.
+    """
+    kind = _kind(text)
+    at = text.find(_LITERALS[kind]["@"])
+    if at < 0:
+        return None
+    local = _EMAIL_LOCAL[kind]
+    start = at
+    while start > 0 and text[start - 1] in local:
+        start -= 1
+    match = EMAIL_RE[kind].search(text, start)
+    return _as_str(match.group(0)) if match else None
+
+
+def find_phone(text):
+    """
+    First phone number in text, or None.
+    North American numbers are preferred over generic international ones;
+    the search starts just before the first digit run shaped like a number.
+    """
+    kind = _kind(text)
+    core = _PHONE_CORE_RE[kind].search(text)
+    if core:
+        match = PHONE_RE[kind].search(text, max(core.start() - _PHONE_PREFIX_MAX, 0))
+        if match:
+            return _as_str(match.group(0))
+    if _LITERALS[kind]["+"] in text:
+        match = INTL_PHONE_RE[kind].search(text)
+        if match:
+            return _as_str(match.group(0))
+    return None
+
+
+def find_contacts(text):
+    """Return (email, phone) found in text."""
+    return find_email(text), find_phone(text)
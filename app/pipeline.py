@@ -0,0 +1,318 @@
+"""
+Staged asyncio screening pipeline.
+Documents flow extract -> parse -> score through bounded queues, one worker
+group per stage, so extraction of the next file overlaps parsing and
+scoring of earlier ones and a slow file only holds up its own worker.
+CPU-heavy stages run on an executor; memory stays bounded by the queue
+sizes however many files are fed in.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from resume_parser import ResumeParser
+from matcher import CandidateRanker
+from parallel_ingest import extract_document, parse_text
+
+# End-of-stream marker passed between stages
+_DONE = object()
+
+
+class StageMetrics:
+    """Counters for one pipeline stage."""
+
+    def __init__(self, name, workers, queue):
+        self.name = name
+        self.workers = workers
+        self.queue = queue
+        self.processed = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.started = None
+        self.finished = None
+
+    def snapshot(self):
+        """
+        Current state of the stage.
+
+        Returns:
+            Dictionary with queue depth, item counts and throughput
+        """
+        end = self.finished or time.perf_counter()
+        elapsed = end - self.started if self.started else 0.0
+        return {
+            "workers": self.workers,
+            "queue_depth": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "processed": self.processed,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 4),
+            "throughput": round(self.processed / elapsed, 2) if elapsed else 0.0
+        }
+
+
+class PipelineResult:
+    """One document after it left the pipeline."""
+
+    __slots__ = ("index", "name", "resume", "entry", "error", "text")
+
+    def __init__(self, index, name, resume=None, entry=None, error=None):
+        self.index = index
+        self.name = name
+        self.resume = resume
+        self.entry = entry
+        self.error = error
+        self.text = None
+
+
+class ScreeningPipeline:
+    """
+    extract -> parse -> score pipeline over (name, data) documents.
+
+    Args:
+        job_description: Optional job text, dict or JobProfile; without one
+            the score stage is skipped and results carry only parsed resumes
+        parser: ResumeParser used by the parse stage; with a process pool
+            only its cache is used, checked and filled in this process
+        ranker: CandidateRanker used by the score stage
+        extract_workers: Concurrent extraction tasks
+        parse_workers: Concurrent parse tasks
+        queue_size: Capacity of every inter-stage queue
+        executor: Executor for the extract and parse stages; a
+            ProcessPoolExecutor should use parallel_ingest._init_worker as
+            its initializer. Defaults to a private thread pool.
+        text_cache: Optional TextCache consulted by the extract stage
+            (ignored when extraction runs in a process pool, whose workers
+            cannot share it)
+        extractor: Optional isolated extractor (parallel_ingest.IsolatedExtractor);
+            the extract stage then drives it from threads of this process
+        keep_text: Keep each document's extracted text on its result, e.g.
+            to classify the whole batch afterwards
+        ingestor: Optional ParallelIngestor whose warm process pool runs the
+            extract and parse stages instead of executor. A pool broken by a
+            crashed worker is replaced, and the documents it was handling are
+            retried once on the new pool.
+    """
+
+    def __init__(self, job_description=None, parser=None, ranker=None, extract_workers=4,
+                 parse_workers=2, queue_size=16, executor=None, text_cache=None, extractor=None,
+                 keep_text=False, ingestor=None):
+        self.ranker = ranker or CandidateRanker()
+        self.profile = self.ranker.compile_job(job_description) if job_description else None
+        self.extract_workers = max(int(extract_workers), 1)
+        self.parse_workers = max(int(parse_workers), 1)
+        self.queue_size = max(int(queue_size), 1)
+        self.ingestor = ingestor
+        self.executor = ingestor.executor if ingestor is not None else executor
+        self.extractor = extractor
+        self.keep_text = keep_text
+        self.metrics = {}
+
+        # A process pool cannot run a bound parser method from this process;
+        # its workers parse with their own preloaded, uncached parser, so the
+        # parser's ParseCache is consulted here around each dispatch instead
+        if isinstance(self.executor, ProcessPoolExecutor):
+            self._parse = parse_text
+            self.parse_cache = getattr(parser, "cache", None)
+            self.text_cache = text_cache if extractor is not None else None
+        else:
+            self._parse = (parser or ResumeParser()).parse_resume
+            self.parse_cache = None
+            self.text_cache = text_cache
+
+    def stats(self):
+        """Per-stage metrics snapshot, keyed by stage name."""
+        return {name: stage.snapshot() for name, stage in self.metrics.items()}
+
+    async def stream(self, documents):
+        """
+        Run documents through the pipeline.
+
+        Args:
+            documents: Iterable of (name, data) pairs; data is bytes, a
+                file-like object or a path string. It is consumed lazily.
+
+        Yields:
+            PipelineResult per document, in completion order
+
+        Raises:
+            The documents iterator's error, once every document it did
+            produce has been yielded
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        owned = executor is None
+        if owned:
+            executor = ThreadPoolExecutor(max_workers=self.extract_workers + self.parse_workers)
+
+        extract_q = asyncio.Queue(self.queue_size)
+        parse_q = asyncio.Queue(self.queue_size)
+        score_q = asyncio.Queue(self.queue_size)
+        out_q = asyncio.Queue(self.queue_size)
+        self.metrics = {
+            "extract": StageMetrics("extract", self.extract_workers, extract_q),
+            "parse": StageMetrics("parse", self.parse_workers, parse_q),
+            "score": StageMetrics("score", 1, score_q),
+        }
+
+        async def dispatch(func, *args):
+            """Run func on the executor, once more on a fresh pool if the ingestor's broke."""
+            pool = self.ingestor.executor if self.ingestor is not None else executor
+            try:
+                return await loop.run_in_executor(pool, func, *args)
+            except BrokenProcessPool:
+                if self.ingestor is None:
+                    raise
+                # Every in-flight item sees the same broken pool; the first to
+                # get here replaces it and the others retry on the new one
+                self.ingestor.reset(pool)
+                retry_pool = self.ingestor.executor
+                try:
+                    return await loop.run_in_executor(retry_pool, func, *args)
+                except BrokenProcessPool:
+                    # The item itself kills workers; fail it and leave a fresh pool behind
+                    self.ingestor.reset(retry_pool)
+                    raise
+
+        async def extract(result, data):
+            args = (extract_document, result.name, data, 100, self.text_cache, self.extractor)
+            if self.extractor is not None:
+                # An isolated extractor only waits on its worker processes, so it
+                # is driven from the loop's default thread pool instead
+                text, error = await loop.run_in_executor(None, *args)
+            else:
+                text, error = await dispatch(*args)
+            result.error = error
+            if self.keep_text:
+                result.text = text
+            return text
+
+        async def parse(result, text):
+            resume = None
+            if self.parse_cache is not None:
+                resume = await loop.run_in_executor(None, self.parse_cache.get, text)
+            if resume is None:
+                resume = await dispatch(self._parse, text)
+                if resume and self.parse_cache is not None:
+                    await loop.run_in_executor(None, self.parse_cache.put, text, resume)
+            if not resume:
+                result.error = "Resume could not be parsed"
+                return None
+            resume["candidate_name"] = Path(result.name).stem
+            resume["file_name"] = result.name
+            result.resume = resume
+            return resume
+
+        async def score(result, resume):
+            if self.profile is not None:
+                result.entry = self.ranker.rank_single_resume(resume, self.profile) or None
+            return result
+
+        feed_errors = []
+        tasks = [
+            asyncio.create_task(self._feed(documents, extract_q, self.extract_workers, feed_errors)),
+            *self._start_stage(self.metrics["extract"], extract, extract_q, parse_q, self.parse_workers),
+            *self._start_stage(self.metrics["parse"], parse, parse_q, score_q, 1),
+            *self._start_stage(self.metrics["score"], score, score_q, out_q, 1),
+        ]
+
+        try:
+            while True:
+                item = await out_q.get()
+                if item is _DONE:
+                    break
+                yield item[0]
+            await asyncio.gather(*tasks)
+            if feed_errors:
+                # Documents read before the failure were still delivered
+                raise feed_errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+            if owned:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, documents):
+        """
+        Run the whole pipeline and rank the results.
+
+        Returns:
+            Tuple of (ranked entries best first, ties in input order, and
+            failed PipelineResults in input order)
+        """
+        scored, failed = [], []
+        async for result in self.stream(documents):
+            if result.error:
+                failed.append(result)
+            elif result.entry is not None:
+                scored.append(result)
+        # Results arrive in completion order; equal scores keep input order,
+        # as in CandidateRanker and TopKCollector
+        scored.sort(key=lambda r: (-r.entry["overall_score"], r.index))
+        failed.sort(key=lambda r: r.index)
+        return [r.entry for r in scored], failed
+
+    async def _feed(self, documents, queue, consumers, errors):
+        """
+        Push documents into the first stage, waiting whenever it is full.
+
+        The iterator is advanced on a thread, so a generator that decompresses
+        or reads files does not block the other stages. The stage is closed
+        even if the iterator raises; the error is appended to errors.
+        """
+        loop = asyncio.get_running_loop()
+        iterator = iter(documents)
+        index = 0
+        try:
+            while True:
+                document = await loop.run_in_executor(None, next, iterator, _DONE)
+                if document is _DONE:
+                    break
+                name, data = document
+                await queue.put((PipelineResult(index, name), data))
+                index += 1
+        except Exception as e:
+            errors.append(e)
+        finally:
+            for _ in range(consumers):
+                await queue.put(_DONE)
+
+    def _start_stage(self, metrics, work, inbox, outbox, downstream):
+        """
+        Start a stage's worker group.
+
+        Items that fail are forwarded untouched so the output still
+        reports them; the last worker to finish closes the next stage.
+        """
+        remaining = [metrics.workers]
+
+        async def worker():
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    break
+                result, payload = item
+                if metrics.started is None:
+                    metrics.started = time.perf_counter()
+                if result.error is None:
+                    start = time.perf_counter()
+                    try:
+                        payload = await work(result, payload)
+                    except Exception as e:
+                        result.error = f"{metrics.name} failed: {str(e)}"
+                    metrics.busy_seconds += time.perf_counter() - start
+                    metrics.processed += 1
+                    if result.error is not None:
+                        metrics.errors += 1
+                await outbox.put((result, payload))
+
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                metrics.finished = time.perf_counter()
+                for _ in range(downstream):
+                    await outbox.put(_DONE)
+
+        return [asyncio.create_task(worker()) for _ in range(metrics.workers)]
@@ -0,0 +1,257 @@
+"""
+Compact record types for parsed resumes and ranked candidates.
+Both are slotted objects that keep skills as taxonomy IDs and share their
+list and string fields with the resume they came from, while still reading
+like the dictionaries the rest of the app consumes (result["skills"],
+result.get("email"), dict(result), to_dict()).
+"""
+
+from array import array
+from taxonomy import DEFAULT_TAXONOMY
+
+# Characters of the source text exposed as raw_text
+RAW_TEXT_CHARS = 1000
+
+
+class _Record:
+    """
+    Read-mostly mapping interface over __slots__ attributes.
+
+    Subclasses list their exported keys in FIELDS; keys in OPTIONAL_FIELDS
+    only count as present once set, and WRITABLE_FIELDS may be assigned
+    with record[key] = value.
+    """
+
+    __slots__ = ()
+    FIELDS = ()
+    OPTIONAL_FIELDS = ()
+    WRITABLE_FIELDS = ()
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.WRITABLE_FIELDS:
+            raise KeyError(f"{type(self).__name__} field '{key}' cannot be assigned")
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        if key in self.OPTIONAL_FIELDS:
+            return getattr(self, key) is not None
+        return key in self.FIELDS
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __bool__(self):
+        return True
+
+    def __eq__(self, other):
+        if isinstance(other, (_Record, dict)):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def get(self, key, default=None):
+        """Value of a field, or default if it is missing or unset."""
+        return self[key] if key in self else default
+
+    def keys(self):
+        """Exported field names, in to_dict() order."""
+        return [key for key in self.FIELDS if key in self]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self):
+        """Plain dictionary with every exported field, for export and JSON."""
+        return {key: self[key] for key in self.keys()}
+
+
+class ParsedResume(_Record):
+    """
+    Fields extracted from one resume.
+
+    Skills are held as an array('H') of taxonomy IDs and decoded on access.
+    The source text is referenced rather than copied; raw_text slices it on
+    demand and pickling keeps only that slice.
+    """
+
+    __slots__ = (
+        "skill_ids", "total_experience_years", "email", "phone", "education",
+        "certifications", "text_length", "candidate_name", "file_name", "category",
+        "taxonomy", "_text"
+    )
+    FIELDS = (
+        "skills", "skill_ids", "total_experience_years", "email", "phone", "education",
+        "certifications", "raw_text", "text_length", "candidate_name", "file_name", "category"
+    )
+    OPTIONAL_FIELDS = ("candidate_name", "file_name", "category")
+    WRITABLE_FIELDS = (
+        "skills", "skill_ids", "total_experience_years", "email", "phone", "education",
+        "certifications", "candidate_name", "file_name", "category"
+    )
+
+    def __init__(self, skill_ids=(), total_experience_years=0, email=None, phone=None,
+                 education=None, certifications=None, text="", candidate_name=None,
+                 file_name=None, category=None, taxonomy=DEFAULT_TAXONOMY):
+        self.skill_ids = skill_ids if isinstance(skill_ids, array) else array("H", skill_ids)
+        self.total_experience_years = total_experience_years
+        self.email = email
+        self.phone = phone
+        self.education = education if education is not None else []
+        self.certifications = certifications if certifications is not None else []
+        self.text_length = len(text)
+        self.candidate_name = candidate_name
+        self.file_name = file_name
+        self.category = category
+        self.taxonomy = taxonomy
+        # Only the exposed slice is kept, so a record never pins its source document
+        self._text = text[:RAW_TEXT_CHARS]
+
+    @property
+    def skills(self):
+        """Canonical skill names, decoded from skill_ids."""
+        return self.taxonomy.decode(self.skill_ids)
+
+    @skills.setter
+    def skills(self, skills):
+        self.skill_ids = self.taxonomy.encode(skills)
+
+    @property
+    def raw_text(self):
+        """Leading slice of the source text."""
+        return self._text
+
+    def with_text(self, text):
+        """
+        Copy of this record pointing at a (possibly different) source text.
+        Used by caches to re-attach the caller's text to a stored result.
+        """
+        record = self.copy()
+        record._text = text[:RAW_TEXT_CHARS]
+        record.text_length = len(text)
+        return record
+
+    def copy(self):
+        """Shallow copy; list fields are copied so callers can edit them."""
+        record = ParsedResume.__new__(ParsedResume)
+        for slot in self.__slots__:
+            setattr(record, slot, getattr(self, slot))
+        record.education = list(self.education)
+        record.certifications = list(self.certifications)
+        return record
+
+    def __getstate__(self):
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        # The shared taxonomy (and its automaton) is not shipped with every record
+        if self.taxonomy is DEFAULT_TAXONOMY:
+            state["taxonomy"] = None
+        return state
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        if self.taxonomy is None:
+            self.taxonomy = DEFAULT_TAXONOMY
+
+
+class RankedCandidate(_Record):
+    """
+    One scored candidate.
+
+    Scores are stored; skills, education, certifications and contact
+    details are references to the resume's own objects, and the matched
+    and missing skill lists are worked out from the job profile only when
+    they are read. No resume text is kept alive.
+    """
+
+    __slots__ = (
+        "profile", "_skills", "overall_score", "skills_score", "experience_score",
+        "education_score", "experience_years", "education", "certifications",
+        "email", "phone", "candidate_name", "file_name", "category"
+    )
+    FIELDS = (
+        "skills", "matched_skills", "missing_skills", "overall_score", "skills_score",
+        "experience_score", "education_score", "experience_years", "education",
+        "certifications", "email", "phone", "match_percentage", "candidate_name", "file_name",
+        "category"
+    )
+    OPTIONAL_FIELDS = ("candidate_name", "file_name", "category")
+    WRITABLE_FIELDS = ("candidate_name", "file_name", "email", "phone", "category")
+
+    def __init__(self, profile, skills, overall_score, skills_score, experience_score,
+                 education_score, experience_years=0, education=None, certifications=None,
+                 email=None, phone=None, candidate_name=None, file_name=None, category=None):
+        self.profile = profile
+        self._skills = skills
+        self.overall_score = overall_score
+        self.skills_score = skills_score
+        self.experience_score = experience_score
+        self.education_score = education_score
+        self.experience_years = experience_years
+        self.education = education if education is not None else []
+        self.certifications = certifications if certifications is not None else []
+        self.email = email
+        self.phone = phone
+        self.candidate_name = candidate_name
+        self.file_name = file_name
+        self.category = category
+
+    @classmethod
+    def from_resume(cls, resume, profile, skill_score, experience_score, education_score, overall_score):
+        """
+        Build a ranked candidate from a parsed resume (record or dictionary).
+        """
+        if isinstance(resume, ParsedResume) and resume.taxonomy is DEFAULT_TAXONOMY:
+            skills = resume.skill_ids
+        else:
+            skills = resume.get("skills", [])
+        return cls(
+            profile, skills,
+            round(overall_score, 2), round(skill_score, 2),
+            round(experience_score, 2), round(education_score, 2),
+            experience_years=resume.get("total_experience_years", 0),
+            education=resume.get("education", []),
+            certifications=resume.get("certifications", []),
+            email=resume.get("email"),
+            phone=resume.get("phone"),
+            candidate_name=resume.get("candidate_name"),
+            file_name=resume.get("file_name"),
+            category=resume.get("category")
+        )
+
+    @property
+    def skills(self):
+        """Candidate skill names."""
+        if isinstance(self._skills, array):
+            return DEFAULT_TAXONOMY.decode(self._skills)
+        return self._skills
+
+    @property
+    def matched_skills(self):
+        """Job skills the candidate has, in job order."""
+        have = set(self.skills)
+        return [s for s in self.profile.skills if s in have]
+
+    @property
+    def missing_skills(self):
+        """Job skills the candidate lacks, in job order."""
+        have = set(self.skills)
+        return [s for s in self.profile.skills if s not in have]
+
+    @property
+    def match_percentage(self):
+        return self.overall_score
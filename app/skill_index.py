@@ -0,0 +1,146 @@
+"""
+Inverted skill index over a candidate pool.
+Maps every skill bit position to the sorted rows of the candidates who
+have it, so a query only touches candidates that share skills with the job.
+"""
+
+import math
+from pathlib import Path
+
+import numpy as np
+
+# Scores are compared after rounding to 2 decimals; keep anything that could round up
+_ROUNDING_SLACK = 0.005 + 1e-9
+
+# Past this share of the pool, gathering rows costs more than scoring them all
+MAX_RETRIEVAL_FRACTION = 0.25
+
+
+class SkillIndex:
+    """
+    Posting lists of candidate rows per skill position.
+
+    Attributes:
+        postings: Flat int32 array of candidate rows, sorted within each skill
+        offsets: (n_skills + 1,) int64 start of each skill's posting list
+        n_rows: Number of candidates in the indexed pool
+    """
+
+    def __init__(self, postings, offsets, n_rows):
+        self.postings = postings
+        self.offsets = offsets
+        self.n_rows = n_rows
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """
+        Build the index from a CandidateMatrix.
+
+        Args:
+            matrix: CandidateMatrix (or anything with a packed skill_bits matrix)
+
+        Returns:
+            SkillIndex
+        """
+        skill_bits = matrix.skill_bits
+        n_skills = len(matrix.vocabulary)
+        lists = []
+        for position in range(n_skills):
+            # np.packbits stores the first bit in the most significant position
+            column = skill_bits[:, position // 8] & (0x80 >> (position % 8))
+            lists.append(np.flatnonzero(column).astype(np.int32))
+
+        offsets = np.zeros(n_skills + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(rows) for rows in lists])
+        postings = np.concatenate(lists) if lists else np.zeros(0, dtype=np.int32)
+        return cls(postings, offsets, len(skill_bits))
+
+    def posting(self, position):
+        """Sorted candidate rows having the skill at a bit position."""
+        if position is None or not 0 <= position < len(self):
+            return self.postings[:0]
+        return self.postings[self.offsets[position]:self.offsets[position + 1]]
+
+    def candidates(self, positions, min_matches, max_fraction=MAX_RETRIEVAL_FRACTION):
+        """
+        Rows that have at least min_matches of the given skills.
+
+        Uses the max-score partition: a candidate matching min_matches of m
+        skills must appear in one of the m - min_matches + 1 shortest posting
+        lists, so only those lists are merged and the rest are probed with
+        binary search.
+
+        Args:
+            positions: Skill bit positions of the query (None for unknown skills)
+            min_matches: Minimum number of skills a candidate must share
+            max_fraction: Give up when the lists to merge cover more than
+                this share of the pool
+
+        Returns:
+            Sorted int32 array of candidate rows, or None when a full scan
+            is cheaper
+        """
+        if min_matches <= 0:
+            return None
+        lists = sorted((self.posting(p) for p in positions), key=len)
+        if min_matches > len(lists):
+            return self.postings[:0]
+
+        essential = lists[:len(lists) - min_matches + 1]
+        if sum(len(posting) for posting in essential) > max_fraction * self.n_rows:
+            return None
+        rows = np.unique(np.concatenate(essential))
+        if not len(rows):
+            return rows
+
+        counts = np.zeros(len(rows), dtype=np.int32)
+        for posting in lists:
+            if not len(posting):
+                continue
+            at = np.searchsorted(posting, rows)
+            counts += posting[np.minimum(at, len(posting) - 1)] == rows
+        return rows[counts >= min_matches]
+
+    def save(self, path):
+        """Write the posting arrays into a directory."""
+        path = Path(path)
+        np.save(path / "index_postings.npy", self.postings)
+        np.save(path / "index_offsets.npy", self.offsets)
+
+    @classmethod
+    def load(cls, path, n_rows, mmap=True):
+        """Read an index written by save, memory-mapped by default."""
+        path = Path(path)
+        mode = "r" if mmap else None
+        return cls(
+            np.load(path / "index_postings.npy", mmap_mode=mode),
+            np.load(path / "index_offsets.npy", mmap_mode=mode),
+            n_rows
+        )
+
+
+def min_skill_matches(n_skills, min_score, skill_weight, other_weight):
+    """
+    Fewest job skills a candidate needs to possibly reach min_score.
+    Every job skill adds the same amount to the weighted skill component,
+    so the WAND upper bound reduces to a match count: the remaining
+    components are assumed to score their 100% maximum.
+
+    Args:
+        n_skills: Number of skills the job asks for
+        min_score: Minimum overall score (0-100)
+        skill_weight: Weight of the skill component
+        other_weight: Combined weight of every other component
+
+    Returns:
+        Required matches, 0 when no candidate can be ruled out
+    """
+    if not n_skills or skill_weight <= 0:
+        return 0
+    shortfall = (min_score - _ROUNDING_SLACK) - other_weight * 100
+    if shortfall <= 0:
+        return 0
+    return math.ceil(shortfall / (skill_weight * 100 / n_skills) - 1e-9)
@@ -0,0 +1,120 @@
+"""
+Multi-pattern keyword matching.
+An Aho-Corasick automaton finds every vocabulary entry in a single linear
+pass over the text, independent of how many entries the vocabulary holds.
+"""
+
+
+def _is_word_char(ch):
+    """Characters that continue a word (a match must not touch them)."""
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over a keyword vocabulary.
+
+    Patterns added with whole_word=True only match when not surrounded by
+    letters or digits, so "go" does not fire inside "good".
+    """
+
+    def __init__(self, patterns=(), whole_word=True):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._delta = None
+        self._built = False
+        for pattern in patterns:
+            self.add(pattern, whole_word=whole_word)
+
+    def add(self, pattern, payload=None, whole_word=True):
+        """
+        Register a pattern.
+
+        Args:
+            pattern: Lowercase keyword to search for
+            payload: Value reported on a match (defaults to the pattern)
+            whole_word: Require word boundaries on both sides of the match
+        """
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        # Like regex \b, a boundary only applies where the pattern edge is a word character
+        check_start = whole_word and _is_word_char(pattern[0])
+        check_end = whole_word and _is_word_char(pattern[-1])
+        self._output[state].append(
+            (len(pattern), pattern if payload is None else payload, check_start, check_end)
+        )
+        self._built = False
+
+    def build(self):
+        """
+        Compute failure links breadth-first, merge suffix outputs and flatten
+        the failure chain into per-state transition tables.
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        order = list(goto[0].values())
+        for state in order:
+            fail[state] = 0
+        head = 0
+        while head < len(order):
+            state = order[head]
+            head += 1
+            for ch, child in goto[state].items():
+                order.append(child)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(ch, 0)
+                output[child] = output[child] + output[fail[child]]
+
+        # delta[state] holds every non-root transition reachable through the
+        # failure chain, so scanning needs no failure-link loop; anything
+        # missing falls back to the root's transitions
+        delta = [{} for _ in goto]
+        for state in order:
+            if fail[state]:
+                delta[state].update(delta[fail[state]])
+            delta[state].update(goto[state])
+        self._delta = delta
+        self._built = True
+        return self
+
+    def iter_matches(self, text):
+        """
+        Yield (start, end, payload) for every match in text.
+
+        Args:
+            text: Text to scan (lowercase it first to match case-insensitively)
+        """
+        if not self._built:
+            self.build()
+        delta, output = self._delta, self._output
+        root_get = self._goto[0].get
+        length = len(text)
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch) or root_get(ch, 0)
+            if not output[state]:
+                continue
+            for size, payload, check_start, check_end in output[state]:
+                start = i - size + 1
+                if check_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if check_end and i + 1 < length and _is_word_char(text[i + 1]):
+                    continue
+                yield start, i + 1, payload
+
+    def find_all(self, text):
+        """Return the distinct payloads found in text, in first-seen order."""
+        return list(dict.fromkeys(payload for _, _, payload in self.iter_matches(text)))
+
@@ -0,0 +1,179 @@
+"""
+Central skill taxonomy.
+Assigns every canonical skill a dense integer ID and maps aliases onto it,
+so parsers, the ranker and caches all compare small integers.
+"""
+
+from array import array
+from skill_matcher import SkillMatcher
+
+# Bump whenever skills or aliases change; cached parse results depend on it
+TAXONOMY_VERSION = 1
+
+# (canonical skill, aliases) - the position in this list is the skill ID
+SKILL_TAXONOMY = [
+    ("python", []),
+    ("java", []),
+    ("javascript", []),
+    ("typescript", []),
+    ("c++", ["cpp"]),
+    ("c#", ["csharp"]),
+    ("ruby", []),
+    ("php", []),
+    ("go", ["golang"]),
+    ("rust", []),
+    ("machine learning", ["ml"]),
+    ("deep learning", []),
+    ("artificial intelligence", ["ai"]),
+    ("sql", []),
+    ("mysql", []),
+    ("postgresql", ["postgres"]),
+    ("mongodb", ["mongo"]),
+    ("nosql", []),
+    ("cassandra", []),
+    ("hbase", []),
+    ("aws", ["amazon web services"]),
+    ("azure", []),
+    ("google cloud", ["gcp", "google cloud platform"]),
+    ("docker", []),
+    ("kubernetes", ["k8s"]),
+    ("react", ["reactjs", "react.js"]),
+    ("vue", ["vuejs", "vue.js"]),
+    ("angular", ["angularjs"]),
+    ("node.js", ["nodejs"]),
+    ("express", ["expressjs", "express.js"]),
+    ("tensorflow", []),
+    ("pytorch", []),
+    ("keras", []),
+    ("scikit-learn", ["sklearn", "scikit learn"]),
+    ("pandas", []),
+    ("numpy", []),
+    ("html", ["html5"]),
+    ("css", ["css3"]),
+    ("bootstrap", []),
+    ("tailwind", ["tailwindcss"]),
+    ("git", []),
+    ("github", []),
+    ("gitlab", []),
+    ("bitbucket", []),
+    ("jenkins", []),
+    ("ci/cd", ["cicd", "continuous integration"]),
+    ("devops", []),
+    ("api", ["apis"]),
+    ("rest", ["restful"]),
+    ("graphql", []),
+    ("linux", []),
+    ("windows", []),
+    ("unix", []),
+    ("excel", []),
+    ("tableau", []),
+    ("powerbi", ["power bi"]),
+    ("visualization", ["data visualization"]),
+    ("agile", []),
+    ("scrum", []),
+    ("jira", []),
+    ("communication", []),
+    ("leadership", []),
+    ("teamwork", []),
+    ("nlp", ["natural language processing"]),
+    ("computer vision", []),
+    ("opencv", []),
+]
+
+
+class SkillTaxonomy:
+    """
+    Canonical skills with dense integer IDs and alias resolution.
+
+    Attributes:
+        names: Canonical skill name for each ID
+        ids: Lowercase surface form (canonical or alias) to ID
+    """
+
+    def __init__(self, entries=SKILL_TAXONOMY, version=TAXONOMY_VERSION):
+        self.version = version
+        self.names = []
+        self.ids = {}
+        for canonical, aliases in entries:
+            skill_id = len(self.names)
+            self.names.append(canonical)
+            for form in [canonical] + list(aliases):
+                self.ids.setdefault(form.lower(), skill_id)
+        self._matcher = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def id_of(self, skill):
+        """Return the ID for a canonical name or alias, or None if unknown."""
+        return self.ids.get(skill.lower()) if skill else None
+
+    def canonical(self, skill):
+        """Return the canonical name for a skill or alias, or None if unknown."""
+        skill_id = self.id_of(skill)
+        return self.names[skill_id] if skill_id is not None else None
+
+    def encode(self, skills):
+        """Encode skill names or aliases as a sorted, de-duplicated array('H')."""
+        found = {self.ids[s.lower()] for s in skills if s and s.lower() in self.ids}
+        return array("H", sorted(found))
+
+    def decode(self, skill_ids):
+        """Return canonical names for a sequence of IDs."""
+        return [self.names[i] for i in skill_ids]
+
+    def to_bitset(self, skill_ids):
+        """Pack IDs into an integer bitset (bit i set for skill ID i)."""
+        bits = 0
+        for skill_id in skill_ids:
+            bits |= 1 << skill_id
+        return bits
+
+    def from_bitset(self, bits):
+        """Return the sorted IDs set in an integer bitset."""
+        return array("H", (i for i in range(len(self.names)) if bits >> i & 1))
+
+    @property
+    def matcher(self):
+        """Single-pass matcher over every surface form, reporting skill IDs."""
+        if self._matcher is None:
+            matcher = SkillMatcher()
+            for form, skill_id in self.ids.items():
+                matcher.add(form, payload=skill_id)
+            self._matcher = matcher.build()
+        return self._matcher
+
+    def extract_ids(self, text):
+        """
+        Find every skill mentioned in lowercase text.
+
+        Args:
+            text: Lowercase document text
+
+        Returns:
+            Sorted array('H') of skill IDs
+        """
+        return array("H", sorted(set(self.matcher.find_all(text))))
+
+
+DEFAULT_TAXONOMY = SkillTaxonomy()
+
+# Canonical skill names in ID order
+SKILL_LIST = list(DEFAULT_TAXONOMY.names)
+
+# Degree keywords reported in a resume's education field
+DEGREE_KEYWORDS = [
+    "bachelor", "bachelor's", "bs", "b.s.", "b.a.",
+    "master", "master's", "ms", "m.s.", "m.a.", "mba",
+    "phd", "ph.d.", "doctorate", "doctoral",
+    "associate", "a.s.", "diploma",
+    "bootcamp", "certification", "certified"
+]
+
+# Certification keywords reported in a resume's certifications field
+CERTIFICATION_KEYWORDS = [
+    "aws certified", "azure certified", "gcp certified",
+    "pmp", "ciscp", "scrum master", "cpa", "cfa",
+    "certified", "certificate",
+    "comptia", "ccna", "ccnp"
+]
@@ -2,6 +2,34 @@ import re
 import docx
 import PyPDF2
 import io
+import mmap
+import zipfile
+import xml.etree.ElementTree as ET
+import pandas as pd
+
+try:
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+# Characters of resume text collected before extraction stops; comfortably
+# more than any real resume, so only long portfolios are cut short
+MAX_RESUME_CHARS = 30000
+
+# Bump whenever an extractor returns different text for the same file bytes
+EXTRACTOR_VERSION = 3
+
+# Resource exhaustion (e.g. the isolated workers' RLIMIT_AS cap) is not an
+# unreadable file; extractors re-raise these instead of returning ""
+RESOURCE_ERRORS = (MemoryError, RecursionError)
+
+# WordprocessingML tags read by the streaming DOCX extractor
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_PARAGRAPH = _W + "p"
+_DOCX_TEXT = _W + "t"
+_DOCX_SPACING = (_W + "tab", _W + "br", _W + "cr")
+# Legacy copy of drawing content (e.g. VML text boxes) that repeats mc:Choice
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
 
 # ============ TEXT CLEANING ============
 def cleanResume(txt):
@@ -29,113 +57,329 @@ def clean_text(text):
 
 
 # ============ FILE EXTRACTORS ============
-def extract_pdf(file_obj):
+def iter_pdf_pages(file_obj, max_pages=None):
+    """
+    Yield the text of each PDF page, extracting pages only as they are consumed.
+    
+    Args:
+        file_obj: File object, path string or BytesIO object
+        max_pages: Optional number of pages to read at most
+    
+    Yields:
+        Text of each page (possibly empty)
+    """
+    if isinstance(file_obj, str):
+        # The reader pulls objects from the mapped file on demand, so the
+        # mapping must stay open until the caller stops iterating
+        with open(file_obj, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from _iter_reader_pages(PyPDF2.PdfReader(buffer), max_pages)
+    else:
+        yield from _iter_reader_pages(PyPDF2.PdfReader(file_obj), max_pages)
+
+
+def _iter_reader_pages(reader, max_pages):
+    """Yield page text from an open PdfReader."""
+    for page_num, page in enumerate(reader.pages):
+        if max_pages is not None and page_num >= max_pages:
+            return
+        yield page.extract_text() or ""
+
+
+def extract_pdf(file_obj, max_chars=None, max_pages=None):
     """
     Extract text from PDF file.
     
     Args:
         file_obj: File object or file path string or BytesIO object
+        max_chars: Optional character budget; remaining pages are skipped once reached
+        max_pages: Optional page budget
     
     Returns:
         Extracted text string
     """
     try:
-        if isinstance(file_obj, str):
-            with open(file_obj, 'rb') as f:
-                file_obj = f
-                reader = PyPDF2.PdfReader(file_obj)
-        else:
-            reader = PyPDF2.PdfReader(file_obj)
-
-        text = ""
-        for page_num in range(len(reader.pages)):
-            page = reader.pages[page_num]
-            page_text = page.extract_text()
+        parts = []
+        collected = 0
+        for page_text in iter_pdf_pages(file_obj, max_pages):
             if page_text:
-                text += page_text + " "
+                parts.append(page_text)
+                collected += len(page_text) + 1
+                if max_chars is not None and collected >= max_chars:
+                    break
 
-        return text.strip()
+        text = " ".join(parts).strip()
+        return text[:max_chars] if max_chars is not None else text
+    except RESOURCE_ERRORS:
+        raise
     except Exception as e:
         print(f"Error extracting PDF: {str(e)}")
         return ""
 
 
-def extract_docx(file_obj):
+def iter_docx_paragraphs(file_obj):
+    """
+    Yield paragraph text from a DOCX by streaming word/document.xml.
+    
+    Body paragraphs, table cells and text boxes are all read; each element
+    is cleared once consumed so memory stays flat on large documents.
+    
+    Args:
+        file_obj: File object, path string or BytesIO object
+    
+    Yields:
+        Non-empty paragraph text in document order
+    """
+    with zipfile.ZipFile(file_obj) as archive, archive.open("word/document.xml") as xml:
+        runs = []
+        fallback_depth = 0
+        for event, elem in ET.iterparse(xml, events=("start", "end")):
+            tag = elem.tag
+            if tag == _MC_FALLBACK:
+                fallback_depth += 1 if event == "start" else -1
+                if event == "end":
+                    elem.clear()
+                continue
+            if event == "start" or fallback_depth:
+                continue
+            
+            if tag == _DOCX_TEXT:
+                runs.append(elem.text or "")
+            elif tag in _DOCX_SPACING:
+                runs.append(" ")
+            elif tag == _DOCX_PARAGRAPH:
+                text = "".join(runs).strip()
+                runs = []
+                elem.clear()
+                if text:
+                    yield text
+
+
+def extract_docx(file_obj, max_chars=None):
     """
     Extract text from DOCX file.
     
+    Reads the document XML directly and only falls back to python-docx
+    when the package cannot be streamed.
+    
     Args:
         file_obj: File object or file path string
+        max_chars: Optional character budget; the rest of the document is skipped once reached
     
     Returns:
         Extracted text string
     """
     try:
-        if isinstance(file_obj, str):
-            doc = docx.Document(file_obj)
-        else:
-            doc = docx.Document(file_obj)
+        parts = []
+        collected = 0
+        for paragraph in iter_docx_paragraphs(file_obj):
+            parts.append(paragraph)
+            collected += len(paragraph) + 1
+            if max_chars is not None and collected >= max_chars:
+                break
+        
+        text = " ".join(parts)
+        return text[:max_chars] if max_chars is not None else text
+    except RESOURCE_ERRORS:
+        raise
+    except Exception:
+        if hasattr(file_obj, "seek"):
+            file_obj.seek(0)
+        return extract_docx_document(file_obj)
+
 
+def extract_docx_document(file_obj):
+    """
+    Extract paragraph text from DOCX file through the python-docx object model.
+    
+    Args:
+        file_obj: File object or file path string
+    
+    Returns:
+        Extracted text string
+    """
+    try:
+        doc = docx.Document(file_obj)
         text = " ".join([p.text for p in doc.paragraphs if p.text.strip()])
         return text.strip()
+    except RESOURCE_ERRORS:
+        raise
     except Exception as e:
         print(f"Error extracting DOCX: {str(e)}")
         return ""
 
 
-def extract_txt(file_obj):
+def extract_txt(file_obj, max_chars=None):
     """
     Extract text from TXT file.
     
     Args:
         file_obj: File object or file path string
+        max_chars: Optional character budget
     
     Returns:
         Extracted text string
     """
     try:
         if isinstance(file_obj, str):
-            with open(file_obj, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.read().strip()
+            with open(file_obj, 'rb') as f:
+                data = f.read()
+        elif isinstance(file_obj, (bytes, bytearray)):
+            data = bytes(file_obj)
+        else:
+            data = file_obj.read()
+        
+        if data.startswith((b"\xff\xfe", b"\xfe\xff")):
+            text = data.decode('utf-16', errors='ignore').strip()
         else:
-            if isinstance(file_obj, bytes):
-                return file_obj.decode('utf-8', errors='ignore').strip()
-            else:
-                return file_obj.read().decode('utf-8', errors='ignore').strip()
+            text = data.decode('utf-8-sig', errors='ignore').strip()
+        return text[:max_chars] if max_chars is not None else text
+    except RESOURCE_ERRORS:
+        raise
     except Exception as e:
         print(f"Error extracting TXT: {str(e)}")
         return ""
 
 
-def extract_from_file(file_obj, file_type=None):
+# ============ FORMAT DETECTION ============
+# file type -> extractor(file_obj, max_chars=None), filled by register_extractor
+EXTRACTORS = {}
+# Types whose content is plain text, so only the declared type can tell them apart
+TEXT_FORMATS = set()
+# (leading bytes, file type) pairs checked in registration order
+_SIGNATURES = []
+# (archive member, file type) pairs telling ZIP-based formats apart
+_ZIP_MARKERS = []
+_ZIP_MAGIC = b"PK\x03\x04"
+_SNIFF_BYTES = 2048
+# Bytes that appear in text files; anything else in the head marks a binary
+_TEXT_BYTES = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+
+
+def register_extractor(file_type, extractor, signatures=(), zip_member=None, text=False):
     """
-    Extract text from file based on file type.
+    Register a text extractor for a file format.
+    
+    Args:
+        file_type: Format name, e.g. 'rtf'
+        extractor: Callable(file_obj, max_chars=None) returning text
+        signatures: Magic byte prefixes that identify the format
+        zip_member: Archive member identifying a ZIP-based format
+            (e.g. 'content.xml' for ODT)
+        text: True for plain-text formats (HTML, Markdown) that are
+            recognized by their declared type rather than their bytes
+    """
+    EXTRACTORS[file_type] = extractor
+    for signature in signatures:
+        _SIGNATURES.append((signature, file_type))
+    if zip_member is not None:
+        _ZIP_MARKERS.append((zip_member, file_type))
+    if text:
+        TEXT_FORMATS.add(file_type)
+
+
+def _read_head(file_obj, size=_SNIFF_BYTES):
+    """Read the first bytes of a path, bytes or seekable file without consuming it."""
+    if isinstance(file_obj, str):
+        with open(file_obj, 'rb') as f:
+            return f.read(size)
+    if isinstance(file_obj, (bytes, bytearray)):
+        return bytes(file_obj[:size])
+    position = file_obj.tell()
+    head = file_obj.read(size)
+    file_obj.seek(position)
+    return head
+
+
+def looks_like_text(head):
+    """True when a byte sample has no control bytes outside normal whitespace."""
+    return not head.translate(None, _TEXT_BYTES)
+
+
+def sniff_file_type(file_obj):
+    """
+    Detect a file's format from its content.
+    
+    Args:
+        file_obj: File object, path string or bytes
+    
+    Returns:
+        Registered file type, 'txt' for unrecognized text, or None for
+        binary content no extractor understands
+    """
+    head = _read_head(file_obj)
+    for signature, file_type in _SIGNATURES:
+        if head.startswith(signature):
+            return file_type
+    
+    if head.startswith(_ZIP_MAGIC):
+        try:
+            if isinstance(file_obj, (bytes, bytearray)):
+                file_obj = io.BytesIO(file_obj)
+            position = None if isinstance(file_obj, str) else file_obj.tell()
+            with zipfile.ZipFile(file_obj) as archive:
+                names = set(archive.namelist())
+            if position is not None:
+                file_obj.seek(position)
+        except zipfile.BadZipFile:
+            return None
+        for member, file_type in _ZIP_MARKERS:
+            if member in names:
+                return file_type
+        return None
+    
+    return "txt" if looks_like_text(head) else None
+
+
+def _declared_type(file_obj, file_type):
+    """File type given by the caller or implied by a path or file name."""
+    if file_type:
+        return file_type
+    name = file_obj if isinstance(file_obj, str) else getattr(file_obj, 'name', None)
+    if isinstance(name, str) and '.' in name:
+        return name.rsplit('.', 1)[-1].lower()
+    return None
+
+
+def extract_from_file(file_obj, file_type=None, max_chars=None):
+    """
+    Extract text from file based on its content.
+    
+    The format is sniffed from the leading bytes, so a PDF named .txt is
+    still read as a PDF and binaries no extractor understands return ""
+    instead of being decoded into garbage. The declared type only chooses
+    between plain-text formats.
     
     Args:
         file_obj: File object, path string, or bytes
-        file_type: Optional file type ('pdf', 'docx', 'txt')
+        file_type: Optional declared file type ('pdf', 'docx', 'txt')
+        max_chars: Optional character budget
     
     Returns:
         Extracted text string
     """
-    if file_type == 'pdf' or (isinstance(file_obj, str) and file_obj.lower().endswith('.pdf')):
-        return extract_pdf(file_obj)
-    elif file_type == 'docx' or (isinstance(file_obj, str) and file_obj.lower().endswith('.docx')):
-        return extract_docx(file_obj)
-    elif file_type == 'txt' or (isinstance(file_obj, str) and file_obj.lower().endswith('.txt')):
-        return extract_txt(file_obj)
-    else:
-        # Try to detect from content
-        if hasattr(file_obj, 'name'):
-            name = file_obj.name.lower()
-            if name.endswith('.pdf'):
-                return extract_pdf(file_obj)
-            elif name.endswith('.docx'):
-                return extract_docx(file_obj)
-            else:
-                return extract_txt(file_obj)
-        else:
-            return extract_txt(file_obj)
+    try:
+        if isinstance(file_obj, (bytes, bytearray)):
+            file_obj = io.BytesIO(file_obj)
+        detected = sniff_file_type(file_obj)
+    except RESOURCE_ERRORS:
+        raise
+    except Exception as e:
+        print(f"Error reading file: {str(e)}")
+        return ""
+    
+    if detected is None:
+        print("Error extracting file: unrecognized binary format")
+        return ""
+    if detected == 'txt':
+        declared = _declared_type(file_obj, file_type)
+        if declared in TEXT_FORMATS:
+            detected = declared
+    return EXTRACTORS[detected](file_obj, max_chars=max_chars)
+
+
+register_extractor('pdf', extract_pdf, signatures=(b"%PDF",))
+register_extractor('docx', extract_docx, zip_member="word/document.xml")
+register_extractor('txt', extract_txt, signatures=(b"\xef\xbb\xbf", b"\xff\xfe", b"\xfe\xff"), text=True)
 
 
 # ============ RESUME DETECTION ============
@@ -198,6 +442,68 @@ def validate_text(text, min_length=100):
     return True, "Valid"
 
 
+# ============ CSV STREAMING ============
+def iter_csv_batches(file_obj, columns=("Resume", "Candidate"), batch_size=2000):
+    """
+    Read a CSV incrementally, yielding fixed-size batches of selected columns.
+    Uses the pyarrow streaming reader when pyarrow is installed and pandas
+    chunked reading otherwise; only one batch is held in memory at a time.
+    
+    Args:
+        file_obj: File object or path of the CSV
+        columns: Columns to keep; missing columns come back as None values
+        batch_size: Rows per batch
+    
+    Yields:
+        Dictionary mapping each column to a list of batch_size values
+        (the last batch may be shorter)
+    """
+    if pa_csv is not None:
+        yield from _iter_csv_batches_arrow(file_obj, columns, batch_size)
+        return
+
+    for chunk in pd.read_csv(file_obj, chunksize=batch_size, usecols=lambda c: c in columns, dtype=str):
+        yield {
+            col: chunk[col].where(chunk[col].notna(), None).tolist() if col in chunk.columns
+            else [None] * len(chunk)
+            for col in columns
+        }
+
+
+def _iter_csv_batches_arrow(file_obj, columns, batch_size):
+    """pyarrow implementation of iter_csv_batches."""
+    import pyarrow as pa
+
+    reader = pa_csv.open_csv(
+        file_obj,
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=list(columns),
+            include_missing_columns=True,
+            column_types={col: pa.string() for col in columns}
+        )
+    )
+
+    pending = []
+    pending_rows = 0
+    for record_batch in reader:
+        pending.append(record_batch)
+        pending_rows += record_batch.num_rows
+        while pending_rows >= batch_size:
+            table = pa.Table.from_batches(pending)
+            yield _columns_of(table.slice(0, batch_size), columns)
+            rest = table.slice(batch_size)
+            pending = rest.to_batches()
+            pending_rows = rest.num_rows
+    if pending_rows:
+        yield _columns_of(pa.Table.from_batches(pending), columns)
+
+
+def _columns_of(table, columns):
+    """Convert selected columns of an Arrow table to Python lists."""
+    return {col: table.column(col).to_pylist() for col in columns}
+
+
 # ============ UTILITY FUNCTIONS ============
 def get_file_size_mb(file_obj):
     """Get file size in MB."""
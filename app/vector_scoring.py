@@ -0,0 +1,250 @@
+"""
+Vectorized candidate scoring.
+Encodes parsed resumes as packed skill bit-matrices and NumPy columns so a
+whole candidate pool can be scored against a job in a few array operations.
+"""
+
+import numpy as np
+from job_parser import EDUCATION_LEVELS
+
+# Number of set bits for every possible byte value (fallback for older NumPy)
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount_rows(bits):
+    """Count set bits per row of a packed uint8 matrix."""
+    if hasattr(np, "bitwise_count"):
+        counts = np.bitwise_count(bits)
+    else:
+        counts = _POPCOUNT_TABLE[bits]
+    return counts.sum(axis=1, dtype=np.int32)
+
+
+def education_ordinal(education):
+    """Highest EDUCATION_LEVELS rank found in a resume's education list."""
+    return max((EDUCATION_LEVELS.get(e.lower(), 0) for e in education or []), default=0)
+
+
+class SkillVocabulary:
+    """
+    Fixed mapping from skill name to bit position.
+    Unknown skills are appended on demand so encodings stay stable.
+    """
+
+    def __init__(self, skills=(), taxonomy=None):
+        self.skills = []
+        self.index = {}
+        self.taxonomy = taxonomy
+        for skill in skills:
+            self.add(skill)
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy):
+        """Vocabulary whose bit positions equal the taxonomy's skill IDs."""
+        return cls(taxonomy.names, taxonomy=taxonomy)
+
+    def __len__(self):
+        return len(self.skills)
+
+    def add(self, skill):
+        """Return the bit position of a skill, registering it if needed."""
+        position = self.index.get(skill)
+        if position is None:
+            position = len(self.skills)
+            self.index[skill] = position
+            self.skills.append(skill)
+        return position
+
+    @property
+    def n_bytes(self):
+        """Width of a packed row in bytes."""
+        return max((len(self.skills) + 7) // 8, 1)
+
+    def encode(self, skills):
+        """Encode a collection of skills as one packed uint8 row."""
+        row = np.zeros(self.n_bytes * 8, dtype=bool)
+        for skill in skills:
+            position = self.index.get(skill)
+            if position is not None:
+                row[position] = True
+        return np.packbits(row)
+
+    def decode(self, packed_row):
+        """Return the skill names set in a packed row."""
+        positions = np.flatnonzero(np.unpackbits(packed_row)[:len(self.skills)])
+        return [self.skills[p] for p in positions]
+
+
+class CandidateMatrix:
+    """
+    Column-oriented view of a candidate pool.
+
+    Attributes:
+        skill_bits: (N, n_bytes) packed uint8 skill matrix
+        experience: (N,) float64 years of experience
+        education: (N,) int8 highest education rank
+        resumes: Original resume dictionaries, used to materialize rows
+    """
+
+    def __init__(self, vocabulary, skill_bits, experience, education, resumes=None):
+        self.vocabulary = vocabulary
+        self.skill_bits = skill_bits
+        self.experience = experience
+        self.education = education
+        self.resumes = resumes
+
+    def __len__(self):
+        return len(self.experience)
+
+    @classmethod
+    def from_resumes(cls, resumes, vocabulary=None):
+        """
+        Encode parsed resumes into a CandidateMatrix.
+
+        Args:
+            resumes: List of resume dictionaries (output from ResumeParser)
+            vocabulary: Optional SkillVocabulary to encode against
+
+        Returns:
+            CandidateMatrix
+        """
+        vocabulary = vocabulary if vocabulary is not None else SkillVocabulary()
+        resumes = [r for r in resumes if r]
+
+        # Register every skill first so all rows share one packed width;
+        # taxonomy skill IDs already are bit positions and need no lookup
+        aligned = vocabulary.taxonomy is not None
+        positions = [
+            list(r["skill_ids"]) if aligned and "skill_ids" in r
+            else [vocabulary.add(s) for s in r.get("skills", [])]
+            for r in resumes
+        ]
+
+        dense = np.zeros((len(resumes), vocabulary.n_bytes * 8), dtype=bool)
+        for row, cols in enumerate(positions):
+            dense[row, cols] = True
+
+        return cls(
+            vocabulary,
+            np.packbits(dense, axis=1),
+            np.array([r.get("total_experience_years", 0) or 0 for r in resumes], dtype=np.float64),
+            np.array([education_ordinal(r.get("education")) for r in resumes], dtype=np.int8),
+            resumes
+        )
+
+
+class BatchScores:
+    """
+    Score columns for the scored candidates of a CandidateMatrix.
+    Positions index the score arrays; rows maps them back to matrix rows
+    when only a retrieved subset was scored.
+    """
+
+    def __init__(self, matrix, profile, skills, experience, education, overall, entry_builder, rows=None):
+        self.matrix = matrix
+        self.rows = rows
+        self.entry_builder = entry_builder
+        self.profile = profile
+        self.skills = skills
+        self.experience = experience
+        self.education = education
+        self.overall = overall
+
+    def __len__(self):
+        return len(self.overall)
+
+    def order(self):
+        """Row indices sorted by overall score, best first."""
+        return np.argsort(-self.overall, kind="stable")
+
+    def top_k(self, k, min_score=0):
+        """
+        Row indices of the k best candidates scoring at least min_score.
+        Uses a partition to find the k-th best score, so only rows reaching
+        it are sorted; ties go to the earlier row, as in TopKCollector.
+
+        Args:
+            k: Maximum number of rows to return
+            min_score: Minimum rounded overall score to keep a row
+
+        Returns:
+            Row indices sorted by overall score, best first
+        """
+        overall = np.round(self.overall, 2)
+        rows = np.flatnonzero(overall >= min_score)
+        if k <= 0:
+            return rows[:0]
+        if k < len(rows):
+            # Keep every row tied with the k-th score so the cut is made by row order
+            kth = -np.partition(-overall[rows], k - 1)[k - 1]
+            rows = rows[overall[rows] >= kth]
+        return rows[np.lexsort((rows, -overall[rows]))][:k]
+
+    def materialize(self, rows):
+        """
+        Build ranked result dictionaries for the given rows only.
+
+        Args:
+            rows: Iterable of positions returned by order() or top_k()
+
+        Returns:
+            List of dictionaries shaped like CandidateRanker.rank_candidates output
+        """
+        return [
+            self.entry_builder(
+                self.matrix.resumes[row if self.rows is None else int(self.rows[row])],
+                self.profile,
+                float(self.skills[row]),
+                float(self.experience[row]),
+                float(self.education[row]),
+                float(self.overall[row])
+            )
+            for row in rows
+        ]
+
+
+def score_matrix(matrix, profile, skill_weight, experience_weight, education_weight, entry_builder,
+                 rows=None):
+    """
+    Score candidates in a matrix against a JobProfile.
+
+    Args:
+        matrix: CandidateMatrix
+        profile: JobProfile
+        skill_weight, experience_weight, education_weight: Scoring weights
+        entry_builder: Callable that turns one scored row into a result dict
+        rows: Optional sorted row subset to score instead of the whole matrix
+
+    Returns:
+        BatchScores
+    """
+    skill_bits, years, ranks = matrix.skill_bits, matrix.experience, matrix.education
+    if rows is not None:
+        skill_bits, years, ranks = skill_bits[rows], years[rows], ranks[rows]
+    n = len(years)
+
+    if profile.skill_set:
+        jd_mask = matrix.vocabulary.encode(profile.skill_set)
+        width = skill_bits.shape[1]
+        matched = popcount_rows(skill_bits & jd_mask[:width])
+        skills = (matched / len(profile.skill_set)) * 100
+    else:
+        skills = np.full(n, 100.0)
+
+    if profile.required_experience:
+        experience = np.minimum(years / profile.required_experience, 1.0) * 100
+    else:
+        experience = np.full(n, 100.0)
+
+    if profile.education_rank:
+        education = np.minimum(ranks / profile.education_rank, 1.0) * 100
+    else:
+        education = np.full(n, 100.0)
+
+    overall = (
+        skill_weight * skills +
+        experience_weight * experience +
+        education_weight * education
+    )
+
+    return BatchScores(matrix, profile, skills, experience, education, overall, entry_builder, rows)
@@ -0,0 +1,76 @@
+"""
+Benchmark classifier cold start: unpickling the fitted sklearn objects vs.
+memory-mapping the array artifacts. Each load runs in a fresh interpreter,
+as a new scoring worker would, and reports load time and resident memory.
+
+Usage:
+    python model/train_model.py          # writes both formats
+    python benchmarks/bench_model_load.py [model_dir] [repeats]
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+WORKER = """
+import json, sys, time
+sys.path.insert(0, {app!r})
+import model_service
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * 4096 / 1024 / 1024
+
+import pandas as pd
+texts = [str(t) for t in pd.read_csv({data!r})["Resume"].dropna()[:50]]
+model_service.has_artifacts = lambda model_dir: {compact}
+
+before = rss_mb()
+start = time.perf_counter()
+service = model_service.ModelService({model_dir!r})
+assert service.available, service.error
+loaded = time.perf_counter()
+labels = service.predict_categories(texts)
+predicted = time.perf_counter()
+print(json.dumps({{
+    "load_ms": (loaded - start) * 1000,
+    "predict_ms": (predicted - loaded) * 1000,
+    "rss_mb": rss_mb() - before,
+    "labels": labels,
+}}))
+"""
+
+
+def run_worker(model_dir, compact):
+    """Load the model in a fresh interpreter and return its measurements."""
+    code = WORKER.format(
+        app=str(PROJECT_ROOT / "app"),
+        data=str(PROJECT_ROOT / "data" / "resumes.csv"),
+        model_dir=str(model_dir),
+        compact=compact,
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    model_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else PROJECT_ROOT / "model"
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    results = {}
+    for name, compact in (("pickle", False), ("mmap arrays", True)):
+        runs = [run_worker(model_dir, compact) for _ in range(repeats)]
+        results[name] = runs
+        print(f"{name:<12} load {min(r['load_ms'] for r in runs):7.1f} ms | "
+              f"predict 50 {min(r['predict_ms'] for r in runs):6.1f} ms | "
+              f"RSS +{min(r['rss_mb'] for r in runs):6.1f} MB")
+
+    same = results["pickle"][0]["labels"] == results["mmap arrays"][0]["labels"]
+    print(f"Same predictions: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark resume parsing: per-field scans vs. the fused single-scan extractor.
+
+Usage:
+    python benchmarks/bench_parsing.py [path/to/resumes.csv] [repeats]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "app"))
+
+from resume_parser import ResumeParser
+from utils import cleanResume
+from bench_patterns import legacy_extract
+
+
+def legacy_parse(parser, text):
+    """The pre-fusion pipeline: clean the text, then one scan per field."""
+    text_lower = text.lower()
+    text_clean = cleanResume(text_lower)
+    experience_years, email, phone = legacy_extract(text, text_clean)
+    return {
+        "skills": [skill for skill in parser.SKILL_LIST if skill in text_lower],
+        "total_experience_years": experience_years,
+        "email": email,
+        "phone": phone,
+        "education": parser._extract_education(text_lower),
+        "certifications": parser._extract_certifications(text_lower),
+        "raw_text": text[:1000],
+        "text_length": len(text)
+    }
+
+
+def time_per_document(func, texts, repeats):
+    """Best-of-N wall time per document, in microseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts) * 1e6
+
+
+def main():
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else PROJECT_ROOT / "data" / "resumes.csv"
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    texts = [str(t) for t in pd.read_csv(csv_path)["Resume"].dropna()]
+    parser = ResumeParser()
+
+    legacy = time_per_document(lambda t: legacy_parse(parser, t), texts, repeats)
+    fused = time_per_document(parser.extractor.extract, texts, repeats)
+
+    print(f"Documents: {len(texts)} (avg {sum(map(len, texts)) / len(texts):.0f} chars)")
+    print(f"Per-field scans: {legacy:8.1f} us/doc")
+    print(f"Fused extractor: {fused:8.1f} us/doc")
+    print(f"Speedup:         {legacy / fused:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
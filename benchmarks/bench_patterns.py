@@ -0,0 +1,89 @@
+"""
+Micro-benchmark for experience/email/phone extraction: raw pattern strings
+searched one after another vs. the shared precompiled patterns module.
+
+Usage:
+    python benchmarks/bench_patterns.py [path/to/resumes.csv] [repeats]
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "app"))
+
+from patterns import find_experience, find_contacts
+from utils import cleanResume
+
+
+def legacy_extract(text, text_clean):
+    """The original per-call pattern strings, tried one after another."""
+    years = 0
+    for pattern in [
+        r'(\d+)\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)',
+        r'(\d+)\+?\s+years',
+        r'(\d+)\+?\s+yrs'
+    ]:
+        match = re.search(pattern, text_clean, re.IGNORECASE)
+        if match:
+            years = min(int(match.group(1)), 60)
+            break
+
+    match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
+    email = match.group(0) if match else None
+
+    phone = None
+    for pattern in [
+        r'(?:\+1)?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
+        r'\+[0-9]{1,3}[-.\s]?[0-9]{1,14}'
+    ]:
+        match = re.search(pattern, text)
+        if match:
+            phone = match.group(0)
+            break
+
+    return years, email, phone
+
+
+def shared_extract(text, text_clean):
+    """The shared compiled patterns."""
+    return (find_experience(text_clean),) + find_contacts(text)
+
+
+def time_per_document(func, docs, repeats):
+    """Best-of-N wall time per document, in microseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for text, text_clean in docs:
+            func(text, text_clean)
+        best = min(best, time.perf_counter() - start)
+    return best / len(docs) * 1e6
+
+
+def main():
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else PROJECT_ROOT / "data" / "resumes.csv"
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    texts = [str(t) for t in pd.read_csv(csv_path)["Resume"].dropna()]
+    docs = [(t, cleanResume(t.lower())) for t in texts]
+    byte_docs = [(t.encode("utf-8"), c.encode("utf-8")) for t, c in docs]
+
+    mismatches = sum(legacy_extract(*d) != shared_extract(*d) for d in docs)
+
+    legacy = time_per_document(legacy_extract, docs, repeats)
+    shared = time_per_document(shared_extract, docs, repeats)
+    shared_bytes = time_per_document(shared_extract, byte_docs, repeats)
+
+    print(f"Documents: {len(docs)} (mismatching results: {mismatches})")
+    print(f"Raw pattern strings:   {legacy:8.1f} us/doc")
+    print(f"Shared patterns (str): {shared:8.1f} us/doc  ({legacy / shared:.2f}x)")
+    print(f"Shared patterns (bytes): {shared_bytes:6.1f} us/doc  ({legacy / shared_bytes:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
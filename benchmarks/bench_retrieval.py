@@ -0,0 +1,86 @@
+"""
+Benchmark for index-based retrieval: scoring every candidate in a synthetic
+pool vs. scoring only the rows the inverted skill index says can reach
+the minimum score.
+
+Usage:
+    python benchmarks/bench_retrieval.py [pool_size] [repeats]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "app"))
+
+from matcher import CandidateRanker
+from skill_index import SkillIndex
+from vector_scoring import CandidateMatrix
+
+JOBS = {
+    "niche": "Needs opencv, computer vision, keras, hbase and cassandra. "
+             "5+ years of experience. Master's degree.",
+    "broad": "Python, SQL, java and aws. 2 years of experience. Bachelor's degree.",
+}
+
+
+def synthetic_pool(ranker, size, seed=0):
+    """Candidates whose skills follow a Zipf-like popularity curve."""
+    taxonomy = ranker.job_parser.taxonomy
+    rng = np.random.default_rng(seed)
+    popularity = 1 / np.arange(1, len(taxonomy) + 1)
+    popularity /= popularity.sum()
+    degrees = [[], ["bachelor"], ["master"], ["phd"]]
+
+    resumes = []
+    for i in range(size):
+        ids = sorted(set(rng.choice(len(taxonomy), rng.integers(0, 8), p=popularity).tolist()))
+        resumes.append({
+            "skills": taxonomy.decode(ids),
+            "skill_ids": ids,
+            "total_experience_years": int(rng.integers(0, 15)),
+            "education": degrees[rng.integers(len(degrees))],
+            "candidate_name": f"Candidate {i + 1}",
+        })
+    return CandidateMatrix.from_resumes(resumes, ranker.vocabulary)
+
+
+def time_query(fn, repeats):
+    """Best wall time of fn over repeats, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    ranker = CandidateRanker()
+    matrix = synthetic_pool(ranker, size)
+    index = SkillIndex.from_matrix(matrix)
+
+    print(f"Pool: {size} candidates")
+    print(f"{'job':<6} {'min':>4} {'scored':>8} {'full ms':>8} {'index ms':>9} {'same':>5}")
+    for name, text in JOBS.items():
+        profile = ranker.compile_job(text)
+        for min_score in (40, 60, 70, 80, 90):
+            full = ranker.score_batch(matrix, profile)
+            pruned = ranker.score_batch(matrix, profile, min_score=min_score, index=index)
+            same = full.materialize(full.top_k(50, min_score)) == pruned.materialize(pruned.top_k(50, min_score))
+
+            full_ms = time_query(lambda: ranker.score_batch(matrix, profile), repeats)
+            index_ms = time_query(
+                lambda: ranker.score_batch(matrix, profile, min_score=min_score, index=index), repeats
+            )
+            print(f"{name:<6} {min_score:>4} {len(pruned):>8} {full_ms:>8.1f} {index_ms:>9.1f} {str(same):>5}")
+
+
+if __name__ == "__main__":
+    main()
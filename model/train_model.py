@@ -6,25 +6,60 @@ Classifies resumes into predefined job categories.
 import pandas as pd
 import numpy as np
 import re
+import io
+import json
+import hashlib
 import pickle
 import os
+import shutil
+import sys
+import tempfile
+import argparse
 from pathlib import Path
+from sklearn.base import clone
+from sklearn.dummy import DummyClassifier
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.preprocessing import LabelEncoder
 from sklearn.svm import LinearSVC
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
 from sklearn.pipeline import Pipeline
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import GridSearchCV, ParameterGrid, StratifiedKFold, train_test_split
 from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 MODEL_DIR = PROJECT_ROOT / "model"
+CORPUS_CACHE_DIR = PROJECT_ROOT / ".cache" / "corpus"
+
+# Bump whenever cleanResume or the length filter changes its output
+CLEANER_VERSION = 1
+MIN_RESUME_LENGTH = 100
+CORPUS_FORMAT = ".parquet" if pyarrow is not None else ".pkl"
 
 # Create models directory if it doesn't exist
 MODEL_DIR.mkdir(exist_ok=True)
 
+sys.path.insert(0, str(PROJECT_ROOT / "app"))
+from model_artifacts import save_artifacts
+
+# Candidates compared by select_model: every TF-IDF setting with every classifier
+SELECTION_GRID = {
+    'tfidf__max_features': [1000, 5000],
+    'tfidf__ngram_range': [(1, 1), (1, 2)],
+    'clf': [
+        LinearSVC(max_iter=5000, random_state=42),
+        SGDClassifier(loss='hinge', random_state=42),
+        RandomForestClassifier(n_estimators=200, random_state=42),
+    ],
+}
+
 
 def cleanResume(txt):
     """Clean and normalize resume text."""
@@ -37,21 +72,37 @@ def cleanResume(txt):
     return txt.lower().strip()
 
 
-def load_data(csv_path):
-    """Load and preprocess training data."""
+def clean_corpus(df):
+    """Clean resume texts and drop the ones too short to learn from."""
+    df = df.copy()
+    df['Resume'] = df['Resume'].apply(cleanResume)
+    return df[df['Resume'].str.len() > MIN_RESUME_LENGTH].reset_index(drop=True)
+
+
+def load_data(csv_path, cache_dir=CORPUS_CACHE_DIR):
+    """
+    Load and preprocess training data.
+
+    Args:
+        csv_path: CSV with Category and Resume columns
+        cache_dir: Directory for cleaned corpus artifacts; None always re-cleans
+
+    Returns:
+        Cleaned DataFrame, or None on error
+    """
     try:
         print(f"Loading data from: {csv_path}")
+        if cache_dir is not None:
+            return load_cleaned_corpus(csv_path, cache_dir)
+
         df = pd.read_csv(csv_path)
         
         print(f"Loaded {len(df)} resumes")
         print(f"Categories: {df['Category'].unique()}")
         
-        # Clean resumes
+        # Clean resumes and remove empty ones
         print("Cleaning resumes...")
-        df['Resume'] = df['Resume'].apply(cleanResume)
-        
-        # Remove empty resumes
-        df = df[df['Resume'].str.len() > 100]
+        df = clean_corpus(df)
         print(f"After cleaning: {len(df)} valid resumes")
         
         return df
@@ -63,6 +114,119 @@ def load_data(csv_path):
         return None
 
 
+def load_cleaned_corpus(csv_path, cache_dir=CORPUS_CACHE_DIR):
+    """
+    Load the cleaned corpus of a CSV, cleaning only what is not cached yet.
+
+    Artifacts are keyed by a hash of the CSV bytes and CLEANER_VERSION, so
+    an unchanged file is loaded without cleaning. A manifest per source file
+    records the last cached size; when the file has only grown by appended
+    rows, just those rows are parsed and cleaned.
+
+    Args:
+        csv_path: CSV with Category and Resume columns
+        cache_dir: Directory for the artifacts and manifests
+
+    Returns:
+        Cleaned DataFrame
+    """
+    csv_path = Path(csv_path)
+    cache_dir = Path(cache_dir)
+    source_key = hashlib.blake2b(str(csv_path.resolve()).encode("utf-8"), digest_size=8).hexdigest()
+    manifest_path = cache_dir / f"{source_key}.json"
+
+    manifest = {}
+    if manifest_path.exists():
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    reusable = (manifest.get("cleaner_version") == CLEANER_VERSION
+                and manifest.get("format") == CORPUS_FORMAT
+                and (cache_dir / manifest.get("artifact", "")).is_file())
+
+    digest, prefix_digest, ends_with_newline = _hash_source(csv_path, manifest.get("size", 0) if reusable else 0)
+    artifact = cache_dir / f"corpus-{digest}-c{CLEANER_VERSION}{CORPUS_FORMAT}"
+
+    if artifact.exists():
+        df = _read_corpus(artifact)
+        print(f"Loaded {len(df)} cleaned resumes from cache: {artifact.name}")
+    elif reusable and prefix_digest == manifest["digest"] and manifest["ends_with_newline"]:
+        cached = _read_corpus(cache_dir / manifest["artifact"])
+        columns = list(pd.read_csv(csv_path, nrows=0).columns)
+        with open(csv_path, "rb") as f:
+            f.seek(manifest["size"])
+            appended = pd.read_csv(io.BytesIO(f.read()), header=None, names=columns)
+        print(f"Loaded {len(cached)} cleaned resumes from cache; cleaning {len(appended)} appended rows...")
+        df = pd.concat([cached, clean_corpus(appended)], ignore_index=True)
+    else:
+        df = pd.read_csv(csv_path)
+        print(f"Loaded {len(df)} resumes")
+        print("Cleaning resumes...")
+        df = clean_corpus(df)
+        print(f"After cleaning: {len(df)} valid resumes")
+
+    if not artifact.exists():
+        _write_corpus(df, artifact)
+    if manifest.get("artifact") != artifact.name:
+        if reusable:
+            # The previous artifact is superseded by the one for the grown file
+            (cache_dir / manifest["artifact"]).unlink(missing_ok=True)
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "source": str(csv_path.resolve()),
+                "size": csv_path.stat().st_size,
+                "digest": digest,
+                "ends_with_newline": ends_with_newline,
+                "cleaner_version": CLEANER_VERSION,
+                "format": CORPUS_FORMAT,
+                "artifact": artifact.name,
+            }, f, indent=2)
+    return df
+
+
+def _hash_source(csv_path, prefix_size=0, block_size=1 << 20):
+    """
+    Hash a file in one pass.
+
+    Returns:
+        Tuple of (digest of the whole file, digest of its first prefix_size
+        bytes, whether the file ends with a newline)
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    prefix_digest = hasher.hexdigest() if prefix_size == 0 else None
+    read = 0
+    last = b""
+    with open(csv_path, "rb") as f:
+        while True:
+            limit = prefix_size - read if read < prefix_size else block_size
+            block = f.read(min(block_size, limit))
+            if not block:
+                break
+            hasher.update(block)
+            read += len(block)
+            last = block[-1:]
+            if read == prefix_size:
+                prefix_digest = hasher.hexdigest()
+    return hasher.hexdigest(), prefix_digest, last == b"\n"
+
+
+def _read_corpus(path):
+    """Read a cleaned corpus artifact."""
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def _write_corpus(df, path):
+    """Atomically write a cleaned corpus artifact; Parquet needs pyarrow."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    if path.suffix == ".parquet":
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+
 def train_model(df):
     """Train classification model."""
     if df is None or len(df) == 0:
@@ -74,8 +238,8 @@ def train_model(df):
     print("="*50)
     
     # Features and labels
-    X = df['Resume'].values
-    y = df['Category'].values
+    X = df['Resume'].to_numpy()
+    y = df['Category'].to_numpy()
     
     # Train-test split
     X_train, X_test, y_train, y_test = train_test_split(
@@ -128,6 +292,113 @@ def train_model(df):
     return model, tfidf, le, accuracy
 
 
+def select_model(df, folds=5, n_jobs=-1, grid=None, cache_dir=None):
+    """
+    Compare classifiers and TF-IDF settings with stratified k-fold CV.
+
+    Candidates are scored in parallel, and the fitted vectorizer of each
+    (TF-IDF setting, fold) pair is cached on disk through Pipeline(memory=...),
+    so every classifier sharing it reuses one vectorization. The cache is
+    filled in a first pass that times vectorization per TF-IDF setting, so
+    fit times are classifier-only on every row; predict throughput always
+    includes the transform.
+
+    Args:
+        df: Cleaned DataFrame from load_data
+        folds: Number of CV folds, capped at the smallest class size
+        n_jobs: Parallel fits (-1 for all cores)
+        grid: Parameter grid; defaults to SELECTION_GRID
+        cache_dir: Transformer cache directory; a temporary one by default
+
+    Returns:
+        List of result dictionaries, best accuracy first
+    """
+    if df is None or len(df) == 0:
+        print("No data available for model selection")
+        return []
+
+    X = df['Resume'].to_numpy()
+    y = df['Category'].to_numpy()
+    smallest = int(df['Category'].value_counts().min())
+    if smallest < folds:
+        print(f"Smallest category has {smallest} resumes; using {max(smallest, 2)} folds")
+        folds = max(smallest, 2)
+
+    grid = grid or SELECTION_GRID
+    pipeline = Pipeline([
+        ('tfidf', TfidfVectorizer(stop_words='english', min_df=2, max_df=0.8)),
+        ('clf', LinearSVC(max_iter=5000, random_state=42)),
+    ], memory=cache_dir or tempfile.mkdtemp(prefix="model_selection_"))
+    cv_splitter = StratifiedKFold(n_splits=folds, shuffle=True, random_state=42)
+
+    def tfidf_setting(params):
+        return tuple(sorted((k, v) for k, v in params.items() if k.startswith('tfidf__')))
+
+    # Without this pass only the first classifier per (TF-IDF setting, fold)
+    # would pay for vectorization, skewing its fit time
+    settings = list(dict.fromkeys(tfidf_setting(p) for p in ParameterGrid(grid)))
+    warmup = GridSearchCV(
+        clone(pipeline).set_params(clf=DummyClassifier()),
+        [{k: [v] for k, v in setting} for setting in settings],
+        cv=cv_splitter,
+        scoring='accuracy',
+        n_jobs=n_jobs,
+        refit=False
+    )
+    search = GridSearchCV(
+        pipeline,
+        grid,
+        cv=cv_splitter,
+        scoring='accuracy',
+        n_jobs=n_jobs,
+        refit=False
+    )
+    try:
+        warmup.fit(X, y)
+        search.fit(X, y)
+    finally:
+        if not cache_dir:
+            shutil.rmtree(pipeline.memory, ignore_errors=True)
+
+    vectorize_seconds = {
+        tfidf_setting(params): float(seconds)
+        for params, seconds in zip(warmup.cv_results_['params'], warmup.cv_results_['mean_fit_time'])
+    }
+    cv = search.cv_results_
+    fold_size = len(X) / folds
+    results = []
+    for i, params in enumerate(cv['params']):
+        results.append({
+            'classifier': type(params['clf']).__name__,
+            'max_features': params.get('tfidf__max_features'),
+            'ngram_range': params.get('tfidf__ngram_range'),
+            'accuracy': float(cv['mean_test_score'][i]),
+            'accuracy_std': float(cv['std_test_score'][i]),
+            'vectorize_seconds': vectorize_seconds[tfidf_setting(params)],
+            'fit_seconds': float(cv['mean_fit_time'][i]),
+            'predict_seconds': float(cv['mean_score_time'][i]),
+            'docs_per_second': fold_size / max(float(cv['mean_score_time'][i]), 1e-9),
+        })
+    results.sort(key=lambda r: r['accuracy'], reverse=True)
+    return results
+
+
+def print_selection_report(results):
+    """
+    Print accuracy next to fit time and predict throughput per configuration.
+    "Vec s" is the TF-IDF fit time shared by a setting's rows, "Fit s" the
+    classifier's own fit time.
+    """
+    print("\n" + "="*50)
+    print("MODEL SELECTION")
+    print("="*50)
+    print(f"{'Classifier':<24}{'Features':>9}{'N-grams':>9}{'Accuracy':>16}{'Vec s':>8}{'Fit s':>8}{'Docs/s':>10}")
+    for r in results:
+        accuracy = f"{r['accuracy']:.4f} ± {r['accuracy_std']:.3f}"
+        print(f"{r['classifier']:<24}{str(r['max_features']):>9}{str(r['ngram_range']):>9}"
+              f"{accuracy:>16}{r['vectorize_seconds']:>8.2f}{r['fit_seconds']:>8.2f}{r['docs_per_second']:>10.0f}")
+
+
 def save_model(model, tfidf, le, model_dir=MODEL_DIR):
     """Save trained model and vectorizer."""
     try:
@@ -136,7 +407,7 @@ def save_model(model, tfidf, le, model_dir=MODEL_DIR):
         print("="*50)
         
         model_dir = Path(model_dir)
-        model_dir.mkdir(exist_ok=True)
+        model_dir.mkdir(parents=True, exist_ok=True)
         
         # Save model
         model_path = model_dir / "classifier.pkl"
@@ -156,6 +427,10 @@ def save_model(model, tfidf, le, model_dir=MODEL_DIR):
             pickle.dump(le, f)
         print(f"✓ Label encoder saved: {le_path}")
         
+        # Array artifacts the app memory-maps instead of unpickling
+        meta_path = save_artifacts(model, tfidf, le, model_dir)
+        print(f"✓ Memory-mappable artifacts saved: {meta_path}")
+        
         print("\\nModel training and saving completed successfully!")
         return True
     except Exception as e:
@@ -163,16 +438,21 @@ def save_model(model, tfidf, le, model_dir=MODEL_DIR):
         return False
 
 
-def main():
-    """Main training pipeline."""
+def main(select=False, folds=5, n_jobs=-1, use_cache=True):
+    """Main training pipeline; with select=True, compare candidate models instead."""
     # Load data
     csv_path = DATA_DIR / "resumes.csv"
-    df = load_data(csv_path)
+    df = load_data(csv_path, cache_dir=CORPUS_CACHE_DIR if use_cache else None)
     
     if df is None or len(df) == 0:
         print("\\nCannot proceed without data")
         return False
-    
+
+    if select:
+        results = select_model(df, folds=folds, n_jobs=n_jobs)
+        print_selection_report(results)
+        return bool(results)
+
     # Train model
     model, tfidf, le, accuracy = train_model(df)
     
@@ -187,12 +467,17 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
-    
     print("Resume Classification Model Training")
     print("="*50)
     
-    success = main()
+    parser = argparse.ArgumentParser(description="Resume classifier training")
+    parser.add_argument("--select", action="store_true", help="Compare models with cross-validation")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--jobs", type=int, default=-1, help="Parallel fits during model selection")
+    parser.add_argument("--no-cache", action="store_true", help="Re-clean the corpus instead of using the cache")
+    args = parser.parse_args()
+    
+    success = main(select=args.select, folds=args.folds, n_jobs=args.jobs, use_cache=not args.no_cache)
     
     if success:
         print("\\n✓ Training pipeline completed successfully!")
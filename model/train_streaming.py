@@ -0,0 +1,281 @@
+"""
+Out-of-core training for resume classification.
+
+Reads the labelled CSV in chunks, hashes features with HashingVectorizer
+(no vocabulary is kept) and trains an SGDClassifier with partial_fit, so
+memory stays flat however large the corpus is. A fixed share of rows,
+chosen by hashing their text, forms a held-out evaluation stream. Training
+state is checkpointed periodically and an interrupted run can be resumed.
+
+Usage:
+    python model/train_streaming.py [csv_path] [--epochs N] [--resume] [--model-dir DIR]
+
+The model is written to model/streaming/ by default, so it never replaces
+the TF-IDF model that train_model.py writes to model/.
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import LabelEncoder
+
+from train_model import DATA_DIR, MODEL_DIR, cleanResume, save_model
+
+CHECKPOINT_VERSION = 1
+# Kept apart from model/, whose TF-IDF model the app serves by default
+STREAMING_MODEL_DIR = MODEL_DIR / "streaming"
+MIN_RESUME_LENGTH = 100
+
+
+class StreamingTrainer:
+    """
+    Incremental trainer over a labelled resume CSV.
+
+    Args:
+        n_features: Width of the hashed feature space
+        chunk_size: Rows read from the CSV per step
+        holdout: Share of rows (0-1) kept out of training for evaluation
+        alpha: SGD regularization strength
+        random_state: Seed for the classifier and per-chunk shuffling
+        checkpoint_path: Where training state is saved; None disables checkpoints
+        checkpoint_every: Chunks between checkpoints within an epoch
+    """
+
+    def __init__(self, n_features=2 ** 18, chunk_size=10000, holdout=0.1, alpha=1e-5,
+                 random_state=42, checkpoint_path=None, checkpoint_every=10):
+        self.n_features = n_features
+        self.chunk_size = chunk_size
+        self.holdout = holdout
+        self.alpha = alpha
+        self.random_state = random_state
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.checkpoint_every = checkpoint_every
+        # Same token settings as the TF-IDF model in train_model.py
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            stop_words='english',
+            ngram_range=(1, 2),
+            alternate_sign=False
+        )
+
+    def settings(self):
+        """Settings a checkpoint must match to be resumed."""
+        return {
+            "n_features": self.n_features,
+            "chunk_size": self.chunk_size,
+            "holdout": self.holdout,
+            "alpha": self.alpha,
+            "random_state": self.random_state,
+        }
+
+    def is_holdout(self, text):
+        """True if a cleaned resume belongs to the evaluation stream."""
+        # Hashing the text keeps the split stable across epochs and resumes,
+        # and duplicate resumes always land on the same side
+        return zlib.crc32(text.encode("utf-8")) % 1000 < self.holdout * 1000
+
+    def iter_chunks(self, csv_path, evaluation=False):
+        """
+        Stream cleaned (texts, labels) chunks from a labelled CSV.
+
+        Args:
+            csv_path: CSV with Resume and Category columns
+            evaluation: Yield the held-out rows instead of the training rows
+
+        Yields:
+            Tuple of (texts, labels) per CSV chunk; possibly empty, so chunk
+            positions stay stable for resuming
+        """
+        reader = pd.read_csv(csv_path, usecols=['Resume', 'Category'], chunksize=self.chunk_size)
+        for chunk in reader:
+            texts, labels = [], []
+            for resume, category in zip(chunk['Resume'], chunk['Category']):
+                if pd.isna(category):
+                    continue
+                text = cleanResume(resume)
+                if len(text) > MIN_RESUME_LENGTH and self.is_holdout(text) == evaluation:
+                    texts.append(text)
+                    labels.append(str(category))
+            yield texts, labels
+
+    def scan_classes(self, csv_path):
+        """Collect the label set in one pass over the Category column."""
+        classes = set()
+        for chunk in pd.read_csv(csv_path, usecols=['Category'], chunksize=self.chunk_size):
+            classes.update(str(c) for c in chunk['Category'].dropna())
+        return sorted(classes)
+
+    def train(self, csv_path, epochs=5, resume=False):
+        """
+        Train over the CSV for a number of epochs.
+
+        Args:
+            csv_path: CSV with Resume and Category columns
+            epochs: Total passes over the training stream
+            resume: Continue from the checkpoint if one exists
+
+        Returns:
+            Tuple of (classifier, label_encoder)
+        """
+        state = self.load_checkpoint() if resume else None
+        if state:
+            classifier = state["classifier"]
+            classes = state["classes"]
+            start_epoch, start_chunk, rows = state["epoch"], state["chunk"], state["rows"]
+            print(f"Resuming at epoch {start_epoch + 1}, chunk {start_chunk} ({rows} rows trained)")
+        else:
+            classes = self.scan_classes(csv_path)
+            classifier = SGDClassifier(loss='hinge', alpha=self.alpha, random_state=self.random_state)
+            start_epoch, start_chunk, rows = 0, 0, 0
+            print(f"Classes: {classes}")
+
+        le = LabelEncoder().fit(classes)
+        class_ids = np.arange(len(classes))
+
+        for epoch in range(start_epoch, epochs):
+            started = time.perf_counter()
+            epoch_rows = 0
+            for index, (texts, labels) in enumerate(self.iter_chunks(csv_path)):
+                if epoch == start_epoch and index < start_chunk:
+                    continue
+                if texts:
+                    # partial_fit does not shuffle, so shuffle each chunk reproducibly
+                    order = np.random.default_rng([self.random_state, epoch, index]).permutation(len(texts))
+                    X = self.vectorizer.transform([texts[i] for i in order])
+                    y = le.transform([labels[i] for i in order])
+                    classifier.partial_fit(X, y, classes=class_ids)
+                    rows += len(texts)
+                    epoch_rows += len(texts)
+                if self.checkpoint_every and (index + 1) % self.checkpoint_every == 0:
+                    self.save_checkpoint(classifier, classes, epoch, index + 1, rows)
+
+            self.save_checkpoint(classifier, classes, epoch + 1, 0, rows)
+            elapsed = time.perf_counter() - started
+            print(f"Epoch {epoch + 1}/{epochs}: {epoch_rows} rows in {elapsed:.1f}s", end="")
+            if self.holdout > 0:
+                print(f" | held-out accuracy {self.evaluate(csv_path, classifier, le)['accuracy']:.4f}")
+            else:
+                print()
+
+        return classifier, le
+
+    def evaluate(self, csv_path, classifier, le):
+        """
+        Score a classifier on the held-out stream.
+
+        Returns:
+            Dictionary with rows, accuracy, macro_f1 and the confusion matrix
+        """
+        n = len(le.classes_)
+        confusion = np.zeros((n, n), dtype=np.int64)
+        for texts, labels in self.iter_chunks(csv_path, evaluation=True):
+            if texts:
+                predicted = classifier.predict(self.vectorizer.transform(texts))
+                np.add.at(confusion, (le.transform(labels), predicted), 1)
+
+        total = int(confusion.sum())
+        correct = np.diag(confusion)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            precision = np.nan_to_num(correct / confusion.sum(axis=0))
+            recall = np.nan_to_num(correct / confusion.sum(axis=1))
+            f1 = np.nan_to_num(2 * precision * recall / (precision + recall))
+        return {
+            "rows": total,
+            "accuracy": float(correct.sum() / total) if total else 0.0,
+            "macro_f1": float(f1.mean()) if n else 0.0,
+            "confusion": confusion,
+        }
+
+    def save_checkpoint(self, classifier, classes, epoch, chunk, rows):
+        """Atomically write the training state; the next run resumes at (epoch, chunk)."""
+        if not self.checkpoint_path:
+            return
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "settings": self.settings(),
+            "classifier": classifier,
+            "classes": classes,
+            "epoch": epoch,
+            "chunk": chunk,
+            "rows": rows,
+        }
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def load_checkpoint(self):
+        """
+        Read the saved training state.
+
+        Returns:
+            State dictionary, or None if there is no checkpoint
+        """
+        if not self.checkpoint_path or not self.checkpoint_path.exists():
+            return None
+        with open(self.checkpoint_path, "rb") as f:
+            state = pickle.load(f)
+        if state.get("version") != CHECKPOINT_VERSION or state.get("settings") != self.settings():
+            raise ValueError(f"Checkpoint {self.checkpoint_path} was written with different settings")
+        return state
+
+
+def main(argv=None):
+    """Streaming training pipeline."""
+    parser = argparse.ArgumentParser(description="Out-of-core resume classifier training")
+    parser.add_argument("csv_path", nargs="?", default=str(DATA_DIR / "resumes.csv"))
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--n-features", type=int, default=2 ** 18)
+    parser.add_argument("--holdout", type=float, default=0.1)
+    parser.add_argument("--model-dir", default=str(STREAMING_MODEL_DIR),
+                        help="Output directory; point ModelService at it to serve this model")
+    parser.add_argument("--checkpoint", help="Checkpoint file (defaults to checkpoint.pkl in the model dir)")
+    parser.add_argument("--checkpoint-every", type=int, default=10)
+    parser.add_argument("--resume", action="store_true", help="Continue from the checkpoint")
+    args = parser.parse_args(argv)
+
+    trainer = StreamingTrainer(
+        n_features=args.n_features,
+        chunk_size=args.chunk_size,
+        holdout=args.holdout,
+        checkpoint_path=args.checkpoint or Path(args.model_dir) / "checkpoint.pkl",
+        checkpoint_every=args.checkpoint_every
+    )
+    try:
+        classifier, le = trainer.train(args.csv_path, epochs=args.epochs, resume=args.resume)
+    except FileNotFoundError:
+        print(f"Error: File not found: {args.csv_path}")
+        return False
+    except Exception as e:
+        print(f"Error training model: {str(e)}")
+        return False
+
+    if args.holdout > 0:
+        report = trainer.evaluate(args.csv_path, classifier, le)
+        print(f"\nHeld-out rows: {report['rows']}")
+        print(f"Accuracy: {report['accuracy']:.4f} | Macro F1: {report['macro_f1']:.4f}")
+
+    return save_model(classifier, trainer.vectorizer, le, args.model_dir)
+
+
+if __name__ == "__main__":
+    print("Resume Classification Streaming Training")
+    print("="*50)
+
+    if main():
+        print("\n✓ Streaming training completed successfully!")
+        sys.exit(0)
+    else:
+        print("\n✗ Streaming training failed")
+        sys.exit(1)
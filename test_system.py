@@ -7,6 +7,7 @@ Run this to test all core modules before using the Streamlit app.
 import sys
 import os
 from pathlib import Path
+import pandas as pd
 
 # Add app directory to path
 sys.path.insert(0, str(Path(__file__).parent / "app"))
@@ -170,6 +171,480 @@ def test_matcher():
         print("\n✗ Matching failed")
         return None
 
+def test_job_profile():
+    """Test that a compiled job profile scores the same as the raw text."""
+    print_section("Testing Compiled Job Profile")
+    
+    ranker = CandidateRanker()
+    parser = ResumeParser()
+    
+    sample_jd = """
+    Backend Engineer
+    3+ years experience with Python, SQL, Docker and AWS.
+    Master's degree preferred.
+    """
+    
+    resumes = [
+        parser.parse_resume("Python and SQL developer with 4 years experience. MBA."),
+        parser.parse_resume("Docker, AWS and Kubernetes engineer with 1 year experience."),
+    ]
+    
+    profile = JobDescriptionParser().compile(sample_jd)
+    print(f"  Profile skills: {profile.skills}")
+    print(f"  Education rank: {profile.education_rank}")
+    
+    from_text = ranker.rank_candidates(resumes, sample_jd)
+    from_profile = ranker.rank_candidates(resumes, profile)
+    
+    assert [r['overall_score'] for r in from_text] == [r['overall_score'] for r in from_profile]
+    assert profile.to_dict()['skills'] == profile.skills
+    
+    # Aliases in a stored dict resolve like parsed text, and records score
+    # by skill ID the same as plain dictionaries by name
+    from job_parser import JobProfile
+    rebuilt = JobProfile.from_dict({"skills": ["Python", "k8s", "sql", "Fortran"], "required_experience": 3})
+    parsed = JobDescriptionParser().compile("Python, Kubernetes and SQL with 3+ years experience. Fortran.")
+    print(f"  Rebuilt skills: {rebuilt.skills}")
+    assert rebuilt.skills == ["python", "kubernetes", "sql", "Fortran"]
+    assert sorted(rebuilt.to_dict()['skill_ids']) == sorted(parsed.skill_ids)
+    as_dicts = [{k: r.get(k) for k in ("skills", "total_experience_years", "education")} for r in resumes]
+    assert ([r['overall_score'] for r in ranker.rank_candidates(resumes, rebuilt)] ==
+            [r['overall_score'] for r in ranker.rank_candidates(as_dicts, rebuilt)])
+    assert ranker.rank_candidates(resumes, rebuilt)[0]['matched_skills'] == ["python", "sql"]
+    print("\n✓ Compiled profile matches raw text scoring")
+
+def test_vectorized_scoring():
+    """Test that batch scoring agrees with the per-resume ranker."""
+    print_section("Testing Vectorized Scoring")
+    
+    ranker = CandidateRanker()
+    parser = ResumeParser()
+    
+    resumes = [
+        parser.parse_resume("Python, SQL and React developer with 6 years experience. PhD."),
+        parser.parse_resume("Java engineer with 2 years experience, diploma in IT."),
+        parser.parse_resume("Docker and AWS administrator. Linux, Git, Jenkins."),
+    ]
+    sample_jd = "Full stack role: 5+ years experience in Python, React, AWS and Docker. Master's degree."
+    
+    expected = ranker.rank_candidates(resumes, sample_jd)
+    scores = ranker.score_batch(resumes, sample_jd)
+    actual = scores.materialize(scores.order())
+    
+    print(f"  Overall scores: {[r['overall_score'] for r in actual]}")
+    assert [r['overall_score'] for r in actual] == [r['overall_score'] for r in expected]
+    assert [sorted(r['matched_skills']) for r in actual] == [sorted(r['matched_skills']) for r in expected]
+    print("\n✓ Vectorized scores match per-resume scoring")
+
+def test_top_k():
+    """Test top-k selection against a full sort, batch and streaming."""
+    print_section("Testing Top-K Ranking")
+    
+    ranker = CandidateRanker()
+    parser = ResumeParser()
+    
+    skills = ["python", "sql", "aws", "docker", "react", "java"]
+    resumes = [
+        parser.parse_resume(f"Engineer skilled in {', '.join(skills[:i % 6 + 1])} with {i % 9} years experience")
+        for i in range(40)
+    ]
+    sample_jd = "Need 4+ years experience with Python, SQL, AWS and Docker."
+    
+    expected = [r for r in ranker.rank_candidates(resumes, sample_jd) if r['overall_score'] >= 30][:5]
+    batch = ranker.rank_top_k(resumes, sample_jd, k=5, min_score=30)
+    streamed = ranker.rank_top_k(iter(resumes), sample_jd, k=5, min_score=30)
+    
+    print(f"  Top 5 scores: {[r['overall_score'] for r in batch]}")
+    assert [r['overall_score'] for r in batch] == [r['overall_score'] for r in expected]
+    assert [r['overall_score'] for r in streamed] == [r['overall_score'] for r in expected]
+    
+    # Ties at the cut go to the earliest candidate on every path
+    tied = []
+    for i in range(300):
+        years = 6 if i in (7, 150) else 2
+        resume = parser.parse_resume(f"Engineer skilled in python, sql with {years} years experience")
+        resume["candidate_name"] = f"c{i}"
+        tied.append(resume)
+    names = lambda ranked: [r['candidate_name'] for r in ranked]
+    batch = ranker.rank_top_k(tied, sample_jd, k=5)
+    collector = ranker.top_k_collector(sample_jd, k=5)
+    for start in range(0, len(tied), 64):
+        collector.push_scores(ranker.score_batch(tied[start:start + 64], sample_jd))
+    print(f"  Tied top 5: {names(batch)}")
+    assert names(batch) == ["c7", "c150", "c0", "c1", "c2"]
+    assert names(ranker.rank_top_k(iter(tied), sample_jd, k=5)) == names(batch) == names(collector.results())
+    print("\n✓ Top-k selection matches full sort")
+
+def test_skill_matcher():
+    """Test single-pass skill matching respects word boundaries."""
+    print_section("Testing Skill Matcher")
+    
+    parser = ResumeParser()
+    
+    text = "good communication skills, email me. built apis in go and c++ with node.js and ci/cd"
+    skills = parser._extract_skills(text)
+    print(f"  Skills found: {skills}")
+    
+    assert "go" in skills and "c++" in skills and "node.js" in skills and "ci/cd" in skills
+    assert "artificial intelligence" not in skills and "javascript" not in skills
+    assert parser._extract_skills("a good email") == []
+    print("\n✓ Skill matcher ignores partial-word hits")
+
+def test_taxonomy():
+    """Test that aliases collapse onto one canonical skill ID."""
+    print_section("Testing Skill Taxonomy")
+    
+    from taxonomy import DEFAULT_TAXONOMY
+    
+    parser = ResumeParser()
+    result = parser.parse_resume("Worked on ML and machine learning pipelines on k8s, nodejs and GCP")
+    
+    print(f"  Skills: {result['skills']}")
+    print(f"  Skill IDs: {list(result['skill_ids'])}")
+    
+    assert result['skills'] == ["machine learning", "google cloud", "kubernetes", "node.js"]
+    assert result['skill_ids'].typecode == "H"
+    assert DEFAULT_TAXONOMY.decode(result['skill_ids']) == result['skills']
+    assert DEFAULT_TAXONOMY.id_of("k8s") == DEFAULT_TAXONOMY.id_of("Kubernetes")
+    print("\n✓ Aliases resolve to canonical skill IDs")
+
+def test_fused_extractor():
+    """Test that the fused extractor agrees with the per-field extractors."""
+    print_section("Testing Fused Extractor")
+    
+    from utils import cleanResume
+    
+    parser = ResumeParser()
+    text = """
+    Jane Roe | jane.roe@mail.com | +1 (555) 123-4567 | http://jane.dev/10-years
+    Data engineer with 6+ yrs of experience in Python, Spark and SQL.
+    M.S. in Computer Science, PMP and AWS Certified Developer.
+    """
+    
+    result = parser.parse_resume(text)
+    text_lower = text.lower()
+    
+    print(f"  Experience: {result['total_experience_years']} years")
+    print(f"  Contact: {result['email']} / {result['phone']}")
+    
+    assert result['total_experience_years'] == parser._extract_experience(cleanResume(text_lower)) == 6
+    assert result['email'] == parser._extract_email(text)
+    assert result['phone'] == parser._extract_phone(text)
+    assert result['education'] == parser._extract_education(text_lower)
+    assert result['certifications'] == parser._extract_certifications(text_lower)
+    print("\n✓ Fused extraction matches per-field extraction")
+
+def test_patterns():
+    """Test shared extraction patterns on str and bytes input."""
+    print_section("Testing Shared Patterns")
+    
+    from patterns import find_experience, find_contacts
+    
+    text = "Reach me at dev.ops@corp.io or 555.987.6543. Over 8 years of experience, 3 yrs lead."
+    
+    print(f"  Experience: {find_experience(text)} years")
+    print(f"  Contacts: {find_contacts(text)}")
+    
+    assert find_experience(text) == find_experience(text.encode()) == 8
+    assert find_contacts(text) == find_contacts(text.encode()) == ("dev.ops@corp.io", " 555.987.6543")
+    assert find_experience("visit www.site.com/12-years then 4 yrs") == 4
+    print("\n✓ Patterns agree on str and bytes input")
+
+def test_parse_cache():
+    """Test the content-addressed parse cache and its SQLite tier."""
+    print_section("Testing Parse Cache")
+    
+    import tempfile
+    from parse_cache import ParseCache
+    
+    text = "Python developer with 4 years of experience. jane@site.com"
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(max_entries=1, cache_dir=tmp)
+        parser = ResumeParser(cache=cache)
+        first = parser.parse_resume(text)
+        again = parser.parse_resume(text + "\r\n")
+        parser.parse_resume("Java engineer")
+        stats = cache.stats()
+        print(f"  Stats: {stats}")
+        
+        assert again["skills"] == first["skills"] and again["text_length"] == len(text) + 2
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 1)
+        cache.close()
+        
+        # A fresh process reads the entry back from disk
+        reopened = ParseCache(cache_dir=tmp)
+        assert reopened.get(text)["total_experience_years"] == 4
+        assert reopened.stats()["disk_hits"] == 1
+        reopened.close()
+    print("\n✓ Parse cache hits, evicts and persists correctly")
+
+def test_candidate_store():
+    """Test writing, memory-mapping and scoring a candidate store."""
+    print_section("Testing Candidate Store")
+    
+    import tempfile
+    from candidate_store import CandidateStore, CandidateStoreWriter
+    
+    parser = ResumeParser()
+    ranker = CandidateRanker()
+    resumes = []
+    for i, text in enumerate([
+        "Python and SQL engineer, 6 years of experience, master's degree. ann@mail.com",
+        "Java developer with docker and aws, 2 years of experience.",
+    ]):
+        resume = parser.parse_resume(text)
+        resume["candidate_name"] = resume["file_name"] = f"Candidate {i + 1}"
+        resumes.append(resume)
+    job = "Python developer with SQL and AWS, 4+ years of experience, bachelor's degree"
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        with CandidateStoreWriter(tmp) as writer:
+            for resume in resumes:
+                writer.add(resume, resume["raw_text"])
+        store = CandidateStore(tmp)
+        stored = ranker.score_batch(store.matrix(), job)
+        direct = ranker.score_batch(resumes, job)
+        print(f"  Stored scores: {stored.overall.round(2).tolist()}")
+        
+        assert len(store) == 2 and store.text(0) == resumes[0]["raw_text"]
+        assert stored.materialize(stored.order()) == direct.materialize(direct.order())
+        del store, stored
+    print("\n✓ Candidate store scores match freshly parsed resumes")
+
+def test_skill_index():
+    """Test inverted-index retrieval against a full scan."""
+    print_section("Testing Skill Index Retrieval")
+    
+    from vector_scoring import CandidateMatrix
+    from skill_index import SkillIndex
+    
+    ranker = CandidateRanker()
+    parser = ResumeParser()
+    texts = [
+        "Python, SQL, AWS and docker engineer with 6 years of experience, master's degree",
+        "Python and SQL analyst with 1 years of experience",
+        "Java and AWS developer, 8 years of experience, bachelor's degree",
+        "Graphic designer with Photoshop skills",
+    ]
+    matrix = CandidateMatrix.from_resumes([parser.parse_resume(t) for t in texts], ranker.vocabulary)
+    index = SkillIndex.from_matrix(matrix)
+    job = "Python, SQL, AWS and docker developer, 5+ years of experience, bachelor's degree"
+    
+    python_rows = index.posting(ranker.vocabulary.index["python"]).tolist()
+    print(f"  Posting list for python: {python_rows}")
+    assert python_rows == [0, 1]
+    
+    for min_score in (40, 75, 90):
+        full = ranker.score_batch(matrix, job)
+        pruned = ranker.score_batch(matrix, job, min_score=min_score, index=index)
+        assert full.materialize(full.top_k(10, min_score)) == pruned.materialize(pruned.top_k(10, min_score))
+    
+    pruned = ranker.score_batch(matrix, job, min_score=90, index=index)
+    print(f"  Scored at min_score=90: {len(pruned)} of {len(matrix)}")
+    assert len(pruned) == 1
+    print("\n✓ Index retrieval returns the same ranking while scoring fewer candidates")
+
+def test_parallel_ingest():
+    """Test ordered, fault-tolerant parallel ingestion."""
+    print_section("Testing Parallel Ingestion")
+    
+    from parallel_ingest import ParallelIngestor
+    
+    resume = "Python developer with SQL and AWS, 5 years of experience, bachelor's degree. " * 3
+    documents = [
+        ("alice.txt", resume.encode()),
+        ("notes.xls", b"spreadsheet"),
+        ("bob.txt", resume.replace("Python", "Java").encode()),
+        ("empty.txt", b""),
+    ]
+    
+    with ParallelIngestor(workers=2, chunk_size=1) as ingestor:
+        results = list(ingestor.map(documents))
+        # Resizing retires the old pool instead of keeping both alive
+        pool = ingestor.executor
+        ingestor.resize(3)
+        resized = list(ingestor.map(documents))
+        assert ingestor.executor is not pool and ingestor.executor._max_workers == 3
+        ingestor.resize(3)
+        assert ingestor.executor._max_workers == 3
+    
+    for name, resume_data, error in results:
+        print(f"  {name}: {error or resume_data['skills']}")
+    
+    assert [name for name, _, _ in results] == [name for name, _ in documents]
+    assert results[0][1]["skills"] == ["python", "sql", "aws"]
+    assert results[2][1]["skills"] == ["java", "sql", "aws"]
+    assert results[1][2] and results[3][2]
+    assert [r[:1] + r[2:] for r in resized] == [r[:1] + r[2:] for r in results]
+    print("\n✓ Parallel ingestion keeps upload order and isolates bad files")
+
+def _build_pdf(page_texts):
+    """Minimal multi-page PDF with one line of Helvetica text per page."""
+    n = len(page_texts)
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [%s] /Count %d >>" % (" ".join(f"{4 + 2 * i} 0 R" for i in range(n)), n),
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>")
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+def test_pdf_extraction():
+    """Test lazy page extraction, text budgets and path inputs."""
+    print_section("Testing PDF Extraction")
+    
+    import io
+    import tempfile
+    from utils import extract_pdf, iter_pdf_pages
+    
+    pdf = _build_pdf([f"Page {i} python sql aws docker kubernetes" for i in range(1, 41)])
+    
+    full = extract_pdf(io.BytesIO(pdf))
+    budgeted = extract_pdf(io.BytesIO(pdf), max_chars=100)
+    print(f"  Full text: {len(full)} chars | Budgeted: {budgeted!r}")
+    
+    assert "Page 1 " in full and "Page 40 " in full
+    assert len(budgeted) == 100 and "Page 3 " in budgeted and "Page 4 " not in budgeted
+    assert len(list(iter_pdf_pages(io.BytesIO(pdf), max_pages=3))) == 3
+    
+    # Path inputs are read through a memory map that stays open while pages are pulled
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "portfolio.pdf")
+        with open(path, "wb") as f:
+            f.write(pdf)
+        assert extract_pdf(path) == full
+    print("\n✓ PDF pages are extracted lazily within the text budget")
+
+def test_pipeline():
+    """Test the staged extract -> parse -> score pipeline."""
+    print_section("Testing Async Pipeline")
+    
+    import asyncio
+    from pipeline import ScreeningPipeline
+    
+    base = "Python developer with SQL and AWS, {0} years of experience, bachelor's degree. " * 3
+    documents = [(f"candidate_{years}.txt", base.format(years).encode()) for years in range(1, 9)]
+    documents.insert(3, ("broken.doc", b"legacy"))
+    job = "Python developer with SQL and AWS, 5+ years of experience, bachelor's degree"
+    
+    pipeline = ScreeningPipeline(job, extract_workers=2, parse_workers=2, queue_size=2)
+    ranked, failed = asyncio.run(pipeline.run(iter(documents)))
+    stats = pipeline.stats()
+    print(f"  Ranked: {[r['candidate_name'] for r in ranked]}")
+    print(f"  Stage metrics: {stats}")
+    
+    assert len(ranked) == 8 and [f.name for f in failed] == ["broken.doc"]
+    assert ranked[-1]["candidate_name"] == "candidate_1"
+    # Tied scores (5+ years all meet the requirement) keep input order
+    assert [r["candidate_name"] for r in ranked[:4]] == ["candidate_5", "candidate_6", "candidate_7", "candidate_8"]
+    assert stats["extract"]["processed"] == 9 and stats["extract"]["errors"] == 1
+    assert stats["parse"]["processed"] == stats["score"]["processed"] == 8
+    
+    # With a process pool the parent checks and fills the parser's cache
+    from concurrent.futures import ProcessPoolExecutor
+    from parallel_ingest import _init_worker
+    from parse_cache import ParseCache
+    cache = ParseCache()
+    with ProcessPoolExecutor(max_workers=2, initializer=_init_worker) as pool:
+        for _ in range(2):
+            rerun = ScreeningPipeline(job, parser=ResumeParser(cache=cache), executor=pool)
+            reranked, _ = asyncio.run(rerun.run(iter(documents)))
+    print(f"  Parse cache after two pooled runs: {cache.stats()}")
+    assert cache.stats()["misses"] == 8 and cache.stats()["hits"] == 8
+    assert [r["candidate_name"] for r in reranked] == [r["candidate_name"] for r in ranked]
+    
+    # A crashed pool worker is replaced and only the file that kills workers fails
+    import signal
+    import time
+    import utils
+    from utils import register_extractor
+    from parallel_ingest import ParallelIngestor
+    
+    def crash(file_obj, max_chars=None):
+        os._exit(1)
+    
+    register_extractor("crash", crash, signatures=(b"CRASH",))
+    try:
+        with ParallelIngestor(workers=2) as ingestor:
+            pool = ingestor.executor
+            pool.submit(int).result()
+            os.kill(next(iter(pool._processes)), signal.SIGKILL)
+            time.sleep(0.2)
+            healed, lost = asyncio.run(ScreeningPipeline(job, ingestor=ingestor).run(iter(documents)))
+            assert ingestor.executor is not pool and len(healed) == 8
+            
+            poisoned = documents[:4] + [("crash.txt", b"CRASH")] + documents[4:]
+            survived, lost = asyncio.run(ScreeningPipeline(job, ingestor=ingestor, queue_size=1).run(iter(poisoned)))
+            after, _ = asyncio.run(ScreeningPipeline(job, ingestor=ingestor).run(iter(documents)))
+    finally:
+        del utils.EXTRACTORS["crash"]
+        utils._SIGNATURES.remove((b"CRASH", "crash"))
+    print(f"  After worker crashes: {len(survived)} ranked, failed {[(r.name, r.error) for r in lost]}")
+    assert "crash.txt" in [r.name for r in lost] and len(survived) + len(lost) == 10
+    assert len(survived) >= 7 and len(after) == 8
+    
+    # A failing document source ends the stream with its error instead of hanging
+    def failing_documents():
+        yield documents[0]
+        raise OSError("archive member unreadable")
+    
+    delivered = []
+    async def consume():
+        async for result in ScreeningPipeline(job).stream(failing_documents()):
+            delivered.append(result.name)
+    try:
+        asyncio.run(asyncio.wait_for(consume(), 5))
+        assert False, "The source error should be raised"
+    except OSError as e:
+        assert "unreadable" in str(e) and delivered == ["candidate_1.txt"]
+    print("\n✓ Pipeline stages overlap, report failures and expose metrics")
+
+def test_csv_streaming():
+    """Test chunked CSV reading feeding a running top-k."""
+    print_section("Testing Streaming CSV Batches")
+    
+    import io
+    import utils
+    from utils import iter_csv_batches
+    
+    parser = ResumeParser()
+    ranker = CandidateRanker()
+    rows = [f"Python and SQL developer with {i % 9} years of experience\n{'AWS ' * (i % 3)}" for i in range(23)]
+    csv_bytes = pd.DataFrame({"Resume": rows, "Category": "Data"}).to_csv(index=False).encode()
+    job = "Python developer with SQL and AWS, 6+ years of experience"
+    
+    engines = [utils.pa_csv, None] if utils.pa_csv is not None else [None]
+    for engine in engines:
+        utils.pa_csv, saved = engine, utils.pa_csv
+        batches = list(iter_csv_batches(io.BytesIO(csv_bytes), batch_size=5))
+        utils.pa_csv = saved
+        assert [len(b["Resume"]) for b in batches] == [5, 5, 5, 5, 3]
+        assert sum((b["Resume"] for b in batches), []) == rows and batches[0]["Candidate"] == [None] * 5
+    
+    collector = ranker.top_k_collector(job, k=4, min_score=30)
+    for batch in batches:
+        collector.push_scores(ranker.score_batch(parser.parse_batch(batch["Resume"]), job))
+    
+    expected = ranker.rank_top_k([parser.parse_resume(r) for r in rows], job, k=4, min_score=30)
+    print(f"  Engines tested: {len(engines)} | Top scores: {[r['overall_score'] for r in collector.results()]}")
+    assert collector.results() == expected and collector.seen == len(rows)
+    print("\n✓ Chunked CSV scoring matches a single full ranking")
+
 def test_utils():
     """Test utility functions."""
     print_section("Testing Utility Functions")
@@ -196,6 +671,526 @@ def test_utils():
     is_jd_result = is_job_description("Looking for software engineer with 5+ years experience")
     print(f"✓ Is job description: {is_jd_result}")
 
+def test_zip_upload():
+    """Test streaming resumes out of a zip archive with bomb guards."""
+    print_section("Testing Zip Archive Upload")
+    
+    import io
+    import zipfile
+    from parallel_ingest import ParallelIngestor, iter_zip_documents, count_zip_documents
+    
+    resume = "Python developer with SQL and AWS, 5 years of experience, bachelor's degree. " * 3
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("batch/alice.txt", resume)
+        archive.writestr("batch/bob.TXT", resume.replace("Python", "Java"))
+        archive.writestr("batch/", "")
+        archive.writestr("__MACOSX/batch/._alice.txt", "resource fork")
+        archive.writestr("batch/.DS_Store", "finder")
+        archive.writestr("batch/photo.png", b"\x89PNG")
+        archive.writestr("batch/bomb.txt", "0" * 500000)
+    
+    skipped = []
+    documents = list(iter_zip_documents(buffer.getvalue(), skipped))
+    print(f"  Yielded: {[name for name, _ in documents]}")
+    print(f"  Skipped: {skipped}")
+    
+    assert [name for name, _ in documents] == ["batch/alice.txt", "batch/bob.TXT"]
+    assert skipped == [("batch/photo.png", "Unsupported file type"),
+                       ("batch/bomb.txt", "Suspicious compression ratio")]
+    assert count_zip_documents(buffer.getvalue()) == 3
+    assert count_zip_documents(b"not a zip") == 0
+    
+    limited = []
+    assert list(iter_zip_documents(buffer.getvalue(), limited, max_members=1))[0][0] == "batch/alice.txt"
+    assert ("batch/bob.TXT", "Archive holds more than 1 resumes") in limited
+    
+    with ParallelIngestor(workers=1) as ingestor:
+        results = list(ingestor.map(documents))
+    assert [r[1]["skills"] for r in results] == [["python", "sql", "aws"], ["java", "sql", "aws"]]
+    print("\n✓ Zip members stream into ingestion and unsafe members are skipped")
+
+def test_text_cache():
+    """Test the byte-bounded extracted-text cache and its disk spill."""
+    print_section("Testing Extracted Text Cache")
+    
+    import tempfile
+    from parse_cache import TextCache
+    from parallel_ingest import extract_document
+    
+    pdf = _build_pdf([f"Page {i} Python developer with SQL and AWS experience in data pipelines" for i in range(3)])
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = TextCache(max_bytes=1, cache_dir=cache_dir)
+        first = extract_document("resume.pdf", pdf, cache=cache)
+        again = extract_document("resume.pdf", pdf, cache=cache)
+        assert first == again == extract_document("resume.pdf", pdf) and first[1] is None
+        assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 1
+        
+        # The same bytes under another extractor are a different entry
+        extract_document("resume.txt", pdf, cache=cache)
+        assert cache.stats()["misses"] == 2
+        
+        # Over budget, the older entry was spilled to disk and is promoted back on a hit
+        assert len(cache) == 1 and cache.stats()["evictions"] == 1
+        assert extract_document("resume.pdf", pdf, cache=cache) == first
+        assert cache.stats()["disk_hits"] == 1
+        
+        cache.close()
+        reopened = TextCache(cache_dir=cache_dir)
+        assert extract_document("resume.pdf", pdf, cache=reopened) == first
+        stats = reopened.stats()
+        reopened.close()
+    
+    print(f"  Reopened cache stats: {stats}")
+    assert stats["disk_hits"] == 1 and stats["misses"] == 0
+    print("\n✓ Extracted text is reused across calls, spills and restarts")
+
+def test_docx_extraction():
+    """Test the streaming DOCX extractor on tables, text boxes and bad input."""
+    print_section("Testing Streaming DOCX Extraction")
+    
+    import io
+    import zipfile
+    import docx
+    from utils import extract_docx, extract_docx_document, extract_from_file
+    
+    document = docx.Document()
+    document.add_paragraph("Jane Doe - Data Engineer")
+    document.add_paragraph("Python and SQL pipelines on AWS")
+    table = document.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "Spark"
+    table.cell(0, 1).text = "Kafka"
+    buffer = io.BytesIO()
+    document.save(buffer)
+    
+    fast = extract_docx(io.BytesIO(buffer.getvalue()))
+    legacy = extract_docx_document(io.BytesIO(buffer.getvalue()))
+    print(f"  Streaming: {fast}")
+    print(f"  python-docx: {legacy}")
+    assert fast == legacy + " Spark Kafka"
+    assert extract_docx(io.BytesIO(buffer.getvalue()), max_chars=10) == "Jane Doe -"
+    assert extract_from_file(io.BytesIO(buffer.getvalue()), "docx", max_chars=30) == fast[:30]
+    
+    # Text boxes are read once even though Word stores a legacy fallback copy
+    w = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    mc = 'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+    body = (
+        f'<w:document {w} {mc}><w:body>'
+        '<w:p><w:r><w:t>Skills:</w:t><w:tab/><w:t>Docker</w:t></w:r></w:p>'
+        '<w:p><w:r><mc:AlternateContent>'
+        '<mc:Choice><w:txbxContent><w:p><w:r><w:t>Kubernetes</w:t></w:r></w:p></w:txbxContent></mc:Choice>'
+        '<mc:Fallback><w:txbxContent><w:p><w:r><w:t>Kubernetes</w:t></w:r></w:p></w:txbxContent></mc:Fallback>'
+        '</mc:AlternateContent></w:r></w:p>'
+        '</w:body></w:document>'
+    )
+    raw = io.BytesIO()
+    with zipfile.ZipFile(raw, "w") as archive:
+        archive.writestr("word/document.xml", body)
+    assert extract_docx(io.BytesIO(raw.getvalue())) == "Skills: Docker Kubernetes"
+    
+    # Input that is not a DOCX falls back to python-docx, which reports it
+    assert extract_docx(io.BytesIO(b"not a docx")) == ""
+    print("\n✓ DOCX text streams from the document XML, tables and text boxes included")
+
+def test_format_sniffing():
+    """Test content-based format detection and the extractor registry."""
+    print_section("Testing Format Sniffing")
+    
+    import io
+    import os
+    import docx
+    import utils
+    from utils import extract_from_file, sniff_file_type, register_extractor
+    from parallel_ingest import extract_document
+    
+    pdf = _build_pdf(["Python developer with SQL and AWS experience building data pipelines for analytics"])
+    docx_file = io.BytesIO()
+    document = docx.Document()
+    document.add_paragraph("Java developer")
+    document.save(docx_file)
+    text = "Python developer résumé".encode("utf-8")
+    
+    samples = {
+        "pdf": pdf,
+        "docx": docx_file.getvalue(),
+        "txt": text,
+        "utf16": "Python developer".encode("utf-16"),
+        "binary": os.urandom(64) + b"\x00",
+    }
+    detected = {name: sniff_file_type(data) for name, data in samples.items()}
+    print(f"  Detected: {detected}")
+    assert detected == {"pdf": "pdf", "docx": "docx", "txt": "txt", "utf16": "txt", "binary": None}
+    
+    # Content wins over the declared type, and binaries are not decoded as text
+    assert extract_from_file(pdf, "txt").startswith("Python developer with SQL")
+    assert extract_from_file(io.BytesIO(samples["docx"]), "pdf") == "Java developer"
+    assert extract_from_file(samples["utf16"]) == "Python developer"
+    assert extract_from_file(samples["binary"], "txt") == ""
+    assert extract_document("resume.txt", samples["binary"])[1] == "File contains too little text"
+    
+    # New formats plug in through the registry
+    register_extractor("rtf", lambda f, max_chars=None: "rtf text", signatures=(b"{\\rtf",))
+    register_extractor("md", lambda f, max_chars=None: "markdown text", text=True)
+    try:
+        assert extract_from_file(b"{\\rtf1 Hello}") == "rtf text"
+        assert extract_from_file(b"# Resume", "md") == "markdown text"
+        assert extract_from_file(b"# Resume", "txt") == "# Resume"
+    finally:
+        del utils.EXTRACTORS["rtf"], utils.EXTRACTORS["md"]
+        utils._SIGNATURES.remove((b"{\\rtf", "rtf"))
+        utils.TEXT_FORMATS.discard("md")
+    print("\n✓ Files are dispatched by their bytes, not their names")
+
+def test_isolated_extraction():
+    """Test sandboxed extraction workers with timeouts and memory caps."""
+    print_section("Testing Isolated Extraction")
+    
+    import time
+    import utils
+    from utils import register_extractor
+    from parallel_ingest import IsolatedExtractor, extract_document
+    
+    def hang(file_obj, max_chars=None):
+        time.sleep(60)
+    
+    def balloon(file_obj, max_chars=None):
+        return str(len(bytearray(2 * 1024 ** 3)))
+    
+    def crash(file_obj, max_chars=None):
+        os._exit(1)
+    
+    # Workers fork after these are registered, so they can dispatch to them
+    for tag, extractor in ((b"HANG", hang), (b"BALLOON", balloon), (b"CRASH", crash)):
+        register_extractor(tag.decode().lower(), extractor, signatures=(tag,))
+    try:
+        resume = b"Python developer with SQL and AWS, 5 years of experience, bachelor's degree. " * 3
+        with IsolatedExtractor(workers=2, timeout=1, memory_limit_mb=256) as extractor:
+            start = time.perf_counter()
+            results = {
+                name: extract_document(name, data, extractor=extractor)
+                for name, data in [("hung.pdf", b"HANG"), ("huge.pdf", b"BALLOON"),
+                                   ("crash.pdf", b"CRASH"), ("good.txt", resume)]
+            }
+            elapsed = time.perf_counter() - start
+            stats = extractor.stats()
+            
+            pdf = _build_pdf(["Python developer with SQL and AWS experience building data pipelines for analytics"])
+            assert extract_document("after.pdf", pdf, extractor=extractor) == extract_document("after.pdf", pdf)
+            
+            # Resizing reuses the same extractor rather than starting another one
+            extractor.resize(3)
+            assert extractor.stats()["workers"] == 3 and extractor._idle.qsize() == 3
+            extractor.resize(1)
+            assert extractor._idle.qsize() == 1
+            assert extract_document("good.txt", resume, extractor=extractor) == results["good.txt"]
+    finally:
+        for tag in (b"HANG", b"BALLOON", b"CRASH"):
+            del utils.EXTRACTORS[tag.decode().lower()]
+            utils._SIGNATURES.remove((tag, tag.decode().lower()))
+    
+    for name, (text, error) in results.items():
+        print(f"  {name}: {error or 'ok'}")
+    print(f"  Stats: {stats} | {elapsed:.1f}s")
+    assert "timed out" in results["hung.pdf"][1]
+    assert "memory limit" in results["huge.pdf"][1]
+    assert "died" in results["crash.pdf"][1]
+    assert results["good.txt"] == (resume.decode().strip(), None)
+    assert stats["timeouts"] == 1 and stats["crashes"] == 1 and elapsed < 10
+    
+    # The real extractors let the memory cap through, and nothing is cached for the file
+    from parse_cache import TextCache
+    def balloon_pages(file_obj, max_pages=None):
+        yield str(len(bytearray(2 * 1024 ** 3)))
+    
+    iter_pdf_pages, utils.iter_pdf_pages = utils.iter_pdf_pages, balloon_pages
+    try:
+        cache = TextCache()
+        with IsolatedExtractor(workers=1, timeout=5, memory_limit_mb=256) as extractor:
+            oversized = extract_document("scan.pdf", pdf, cache=cache, extractor=extractor)
+    finally:
+        utils.iter_pdf_pages = iter_pdf_pages
+    print(f"  scan.pdf: {oversized[1]}")
+    assert "memory limit" in oversized[1] and cache.stats()["entries"] == 0
+    assert cache.get_or_extract(b"unreadable", lambda: "") == "" and cache.stats()["entries"] == 0
+    print("\n✓ Hung, oversized and crashing files are skipped without stalling the batch")
+
+def test_records():
+    """Test the slotted ParsedResume and RankedCandidate records."""
+    print_section("Testing Compact Records")
+    
+    import pickle
+    import tracemalloc
+    from records import ParsedResume, RankedCandidate, RAW_TEXT_CHARS
+    
+    parser = ResumeParser()
+    ranker = CandidateRanker()
+    text = "Jane Doe jane@example.com Python, SQL and Docker engineer, 4 years of experience, Master's degree. " * 20
+    resume = parser.parse_resume(text)
+    
+    assert isinstance(resume, ParsedResume) and not hasattr(resume, "__dict__")
+    assert resume["skills"] == ["python", "sql", "docker"] and list(resume["skill_ids"]) == [0, 13, 23]
+    assert resume["raw_text"] == text[:RAW_TEXT_CHARS] and resume["text_length"] == len(text)
+    # Records hold only the raw_text slice, never the whole source document
+    assert len(text) > RAW_TEXT_CHARS and len(resume._text) == RAW_TEXT_CHARS
+    assert len(resume.with_text(text * 2)._text) == RAW_TEXT_CHARS
+    assert "candidate_name" not in resume and resume.get("candidate_name", "n/a") == "n/a"
+    resume["candidate_name"] = "Jane"
+    assert dict(resume)["candidate_name"] == "Jane" and resume.to_dict()["email"] == "jane@example.com"
+    
+    # Pickling (worker processes, the parse cache) ships only the raw_text slice
+    shipped = pickle.loads(pickle.dumps(resume))
+    assert shipped == resume and len(pickle.dumps(resume)) < len(text)
+    
+    job = "Python and SQL developer with AWS, 3+ years of experience"
+    ranked = ranker.rank_single_resume(resume, job)
+    legacy = ranker.rank_single_resume(resume.to_dict(), job)
+    assert isinstance(ranked, RankedCandidate) and ranked == legacy
+    assert ranked["matched_skills"] == ["python", "sql"] and ranked["missing_skills"] == ["aws"]
+    assert ranked["education"] is resume["education"]
+    print(f"  Ranked: {ranked.to_dict()}")
+    
+    pool = [resume] * 20000
+    tracemalloc.start()
+    scores = ranker.score_batch(pool, job)
+    before = tracemalloc.get_traced_memory()[0]
+    board = scores.materialize(scores.order())
+    per_candidate = (tracemalloc.get_traced_memory()[0] - before) / len(board)
+    tracemalloc.stop()
+    print(f"  Leaderboard cost: {per_candidate:.0f} bytes per candidate")
+    assert per_candidate < 400
+    print("\n✓ Records read like dictionaries at a fraction of the memory")
+
+def test_model_service():
+    """Test lazy, shared loading and batched category prediction."""
+    print_section("Testing Model Service")
+    
+    import pickle
+    import tempfile
+    import threading
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.preprocessing import LabelEncoder
+    from sklearn.svm import LinearSVC
+    from model_service import ModelService, get_model_service, clean_for_model
+    
+    df = pd.read_csv(Path(__file__).parent / "data" / "resumes.csv").dropna()
+    texts = [clean_for_model(t) for t in df["Resume"]]
+    vectorizer = TfidfVectorizer(max_features=500, stop_words="english")
+    encoder = LabelEncoder()
+    classifier = LinearSVC(random_state=42).fit(vectorizer.fit_transform(texts), encoder.fit_transform(df["Category"]))
+    
+    with tempfile.TemporaryDirectory() as model_dir:
+        missing = ModelService(model_dir)
+        assert missing.predict_categories(["python developer"]) == [None] and "Model not trained" in missing.error
+        
+        for obj, name in ((classifier, "classifier.pkl"), (vectorizer, "tfidf_vectorizer.pkl"),
+                          (encoder, "label_encoder.pkl")):
+            with open(Path(model_dir) / name, "wb") as f:
+                pickle.dump(obj, f)
+        
+        service = get_model_service(model_dir)
+        assert get_model_service(model_dir) is service and not service._loaded
+        
+        # Concurrent first calls load the artifacts exactly once
+        loaded = []
+        threads = [threading.Thread(target=lambda: loaded.append(service.classifier if service.available else None))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(c) for c in loaded}) == 1 and loaded[0] is not None
+        
+        sample = list(df["Resume"][:20])
+        predicted = service.predict_categories(sample + [""])
+        expected = list(encoder.inverse_transform(classifier.predict(vectorizer.transform([clean_for_model(t) for t in sample]))))
+        print(f"  Predicted: {predicted[:3]} ... ({len(predicted)} texts)")
+        assert predicted[:-1] == expected and predicted[-1] is None
+        
+        resume = ResumeParser().parse_resume(sample[0])
+        resume["category"] = predicted[0]
+        assert CandidateRanker().rank_single_resume(resume, "Python developer")["category"] == predicted[0]
+    print("\n✓ Categories are predicted in one batched call from a shared model")
+
+def test_model_artifacts():
+    """Test the memory-mapped model format against the fitted sklearn objects."""
+    print_section("Testing Model Artifacts")
+    
+    import tempfile
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.preprocessing import LabelEncoder
+    from sklearn.svm import LinearSVC
+    import numpy as np
+    from model_artifacts import save_artifacts, load_artifacts, has_artifacts
+    from model_service import ModelService, clean_for_model
+    
+    df = pd.read_csv(Path(__file__).parent / "data" / "resumes.csv").dropna()
+    texts = [clean_for_model(t) for t in df["Resume"]]
+    vectorizer = TfidfVectorizer(max_features=500, stop_words="english", ngram_range=(1, 2), sublinear_tf=True)
+    encoder = LabelEncoder()
+    classifier = LinearSVC(random_state=42).fit(vectorizer.fit_transform(texts), encoder.fit_transform(df["Category"]))
+    
+    with tempfile.TemporaryDirectory() as model_dir:
+        assert not has_artifacts(model_dir)
+        save_artifacts(classifier, vectorizer, encoder, model_dir)
+        assert has_artifacts(model_dir)
+        
+        compact_classifier, compact_vectorizer, compact_encoder = load_artifacts(model_dir)
+        assert isinstance(compact_vectorizer.vocabulary, np.memmap)
+        assert isinstance(compact_classifier.coef_, np.memmap)
+        assert len(compact_vectorizer) == len(vectorizer.vocabulary_)
+        
+        sample = texts[:20] + ["", "zzzz unseen words only"]
+        expected = vectorizer.transform(sample)
+        actual = compact_vectorizer.transform(sample)
+        print(f"  Features: {len(compact_vectorizer)}, max difference: {abs(expected - actual).max():.2e}")
+        assert actual.shape == expected.shape and abs(expected - actual).max() < 1e-9
+        assert np.allclose(compact_classifier.decision_function(actual), classifier.decision_function(expected))
+        assert list(compact_encoder.inverse_transform(compact_classifier.predict(actual))) == \
+            list(encoder.inverse_transform(classifier.predict(expected)))
+        
+        # The service prefers the array format; no pickles were written
+        service = ModelService(model_dir)
+        predicted = service.predict_categories(list(df["Resume"][:20]))
+        assert service.available and predicted == list(encoder.inverse_transform(classifier.predict(expected[:20])))
+    print("\n✓ Array artifacts reproduce the sklearn model without unpickling")
+
+def test_streaming_training():
+    """Test out-of-core training, checkpoint resume and the held-out stream."""
+    print_section("Testing Streaming Training")
+    
+    import tempfile
+    import numpy as np
+    sys.path.insert(0, str(Path(__file__).parent / "model"))
+    from train_streaming import StreamingTrainer
+    from model_artifacts import save_artifacts
+    from model_service import ModelService
+    
+    class InterruptedTrainer(StreamingTrainer):
+        def iter_chunks(self, csv_path, evaluation=False):
+            for index, chunk in enumerate(super().iter_chunks(csv_path, evaluation)):
+                if index == 3 and not evaluation:
+                    raise KeyboardInterrupt
+                yield chunk
+    
+    df = pd.read_csv(Path(__file__).parent / "data" / "resumes.csv")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "archive.csv"
+        copies = [df.assign(Resume=df["Resume"] + f" batch{i}") for i in range(3)]
+        pd.concat(copies, ignore_index=True).to_csv(csv_path, index=False)
+        settings = dict(n_features=2 ** 12, chunk_size=64, holdout=0.2, checkpoint_every=1)
+        
+        straight = StreamingTrainer(checkpoint_path=Path(tmp) / "a.pkl", **settings)
+        classifier, le = straight.train(csv_path, epochs=2)
+        
+        # Interrupt mid-epoch, then resume from the last chunk checkpoint
+        interrupted = InterruptedTrainer(checkpoint_path=Path(tmp) / "b.pkl", **settings)
+        try:
+            interrupted.train(csv_path, epochs=2)
+        except KeyboardInterrupt:
+            pass
+        assert interrupted.load_checkpoint()["chunk"] == 3
+        resumed, _ = StreamingTrainer(checkpoint_path=Path(tmp) / "b.pkl", **settings).train(csv_path, epochs=2, resume=True)
+        assert np.array_equal(resumed.coef_, classifier.coef_)
+        
+        # Training and held-out streams never share a resume
+        for texts, _ in straight.iter_chunks(csv_path):
+            assert not any(straight.is_holdout(t) for t in texts)
+        report = straight.evaluate(csv_path, classifier, le)
+        print(f"  Held-out rows: {report['rows']}, accuracy: {report['accuracy']:.3f}")
+        assert report["rows"] > 0 and report["confusion"].sum() == report["rows"]
+        
+        try:
+            StreamingTrainer(checkpoint_path=Path(tmp) / "a.pkl", n_features=2 ** 10).load_checkpoint()
+            assert False, "Mismatched checkpoint settings should be rejected"
+        except ValueError:
+            pass
+        
+        # The hashed model is served from the array artifacts
+        save_artifacts(classifier, straight.vectorizer, le, Path(tmp) / "model")
+        sample = next(straight.iter_chunks(csv_path))[0][:10]
+        expected = list(le.inverse_transform(classifier.predict(straight.vectorizer.transform(sample))))
+        assert ModelService(Path(tmp) / "model").predict_categories(sample) == expected
+    print("\n✓ Streaming training resumes exactly from its checkpoint")
+
+def test_model_selection():
+    """Test parallel cross-validated model selection with cached vectorization."""
+    print_section("Testing Model Selection")
+    
+    import tempfile
+    from sklearn.svm import LinearSVC
+    from sklearn.linear_model import SGDClassifier
+    sys.path.insert(0, str(Path(__file__).parent / "model"))
+    from train_model import load_data, select_model, print_selection_report
+    
+    df = load_data(Path(__file__).parent / "data" / "resumes.csv", cache_dir=None)
+    grid = {
+        'tfidf__max_features': [300, 600],
+        'clf': [LinearSVC(random_state=42), SGDClassifier(random_state=42)],
+    }
+    with tempfile.TemporaryDirectory() as cache_dir:
+        results = select_model(df, folds=2, n_jobs=2, grid=grid, cache_dir=cache_dir)
+        # One vectorizer fit per (TF-IDF setting, fold), made by the timing pass
+        # and reused by both classifiers
+        fits = list(Path(cache_dir).rglob("output.pkl"))
+        print(f"  Configurations: {len(results)}, cached vectorizer fits: {len(fits)}")
+        assert len(fits) == 2 * 2
+    
+    assert len(results) == 4
+    assert [r['accuracy'] for r in results] == sorted((r['accuracy'] for r in results), reverse=True)
+    for r in results:
+        print(f"  {r['classifier']:<14} {r['max_features']:>4} features: {r['accuracy']:.3f} "
+              f"({r['docs_per_second']:.0f} docs/s)")
+        assert 0 <= r['accuracy'] <= 1 and r['fit_seconds'] > 0 and r['docs_per_second'] > 0
+    # Rows sharing a TF-IDF setting report the same vectorization time
+    for features in (300, 600):
+        assert len({r['vectorize_seconds'] for r in results if r['max_features'] == features}) == 1
+    # Grids without max_features (or with None, unlimited) still report
+    print_selection_report(results + [dict(results[0], max_features=None, ngram_range=None)])
+    print("\n✓ Candidates are cross-validated in parallel with shared vectorization")
+
+def test_corpus_cache():
+    """Test the cleaned corpus cache, incremental appends and invalidation."""
+    print_section("Testing Corpus Cache")
+    
+    import tempfile
+    sys.path.insert(0, str(Path(__file__).parent / "model"))
+    import train_model
+    
+    df = pd.read_csv(Path(__file__).parent / "data" / "resumes.csv")
+    cleaned = []
+    clean_corpus = train_model.clean_corpus
+    train_model.clean_corpus = lambda frame: cleaned.append(len(frame)) or clean_corpus(frame)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path, cache_dir = Path(tmp) / "resumes.csv", Path(tmp) / "cache"
+            df[:100].to_csv(csv_path, index=False)
+            
+            first = train_model.load_data(csv_path, cache_dir=cache_dir)
+            again = train_model.load_data(csv_path, cache_dir=cache_dir)
+            assert cleaned == [100] and again.equals(first)
+            
+            # Appended rows are the only ones cleaned again
+            df[100:].to_csv(csv_path, mode="a", header=False, index=False)
+            grown = train_model.load_data(csv_path, cache_dir=cache_dir)
+            print(f"  Rows cleaned per load: {cleaned}")
+            assert cleaned == [100, len(df) - 100]
+            assert grown.equals(train_model.load_data(csv_path, cache_dir=None))
+            assert len(list(cache_dir.glob("corpus-*"))) == 1
+            
+            # Rewritten files and new cleaner versions are cleaned from scratch
+            df[50:].to_csv(csv_path, index=False)
+            train_model.load_data(csv_path, cache_dir=cache_dir)
+            train_model.CLEANER_VERSION += 1
+            try:
+                train_model.load_data(csv_path, cache_dir=cache_dir)
+            finally:
+                train_model.CLEANER_VERSION -= 1
+            assert cleaned[-2:] == [len(df) - 50, len(df) - 50]
+    finally:
+        train_model.clean_corpus = clean_corpus
+    print("\n✓ Cleaned corpus is reused and only appended rows are re-cleaned")
+
 def run_all_tests():
     """Run all tests."""
     print("\n")
@@ -209,6 +1204,31 @@ def run_all_tests():
         resume_data = test_resume_parser()
         job_data = test_job_parser()
         match_result = test_matcher()
+        test_job_profile()
+        test_vectorized_scoring()
+        test_top_k()
+        test_skill_matcher()
+        test_taxonomy()
+        test_fused_extractor()
+        test_patterns()
+        test_parse_cache()
+        test_candidate_store()
+        test_skill_index()
+        test_parallel_ingest()
+        test_pdf_extraction()
+        test_pipeline()
+        test_csv_streaming()
+        test_zip_upload()
+        test_text_cache()
+        test_docx_extraction()
+        test_format_sniffing()
+        test_isolated_extraction()
+        test_records()
+        test_model_service()
+        test_model_artifacts()
+        test_streaming_training()
+        test_model_selection()
+        test_corpus_cache()
         
         # Summary
         print_section("TEST SUMMARY")